@@ -1,13 +1,17 @@
 """Command line interface for rail-plot"""
 
-from .plot_commands import (
-    plot_cli,
-    run_command,
-    inspect_command,
-    extract_datasets_command,
-    make_plot_groups_for_dataset_list,
-    make_plot_groups_for_project,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .plot_commands import (
+        extract_datasets_command,
+        inspect_command,
+        make_plot_groups_for_dataset_list,
+        make_plot_groups_for_project,
+        plot_cli,
+        run_command,
+    )
 
 __all__ = [
     "plot_cli",
@@ -17,3 +21,12 @@ __all__ = [
     "make_plot_groups_for_dataset_list",
     "make_plot_groups_for_project",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The commands are only imported on first access, so that importing
+    # this package (e.g., for plot_options) does not load the plotting code
+    if name in __all__:
+        mod = importlib.import_module(".plot_commands", __name__)
+        return getattr(mod, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
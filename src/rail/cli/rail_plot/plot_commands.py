@@ -2,10 +2,9 @@ from typing import Any
 
 import click
 from rail.cli.rail import options
-from rail.core import __version__
 
 from rail.cli.rail_project import project_options
-from rail.plotting import control
+from rail.projects import yaml_utils
 
 from . import plot_options
 
@@ -20,7 +19,9 @@ __all__ = [
 
 
 @click.group()
-@click.version_option(__version__)
+# The version is looked up from the installed package metadata only when
+# --version is given, rather than importing rail.core just to get it
+@click.version_option(package_name="pz-rail-base")
 def plot_cli() -> None:
     """RAIL plotting functions
 
@@ -33,6 +34,7 @@ def plot_cli() -> None:
     2. `Data` with specific datasets we can make those plots with
     3. `PlotGroup` with combinations of the two
     """
+    yaml_utils.warn_if_no_libyaml()
 
 
 @plot_cli.command(name="run")
@@ -43,6 +45,7 @@ def plot_cli() -> None:
 @plot_options.purge_plots()
 @plot_options.find_only()
 @plot_options.make_html()
+@plot_options.jobs()
 @options.outdir()
 def run_command(config_file: str, **kwargs: Any) -> int:
     """Make a bunch of plots
@@ -50,6 +53,8 @@ def run_command(config_file: str, **kwargs: Any) -> int:
     The configuration file should define both the plots to make
     and the datasets to use.
     """
+    from rail.plotting import control
+
     control.clear()
     control.run(config_file, **kwargs)
     return 0
@@ -63,6 +68,8 @@ def inspect_command(config_file: str) -> int:
     These will load the configuration file, and any files that that it includes
     and then print out the contents of the component library.
     """
+    from rail.plotting import control
+
     control.clear()
     control.load_yaml(config_file)
     control.print_contents()
@@ -91,6 +98,8 @@ def extract_datasets_command(
     results to the output_yaml file.
     """
 
+    from rail.plotting import control
+
     control.clear()
     control.extract_datasets(
         config_file,
@@ -119,6 +128,8 @@ def make_plot_groups_for_dataset_list(
     by plotter_list_name and write the results to the output_yaml
     file.
     """
+    from rail.plotting import control
+
     control.clear()
     control.make_plot_group_yaml_for_dataset_list(output_yaml, **kwargs)
     return 0
@@ -145,6 +156,8 @@ def make_plot_groups_for_project(
     by plotter_list_name and write the results to the output_yaml
     file.
     """
+    from rail.plotting import control
+
     control.clear()
     control.make_plot_group_yaml_for_project(
         output_yaml, plotter_yaml_path, config_file, **kwargs
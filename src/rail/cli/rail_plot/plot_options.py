@@ -1,3 +1,5 @@
+import click
+
 from rail.cli.rail.options import EnumChoice, PartialOption
 
 from rail.plotting.dataset_holder import DatasetSplitMode
@@ -16,6 +18,7 @@ __all__: list[str] = [
     "plotter_yaml_path",
     "include_groups",
     "exclude_groups",
+    "jobs",
     "split_mode",
 ]
 
@@ -34,6 +37,15 @@ include_groups = PartialOption(
 )
 
 
+jobs = PartialOption(
+    "-j",
+    "--jobs",
+    help="Number of plot groups to make at once, in separate processes",
+    type=click.IntRange(min=1),
+    default=1,
+)
+
+
 dataset_holder_class = PartialOption(
     "--dataset-holder-class",
     help="Class for the dataset holder",
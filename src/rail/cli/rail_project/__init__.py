@@ -1,14 +1,17 @@
-"""Command line interface for rail-plot"""
+"""Command line interface for rail-project"""
 
-from .project_commands import (
-    project_cli,
-    inspect_command,
-    build_command,
-    subsample_command,
-    reduce_command,
-    run_group,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from .project_commands import (
+        build_command,
+        inspect_command,
+        project_cli,
+        reduce_command,
+        subsample_command,
+    )
+    from .run_commands import run_group
 
 __all__ = [
     "project_cli",
@@ -18,3 +21,13 @@ __all__ = [
     "reduce_command",
     "run_group",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The commands are only imported on first access, so that importing
+    # this package (e.g., for project_options) does not load the project code
+    if name in __all__:
+        module_name = ".run_commands" if name == "run_group" else ".project_commands"
+        mod = importlib.import_module(module_name, __name__)
+        return getattr(mod, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
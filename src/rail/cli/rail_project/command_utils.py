@@ -0,0 +1,170 @@
+"""Functions shared by the rail-project commands"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable
+
+import click
+from rail.projects.execution import RunMode
+
+if TYPE_CHECKING:
+    from rail.projects import RailProject
+
+
+def load_project(config_file: str) -> RailProject:
+    """Load a RailProject from a yaml config file
+
+    Importing RailProject pulls in the full rail / ceci stack, so that is deferred
+    until a command actually needs a project, rather than paid for by --help.
+
+    Each call builds a new project, which re-fills the global library factories
+    with its includes, but the parsed yaml files are re-used if they have not
+    changed, see yaml_utils.load_yaml_file
+    """
+    from rail.projects import RailProject
+
+    return RailProject.load_config(config_file)
+
+
+def skip_dry_run(run_mode: RunMode, what: str, config_file: str) -> bool:
+    """Check for the opt-in fast dry run, which does not even load the project
+
+    Parameters
+    ----------
+    run_mode:
+        How the command is being run
+
+    what:
+        Description of what the command would have run
+
+    config_file:
+        Project yaml configuration file
+
+    Returns
+    -------
+    bool:
+        True if this is a dry run and RAIL_FAST_DRY is set, in which case the
+        command has nothing more to do
+    """
+    if run_mode != RunMode.dry_run or not os.environ.get("RAIL_FAST_DRY"):
+        return False
+    print(f"DRY: would run {what} with config {config_file}")
+    return True
+
+
+# The project used by worker processes, see run_project_method
+_WORKER_PROJECT: RailProject | None = None
+
+
+def _init_worker_project(config_file: str) -> None:
+    global _WORKER_PROJECT  # pylint: disable=global-statement
+    _WORKER_PROJECT = load_project(config_file)
+
+
+def _call_worker_project(method_name: str, kw: dict, kwargs: dict) -> Any:
+    assert _WORKER_PROJECT is not None
+    return getattr(_WORKER_PROJECT, method_name)(**kw, **kwargs)
+
+
+def run_project_method(  # pylint: disable=too-many-arguments
+    project: RailProject,
+    config_file: str,
+    method_name: str,
+    iter_kwargs: list[dict],
+    jobs: int = 1,
+    fail_fast: bool = False,
+    use_threads: bool = False,
+    status_func: Callable[[Any], int] | None = None,
+    **kwargs: Any,
+) -> int:
+    """Call a RailProject method once for each set of iteration kwargs
+
+    Parameters
+    ----------
+    project:
+        Project to call the method on when running serially
+
+    config_file:
+        Project config file, each worker process loads its own copy of the project
+
+    method_name:
+        Name of the RailProject method to call
+
+    iter_kwargs:
+        List of kwargs (e.g., flavor and selection) to call the method with
+
+    jobs:
+        Number of workers to use, 1 means run serially in this process
+
+    fail_fast:
+        Stop at the first call that fails, rather than running all of them
+
+    use_threads:
+        Use worker threads that share this project, rather than worker processes.
+        This suits methods that spend their time waiting on subprocesses,
+        such as running ceci pipelines
+
+    status_func:
+        Converts the value returned by the method to a status, 0 for success.
+        If None, the returned value is used as the status
+
+    **kwargs:
+        Passed to every call of the method
+
+    Returns
+    -------
+    int:
+        0 if all the calls succeeded, otherwise the statuses of the failed
+        calls or-ed together, the failed calls are reported on stderr
+    """
+    failures: list[tuple[dict, int]] = []
+    if jobs <= 1 or len(iter_kwargs) <= 1:
+        method = getattr(project, method_name)
+        for kw in iter_kwargs:
+            result = method(**kw, **kwargs)
+            status = result if status_func is None else status_func(result)
+            if status:
+                failures.append((kw, status))
+                if fail_fast:
+                    break
+        return _report_failures(method_name, failures)
+
+    executor: Executor
+    if use_threads:
+        executor = ThreadPoolExecutor(max_workers=min(jobs, len(iter_kwargs)))
+    else:
+        executor = ProcessPoolExecutor(
+            max_workers=min(jobs, len(iter_kwargs)),
+            initializer=_init_worker_project,
+            initargs=(config_file,),
+        )
+    with executor:
+        futures: list[Future] = []
+        for kw in iter_kwargs:
+            if use_threads:
+                futures.append(
+                    executor.submit(getattr(project, method_name), **kw, **kwargs)
+                )
+            else:
+                futures.append(
+                    executor.submit(_call_worker_project, method_name, kw, kwargs)
+                )
+        for kw, future_ in zip(iter_kwargs, futures):
+            result = future_.result()
+            status = result if status_func is None else status_func(result)
+            if status:
+                failures.append((kw, status))
+                if fail_fast:
+                    executor.shutdown(cancel_futures=True)
+                    break
+    return _report_failures(method_name, failures)
+
+
+def _report_failures(method_name: str, failures: list[tuple[dict, int]]) -> int:
+    ok = 0
+    for kw, status in failures:
+        click.secho(f"{method_name} {kw} failed with {status}", fg="red", err=True)
+        ok |= status
+    return ok
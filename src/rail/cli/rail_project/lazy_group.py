@@ -0,0 +1,54 @@
+"""click Group that only makes its sub-commands when they are needed"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable
+
+import click
+
+# Either a function that makes the command, or the (module, attribute)
+# where the command is defined
+LazyCommand = Callable[[], click.Command] | tuple[str, str]
+
+
+class LazyGroup(click.Group):
+    """click Group that makes its lazy sub-commands on first lookup
+
+    Building a click command means importing the module that defines it
+    and applying all of its option decorators, so for groups with many
+    sub-commands it is cheaper to only build the one that is actually invoked.
+
+    Parameters
+    ----------
+    lazy_commands:
+        Mapping from command name to either a function that makes that
+        command, or a (module name, attribute name) tuple giving where to
+        import it from
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: dict[str, LazyCommand] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, LazyCommand] = (
+            {} if lazy_commands is None else dict(lazy_commands)
+        )
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(self._make_lazy_command(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _make_lazy_command(self, cmd_name: str) -> click.Command:
+        lazy_command = self.lazy_commands[cmd_name]
+        if isinstance(lazy_command, tuple):
+            module_name, attr_name = lazy_command
+            return getattr(importlib.import_module(module_name), attr_name)
+        return lazy_command()
@@ -1,13 +1,16 @@
+from __future__ import annotations
+
+import io
+import os
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 import click
-import yaml
 from rail.cli.rail import options
-from rail.core import __version__
-
-from rail.projects import RailProject, execution, library, path_funcs
 
-from . import project_options
+from . import command_utils, project_options
+from .lazy_group import LazyGroup
 
 __all__ = [
     "project_cli",
@@ -15,12 +18,30 @@ __all__ = [
     "build_command",
     "subsample_command",
     "reduce_command",
-    "run_group",
 ]
 
 
-@click.group()
-@click.version_option(__version__)
+def _clear_caches(_ctx: click.Context, _param: click.Parameter, no_cache: bool) -> None:
+    if no_cache:
+        from rail.projects import yaml_utils
+
+        yaml_utils.clear_cache()
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_commands={"run": ("rail.cli.rail_project.run_commands", "run_group")},
+)
+# The version is looked up from the installed package metadata only when
+# --version is given, rather than importing rail.core just to get it
+@click.version_option(package_name="pz-rail-base")
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    expose_value=False,
+    callback=_clear_caches,
+    help="Re-read the project configuration files, rather than re-using parsed ones",
+)
 def project_cli() -> None:
     """RAIL project management scripts
 
@@ -31,28 +52,80 @@ def project_cli() -> None:
     configuration files that define a 'library' of
     possible analysis components
     """
+    from rail.projects import yaml_utils
+
+    yaml_utils.warn_if_no_libyaml()
+
+
+def _convert_to_hdf5(
+    run_mode: project_options.RunMode,
+    output_path: str,
+    output_format: str = "both",
+) -> int:
+    """Convert a parquet file written by split / subsample to hdf5
+
+    In bash mode this is done in-process with tables_io, rather than paying
+    for starting a python interpreter to run `tables-io convert`.
+
+    If output_format is "parquet" there is nothing to do, if it is "hdf5"
+    the parquet file is removed after the conversion.
+    """
+    if output_format == "parquet":
+        return 0
+    hdf5_output = output_path.replace(".parquet", ".hdf5")
+    if run_mode == project_options.RunMode.bash:  # pragma: no cover
+        import tables_io
+
+        print(f"tables_io convert: {output_path} -> {hdf5_output}")
+        try:
+            tables_io.write(tables_io.read(output_path), hdf5_output)
+            if output_format == "hdf5":
+                os.remove(output_path)
+        except Exception as msg:
+            print(msg)
+            return 1
+        return 0
+
+    from rail.projects import execution
+
+    ok = execution.handle_command(
+        run_mode,
+        [
+            "tables-io",
+            "convert",
+            "--input",
+            f"{output_path}",
+            "--output",
+            f"{hdf5_output}",
+        ],
+    )
+    if output_format == "hdf5":
+        ok |= execution.handle_command(run_mode, ["rm", f"{output_path}"])
+    return ok
 
 
 @project_cli.command(name="inspect")
 @project_options.config_file()
 def inspect_command(config_file: str) -> int:
     """Inspect a rail pipeline project config"""
-    print("RAIL Project Library")
-    print(">>>>>>>>")
-    project = RailProject.load_config(config_file)
-    library.print_contents()
-    print("<<<<<<<<")
-    print(f"RAIL Project: {project}")
-    print(">>>>>>>>")
-    for key, val in project.config.items():
-        if key == "Flavors":
-            print(f"{key}:")
-            for flavor_ in val:
-                flavor_name = flavor_["Flavor"]["name"]
-                print(f"- {flavor_name}")
-            continue
-        print(yaml.dump({key: val}, indent=2))
-    print("<<<<<<<<")
+    from rail.projects import library, yaml_utils
+
+    project = command_utils.load_project(config_file)
+
+    # Collect everything and write it in one go, rather than line by line
+    buf = io.StringIO()
+    buf.write("RAIL Project Library\n>>>>>>>>\n")
+    library.print_contents(file=buf)
+    buf.write(f"<<<<<<<<\nRAIL Project: {project}\n>>>>>>>>\n")
+    # Dump everything but the flavors in one pass of the yaml emitter, keeping
+    # the order of the project file, then just list the flavor names
+    config = {key: val for key, val in project.config.items() if key != "Flavors"}
+    yaml_utils.safe_dump(config, buf, indent=2, sort_keys=False)
+    buf.write("Flavors:\n")
+    for flavor_ in project.config["Flavors"]:
+        buf.write(f"- {flavor_['Flavor']['name']}\n")
+    buf.write("<<<<<<<<\n")
+    sys.stdout.write(buf.getvalue())
     return 0
 
 
@@ -60,20 +133,29 @@ def inspect_command(config_file: str) -> int:
 @project_options.config_file()
 @project_options.flavor()
 @project_options.force()
-def build_command(config_file: str, **kwargs: Any) -> int:
+@project_options.jobs()
+@project_options.fail_fast()
+def build_command(
+    config_file: str, jobs: int, fail_fast: bool, **kwargs: Any
+) -> int:
     """Build the ceci pipeline configuration files
 
     This will build all of the pipelines associated to
     a particular flavor or flavors, and write them to the
     the project pipelines area.
     """
-    project = RailProject.load_config(config_file)
+    project = command_utils.load_project(config_file)
     flavors = project.get_flavor_args(kwargs.pop("flavor"))
     iter_kwargs = project.generate_kwargs_iterable(flavor=flavors)
-    ok = 0
-    for kw in iter_kwargs:
-        ok |= project.build_pipelines(**kw, **kwargs)
-    return ok
+    return command_utils.run_project_method(
+        project,
+        config_file,
+        "build_pipelines",
+        iter_kwargs,
+        jobs=jobs,
+        fail_fast=fail_fast,
+        **kwargs,
+    )
 
 
 @project_cli.command(name="split")
@@ -85,8 +167,12 @@ def build_command(config_file: str, **kwargs: Any) -> int:
 @project_options.splitter_class_name()
 @project_options.selection()
 @project_options.flavor()
+@project_options.output_format()
 def split_command(
-    config_file: str, run_mode: project_options.RunMode, **kwargs: Any
+    config_file: str,
+    run_mode: project_options.RunMode,
+    output_format: str,
+    **kwargs: Any,
 ) -> int:
     """Make a training and test data set by randomly selecting objects from
     an input file
@@ -101,10 +187,10 @@ def split_command(
     if run_mode == project_options.RunMode.slurm:
         raise NotImplementedError("split_command not set up to run under slurm")
 
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
+    project = command_utils.load_project(config_file)
+    iter_kwargs = project.get_flavor_selection_kwargs(
+        kwargs.pop("flavor"), kwargs.pop("selection")
+    )
 
     dry_run = run_mode == project_options.RunMode.dry_run
 
@@ -116,18 +202,7 @@ def split_command(
             **kwargs,
         )
         for output_path_ in output_paths:
-            hdf5_output = output_path_.replace(".parquet", ".hdf5")
-            ok |= execution.handle_command(
-                run_mode,
-                [
-                    "tables-io",
-                    "convert",
-                    "--input",
-                    f"{output_path_}",
-                    "--output",
-                    f"{hdf5_output}",
-                ],
-            )
+            ok |= _convert_to_hdf5(run_mode, output_path_, output_format)
     return ok
 
 
@@ -141,8 +216,12 @@ def split_command(
 @project_options.selection()
 @project_options.flavor()
 @project_options.basename()
+@project_options.output_format()
 def subsample_command(
-    config_file: str, run_mode: project_options.RunMode, **kwargs: Any
+    config_file: str,
+    run_mode: project_options.RunMode,
+    output_format: str,
+    **kwargs: Any,
 ) -> int:
     """Make a training or test data set by randomly selecting objects from
     a catalog of input files
@@ -157,33 +236,42 @@ def subsample_command(
 
     if run_mode == project_options.RunMode.slurm:
         raise NotImplementedError("subsample_command not set up to run under slurm")
+    if command_utils.skip_dry_run(run_mode, "subsample", config_file):
+        return 0
 
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
+    project = command_utils.load_project(config_file)
+    iter_kwargs = project.get_flavor_selection_kwargs(
+        kwargs.pop("flavor"), kwargs.pop("selection")
+    )
 
     dry_run = run_mode == project_options.RunMode.dry_run
 
     ok = 0
-    for kw in iter_kwargs:
-        output_path = project.subsample_data(
-            dry_run=dry_run,
-            **kw,
-            **kwargs,
-        )
-        hdf5_output = output_path.replace(".parquet", ".hdf5")
-        ok |= execution.handle_command(
-            run_mode,
-            [
-                "tables-io",
-                "convert",
-                "--input",
-                f"{output_path}",
-                "--output",
-                f"{hdf5_output}",
-            ],
-        )
+    if dry_run:
+        for kw in iter_kwargs:
+            output_path = project.subsample_data(
+                dry_run=dry_run,
+                **kw,
+                **kwargs,
+            )
+            ok |= _convert_to_hdf5(run_mode, output_path, output_format)
+        return ok
+
+    # Convert each subsample to hdf5 in the background while the
+    # next subsample is being made
+    with ThreadPoolExecutor(max_workers=1) as executor:  # pragma: no cover
+        futures: list[Future[int]] = []
+        for kw in iter_kwargs:
+            output_path = project.subsample_data(
+                dry_run=dry_run,
+                **kw,
+                **kwargs,
+            )
+            futures.append(
+                executor.submit(_convert_to_hdf5, run_mode, output_path, output_format)
+            )
+        for future_ in futures:
+            ok |= future_.result()
     return ok
 
 
@@ -195,8 +283,14 @@ def subsample_command(
 @project_options.reducer_class_name()
 @project_options.input_selection()
 @project_options.selection()
+@project_options.jobs()
+@project_options.fail_fast()
 def reduce_command(
-    config_file: str, run_mode: project_options.RunMode, **kwargs: Any
+    config_file: str,
+    run_mode: project_options.RunMode,
+    jobs: int,
+    fail_fast: bool,
+    **kwargs: Any,
 ) -> int:
     """Reduce the roman rubin simulations for analysis
 
@@ -207,7 +301,10 @@ def reduce_command(
     and selection parameters,
     reduce the input catalog to the output catalog
     """
-    project = RailProject.load_config(config_file)
+    if command_utils.skip_dry_run(run_mode, "reduce", config_file):
+        return 0
+
+    project = command_utils.load_project(config_file)
     selections = project.get_selection_args(kwargs.pop("selection"))
     input_selections = kwargs.pop("input_selection")
     iter_kwargs = project.generate_kwargs_iterable(
@@ -216,391 +313,17 @@ def reduce_command(
     )
     dry_run = run_mode == project_options.RunMode.dry_run
 
-    ok = 0
-    for kw in iter_kwargs:
-        files = project.reduce_data(dry_run=dry_run, **kw, **kwargs)
-        ok |= 0 if files else 1
-    return ok
-
-
-@project_cli.group(name="run")
-def run_group() -> None:
-    """Run a pipeline"""
-
-
-@run_group.command(name="phot-errors")
-@project_options.config_file()
-@project_options.selection()
-@project_options.flavor()
-@project_options.run_mode()
-@project_options.site()
-def photmetric_errors_pipeline(config_file: str, **kwargs: Any) -> int:
-    """Run the photometric errors analysis pipeline"""
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
-    ok = 0
-    pipeline_name = "photometric_errors"
-
-    for kw in iter_kwargs:
-        ok |= project.run_pipeline_catalog(
-            pipeline_name,
-            **kw,
-            **kwargs,
-        )
-    return ok
-
-
-@run_group.command(name="prepare")
-@project_options.config_file()
-@project_options.selection()
-@project_options.flavor()
-@project_options.run_mode()
-@project_options.site()
-def prepare_pipeline(config_file: str, **kwargs: Any) -> int:
-    """Run the truth-to-observed data pipeline"""
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
-    ok = 0
-    pipeline_name = "prepare"
-
-    for kw in iter_kwargs:
-        ok |= project.run_pipeline_catalog(
-            pipeline_name,
-            **kw,
-            **kwargs,
-        )
-    return ok
-
-
-@run_group.command(name="truth-to-observed")
-@project_options.config_file()
-@project_options.selection()
-@project_options.flavor()
-@project_options.run_mode()
-@project_options.site()
-def truth_to_observed_pipeline(config_file: str, **kwargs: Any) -> int:
-    """Run the truth-to-observed data pipeline"""
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
-    ok = 0
-    pipeline_name = "truth_to_observed"
-
-    for kw in iter_kwargs:
-        ok |= project.run_pipeline_catalog(
-            pipeline_name,
-            **kw,
-            **kwargs,
-        )
-    return ok
-
-
-@run_group.command(name="blending")
-@project_options.config_file()
-@project_options.selection()
-@project_options.flavor()
-@project_options.run_mode()
-@project_options.site()
-def blending_pipeline(config_file: str, **kwargs: Any) -> int:
-    """Run the blending analysis pipeline"""
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
-    ok = 0
-    pipeline_name = "blending"
-
-    for kw in iter_kwargs:
-        ok |= project.run_pipeline_catalog(
-            pipeline_name,
-            **kw,
-            **kwargs,
-        )
-    return ok
-
-
-@run_group.command(name="spec-selection")
-@project_options.config_file()
-@project_options.selection()
-@project_options.flavor()
-@project_options.run_mode()
-@project_options.site()
-def spectroscopic_selection_pipeline(config_file: str, **kwargs: Any) -> int:
-    """Run the spectroscopic selection data pipeline"""
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
-    ok = 0
-    pipeline_name = "spec_selection"
-
-    for kw in iter_kwargs:
-        ok |= project.run_pipeline_catalog(
-            pipeline_name,
-            spec_selections=list(project.get_spec_selections().keys()),
-            **kw,
-            **kwargs,
-        )
-    return ok
-
-
-@run_group.command(name="inform")
-@project_options.config_file()
-@project_options.flavor()
-@project_options.selection()
-@project_options.run_mode()
-@project_options.site()
-def inform_single(config_file: str, **kwargs: Any) -> int:
-    """Run the inform pipeline"""
-    pipeline_name = "inform"
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
-    ok = 0
-    for kw in iter_kwargs:
-        ok |= project.run_pipeline_single(
-            pipeline_name,
-            **kw,
-            **kwargs,
-        )
-    return ok
-
-
-@run_group.command(name="estimate")
-@project_options.config_file()
-@project_options.flavor()
-@project_options.selection()
-@project_options.run_mode()
-@project_options.input_tag()
-@project_options.site()
-def estimate_single(config_file: str, **kwargs: Any) -> int:
-    """Run the estimation pipeline"""
-    pipeline_name = "estimate"
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
-    ok = 0
-    for kw in iter_kwargs:
-        ok |= project.run_pipeline_single(
-            pipeline_name,
-            **kw,
-            **kwargs,
-        )
-    return ok
-
-
-@run_group.command(name="evaluate")
-@project_options.config_file()
-@project_options.flavor()
-@project_options.selection()
-@project_options.run_mode()
-@project_options.site()
-def evaluate_single(config_file: str, **kwargs: Any) -> int:
-    """Run the evaluation pipeline"""
-    pipeline_name = "evaluate"
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
-    ok = 0
-    for kw in iter_kwargs:
-        ok |= project.run_pipeline_single(
-            pipeline_name,
-            **kw,
-            **kwargs,
-        )
-    return ok
-
-
-@run_group.command(name="pz")
-@project_options.config_file()
-@project_options.flavor()
-@project_options.selection()
-@project_options.run_mode()
-@project_options.site()
-def pz_single(config_file: str, **kwargs: Any) -> int:
-    """Run the pz pipeline"""
-    pipeline_name = "pz"
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
-    ok = 0
-    for kw in iter_kwargs:
-        ok |= project.run_pipeline_single(
-            pipeline_name,
-            **kw,
-            **kwargs,
-        )
-    return ok
-
-
-@run_group.command(name="tomography")
-@project_options.config_file()
-@project_options.flavor()
-@project_options.selection()
-@project_options.run_mode()
-@project_options.site()
-def tomography_single(config_file: str, **kwargs: Any) -> int:
-    """Run the tomography pipeline"""
-    pipeline_name = "tomography"
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
-    ok = 0
-    for kw in iter_kwargs:
-        ok |= project.run_pipeline_single(
-            pipeline_name,
-            **kw,
-            **kwargs,
-        )
-    return ok
-
-
-@run_group.command(name="inform-sompz")
-@project_options.config_file()
-@project_options.flavor()
-@project_options.selection()
-@project_options.run_mode()
-@project_options.site()
-def inform_sompz_single(config_file: str, **kwargs: Any) -> int:  # pragma: no cover
-    """Run the sompz inform pipeline"""
-    pipeline_name = "inform_sompz"
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
-    ok = 0
-    for kw in iter_kwargs:
-        ok |= project.run_pipeline_single(
-            pipeline_name,
-            **kw,
-            **kwargs,
-        )
-    return ok
-
-
-@run_group.command(name="estimate-sompz")
-@project_options.config_file()
-@project_options.flavor()
-@project_options.selection()
-@project_options.run_mode()
-@project_options.site()
-def estimate_sompz_single(config_file: str, **kwargs: Any) -> int:  # pragma: no cover
-    """Run the sompz estimate pipeline"""
-    pipeline_name = "estimate_sompz"
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
-    ok = 0
-    for kw in iter_kwargs:
-        ok |= project.run_pipeline_single(
-            pipeline_name,
-            **kw,
-            **kwargs,
-        )
-    return ok
-
-
-@run_group.command(name="inform-recalib")
-@project_options.config_file()
-@project_options.flavor()
-@project_options.selection()
-@project_options.run_mode()
-@project_options.site()
-def inform_recalib_single(config_file: str, **kwargs: Any) -> int:  # pragma: no cover
-    """Run the recalibration inform pipeline"""
-    pipeline_name = "inform_recalib"
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
-    ok = 0
-    for kw in iter_kwargs:
-        ok |= project.run_pipeline_single(
-            pipeline_name,
-            **kw,
-            **kwargs,
-        )
-    return ok
-
-
-@run_group.command(name="estimate-recalib")
-@project_options.config_file()
-@project_options.flavor()
-@project_options.selection()
-@project_options.run_mode()
-@project_options.site()
-def estimate_recalib_single(config_file: str, **kwargs: Any) -> int:  # pragma: no cover
-    """Run the recalibration estimate pipeline"""
-    pipeline_name = "estimate_recalib"
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
-    ok = 0
-    for kw in iter_kwargs:
-        ok |= project.run_pipeline_single(
-            pipeline_name,
-            **kw,
-            **kwargs,
-        )
-    return ok
-
-
-@run_group.command(name="inform-somlike")
-@project_options.config_file()
-@project_options.flavor()
-@project_options.selection()
-@project_options.run_mode()
-@project_options.site()
-def inform_somlikesingle(config_file: str, **kwargs: Any) -> int:  # pragma: no cover
-    """Run the somlike inform pipeline"""
-    pipeline_name = "inform_somlike"
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
-    ok = 0
-    for kw in iter_kwargs:
-        ok |= project.run_pipeline_single(
-            pipeline_name,
-            **kw,
-            **kwargs,
-        )
-    return ok
-
-
-@run_group.command(name="somlike-recalib")
-@project_options.config_file()
-@project_options.flavor()
-@project_options.selection()
-@project_options.run_mode()
-@project_options.site()
-def somlike_recalib_single(config_file: str, **kwargs: Any) -> int:  # pragma: no cover
-    """Run the somlike recalibration pipeline"""
-    pipeline_name = "somlike_recalib"
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
-    ok = 0
-    for kw in iter_kwargs:
-        ok |= project.run_pipeline_single(
-            pipeline_name,
-            **kw,
-            **kwargs,
-        )
-    return ok
+    return command_utils.run_project_method(
+        project,
+        config_file,
+        "reduce_data",
+        iter_kwargs,
+        jobs=jobs,
+        fail_fast=fail_fast,
+        status_func=lambda files: 0 if files else 1,
+        dry_run=dry_run,
+        **kwargs,
+    )
 
 
 @project_cli.command(name="wrap-pz-models")
@@ -610,11 +333,13 @@ def somlike_recalib_single(config_file: str, **kwargs: Any) -> int:  # pragma: n
 @options.outdir()
 def wrap_pz_models(config_file: str, **kwargs: Any) -> int:
     """Wrap the pz models for the Rubin DM software"""
-    project = RailProject.load_config(config_file)
-    flavors = project.get_flavor_args(kwargs.pop("flavor"))
-    selections = project.get_selection_args(kwargs.pop("selection"))
+    from rail.projects import path_funcs
+
+    project = command_utils.load_project(config_file)
+    iter_kwargs = project.get_flavor_selection_kwargs(
+        kwargs.pop("flavor"), kwargs.pop("selection")
+    )
     outdir = kwargs.get("outdir", ".")
-    iter_kwargs = project.generate_kwargs_iterable(flavor=flavors, selection=selections)
     ok = 0
     for kw in iter_kwargs:
         paths = path_funcs.get_ceci_pz_model_paths(project, **kw)
@@ -7,8 +7,11 @@ __all__: list[str] = [
     "RunMode",
     "args",
     "basename",
+    "config_file",
     "config_path",
     "catalog_template",
+    "fail_fast",
+    "file_jobs",
     "file_template",
     "force",
     "flavor",
@@ -16,24 +19,26 @@ __all__: list[str] = [
     "input_file",
     "input_selection",
     "input_tag",
+    "jobs",
     "label",
     "maglim",
     "model_dir",
     "model_name",
     "model_path",
     "output_dir",
+    "output_format",
     "pdf_dir",
     "pdf_path",
     "reducer_class_name",
     "run_mode",
     "selection",
     "site",
+    "size",
     "splitter_class_name",
     "subsampler_class_name",
     "subsample_name",
     "test_file_template",
     "train_file_template",
-    "output_dir",
     "output_file",
     "output_catalog_template",
     "truth_path",
@@ -82,6 +87,22 @@ file_template = PartialOption(
 )
 
 
+fail_fast = PartialOption(
+    "--fail-fast/--continue-on-error",
+    help="Stop at the first flavor / selection that fails, or run them all",
+    default=False,
+)
+
+
+file_jobs = PartialOption(
+    "--file-jobs",
+    "max_workers",
+    help="Number of catalog files to run the pipeline on at once, in bash mode",
+    type=click.IntRange(min=1),
+    default=1,
+)
+
+
 force = PartialOption(
     "--force",
     help="Overwrite existing ceci configuration files",
@@ -96,6 +117,15 @@ flavor = PartialOption(
 )
 
 
+jobs = PartialOption(
+    "-j",
+    "--jobs",
+    help="Number of flavors / selections to process at once",
+    type=click.IntRange(min=1),
+    default=1,
+)
+
+
 label = PartialOption(
     "--label",
     help="File label (e.g., 'test' or 'train')",
@@ -266,6 +296,14 @@ output_dir = PartialOption(
 )
 
 
+output_format = PartialOption(
+    "--output-format",
+    type=click.Choice(["parquet", "hdf5", "both"]),
+    default="both",
+    help="File format(s) to write the output data in",
+)
+
+
 output_file = PartialOption(
     "--output-file",
     type=click.Path(),
@@ -0,0 +1,213 @@
+"""The rail-project run commands, which run pipelines"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Callable
+
+import click
+from rail.cli.rail.options import PartialOption
+
+from . import command_utils, project_options
+from .lazy_group import LazyCommand, LazyGroup
+
+__all__ = [
+    "run_group",
+]
+
+
+# Pipelines that are run on each file in a catalog,
+# command name: (pipeline name, help text)
+CATALOG_PIPELINE_COMMANDS: dict[str, tuple[str, str]] = {
+    "phot-errors": (
+        "photometric_errors",
+        "Run the photometric errors analysis pipeline",
+    ),
+    "prepare": ("prepare", "Run the data preparation pipeline"),
+    "truth-to-observed": (
+        "truth_to_observed",
+        "Run the truth-to-observed data pipeline",
+    ),
+    "blending": ("blending", "Run the blending analysis pipeline"),
+    "spec-selection": (
+        "spec_selection",
+        "Run the spectroscopic selection data pipeline",
+    ),
+}
+
+
+# Pipelines that are run on a single input file,
+# command name: (pipeline name, help text, extra options)
+SINGLE_PIPELINE_COMMANDS: dict[str, tuple[str, str, tuple[PartialOption, ...]]] = {
+    "inform": ("inform", "Run the inform pipeline", ()),
+    "estimate": (
+        "estimate",
+        "Run the estimation pipeline",
+        (project_options.input_tag,),
+    ),
+    "evaluate": ("evaluate", "Run the evaluation pipeline", ()),
+    "pz": ("pz", "Run the pz pipeline", ()),
+    "tomography": ("tomography", "Run the tomography pipeline", ()),
+    "inform-sompz": ("inform_sompz", "Run the sompz inform pipeline", ()),
+    "estimate-sompz": ("estimate_sompz", "Run the sompz estimate pipeline", ()),
+    "inform-recalib": (
+        "inform_recalib",
+        "Run the recalibration inform pipeline",
+        (),
+    ),
+    "estimate-recalib": (
+        "estimate_recalib",
+        "Run the recalibration estimate pipeline",
+        (),
+    ),
+    "inform-somlike": ("inform_somlike", "Run the somlike inform pipeline", ()),
+    "somlike-recalib": (
+        "somlike_recalib",
+        "Run the somlike recalibration pipeline",
+        (),
+    ),
+}
+
+
+def _run_pipeline(
+    config_file: str,
+    run_method: str,
+    pipeline_name: str,
+    jobs: int,
+    fail_fast: bool,
+    **kwargs: Any,
+) -> int:
+    """Run a pipeline for all the requested flavors and selections
+
+    Parameters
+    ----------
+    config_file:
+        Project yaml configuration file
+
+    run_method:
+        Either "run_pipeline_catalog" or "run_pipeline_single"
+
+    pipeline_name:
+        Name of the pipeline to run
+
+    jobs:
+        Number of flavors / selections to run at once
+
+    fail_fast:
+        Stop at the first flavor / selection that fails
+
+    **kwargs:
+        Command line options, including the flavors and selections to run
+
+    Returns
+    -------
+    int:
+        0 for success, error code otherwise
+    """
+    if command_utils.skip_dry_run(kwargs["run_mode"], pipeline_name, config_file):
+        return 0
+
+    project = command_utils.load_project(config_file)
+    iter_kwargs = project.get_flavor_selection_kwargs(
+        kwargs.pop("flavor"), kwargs.pop("selection")
+    )
+    if kwargs["run_mode"] == project_options.RunMode.slurm:
+        # submitting the batch jobs is quick, no need for extra workers
+        jobs = 1
+
+    # The pipelines run as ceci subprocesses, so threads are enough to overlap them
+    return command_utils.run_project_method(
+        project,
+        config_file,
+        run_method,
+        iter_kwargs,
+        jobs=jobs,
+        fail_fast=fail_fast,
+        use_threads=True,
+        pipeline_name=pipeline_name,
+        **kwargs,
+    )
+
+
+def _make_pipeline_command(
+    command_name: str,
+    run_method: str,
+    pipeline_name: str,
+    help_text: str,
+    extra_options: tuple[PartialOption, ...] = (),
+) -> click.Command:
+    """Make the click command to run a pipeline
+
+    Parameters
+    ----------
+    command_name:
+        Name of the command, e.g., 'phot-errors'
+
+    run_method:
+        Either "run_pipeline_catalog" or "run_pipeline_single"
+
+    pipeline_name:
+        Name of the pipeline to run, e.g., 'photometric_errors'
+
+    help_text:
+        Help for the command
+
+    extra_options:
+        Options beyond those used by all the pipeline commands
+
+    Returns
+    -------
+    click.Command:
+        The newly made command
+    """
+
+    def pipeline_command(config_file: str, **kwargs: Any) -> int:
+        return _run_pipeline(config_file, run_method, pipeline_name, **kwargs)
+
+    the_options = (
+        project_options.config_file,
+        project_options.flavor,
+        project_options.selection,
+        project_options.run_mode,
+        *extra_options,
+        project_options.site,
+        project_options.jobs,
+        project_options.fail_fast,
+    )
+    decorated: Callable[..., int] = pipeline_command
+    for option_ in reversed(the_options):
+        decorated = option_()(decorated)
+    return click.command(name=command_name, help=help_text)(decorated)
+
+
+# The pipeline commands are only built when they are looked up, see LazyGroup
+_RUN_COMMAND_MAKERS: dict[str, LazyCommand] = {}
+
+for command_name_, (pipeline_name_, help_text_) in CATALOG_PIPELINE_COMMANDS.items():
+    _RUN_COMMAND_MAKERS[command_name_] = functools.partial(
+        _make_pipeline_command,
+        command_name_,
+        "run_pipeline_catalog",
+        pipeline_name_,
+        help_text_,
+        (project_options.file_jobs,),
+    )
+
+for command_name_, (
+    pipeline_name_,
+    help_text_,
+    extra_options_,
+) in SINGLE_PIPELINE_COMMANDS.items():
+    _RUN_COMMAND_MAKERS[command_name_] = functools.partial(
+        _make_pipeline_command,
+        command_name_,
+        "run_pipeline_single",
+        pipeline_name_,
+        help_text_,
+        extra_options_,
+    )
+
+
+@click.group(name="run", cls=LazyGroup, lazy_commands=_RUN_COMMAND_MAKERS)
+def run_group() -> None:
+    """Run a pipeline"""
@@ -3,6 +3,31 @@ The :py:mod:`rail.plotting` sub-package collects a set of tools to make
 plots from the data generated by using the :py:mod:`rail.projects` tools.
 """
 
-from . import control
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import control
+
 
 __all__ = ["control"]
+
+# Where to find each of the names in __all__, these are only imported on first
+# access, so that importing a single plotting module does not pay for loading
+# all the factories, and so rail.core
+_LAZY_IMPORTS: dict[str, tuple[str, str | None]] = {
+    "control": (".control", None),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr_name = _LAZY_IMPORTS[name]
+    except KeyError as missing_key:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from missing_key
+    mod = importlib.import_module(module_name, __name__)
+    value = mod if attr_name is None else getattr(mod, attr_name)
+    globals()[name] = value
+    return value
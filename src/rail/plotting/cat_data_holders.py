@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 from ceci.config import StageParameter
 
 from rail.projects import RailProject, path_funcs
@@ -29,6 +30,9 @@ class RailCatTruthAndMagntiduesDataHolder(RailDatasetHolder):
 
     magntidues: np.ndarray
         Magnitudes in the various filters
+
+    The arrays are cast to `dtype` (float32 by default), which is plenty
+    for plotting and halves the memory traffic of the histogramming
     """
 
     config_options: dict[str, StageParameter] = dict(
@@ -45,6 +49,9 @@ class RailCatTruthAndMagntiduesDataHolder(RailDatasetHolder):
         tag=StageParameter(
             str, None, fmt="%s", required=True, msg="RailProject file tag"
         ),
+        dtype=StageParameter(
+            str, "float32", fmt="%s", msg="dtype for the truth and magnitudes arrays"
+        ),
     )
 
     extractor_inputs: dict = {
@@ -71,7 +78,13 @@ class RailCatTruthAndMagntiduesDataHolder(RailDatasetHolder):
         return ret_str
 
     def _get_data(self, **kwargs: Any) -> dict[str, Any] | None:
-        return get_ztrue_and_magntidues(**kwargs)
+        the_data = get_ztrue_and_magntidues(**kwargs)
+        if the_data is None:  # pragma: no cover
+            return None
+        dtype = np.dtype(self.config.dtype)
+        for key_ in ["truth", "magnitudes"]:
+            the_data[key_] = np.asarray(the_data[key_]).astype(dtype, copy=False)
+        return the_data
 
     def get_extractor_inputs(self) -> dict[str, Any]:
         if self._project is None:
@@ -84,7 +97,7 @@ class RailCatTruthAndMagntiduesDataHolder(RailDatasetHolder):
             flavor=self.config.flavor,
             tag=self.config.tag,
         )
-        self._validate_extractor_inputs(**the_extractor_inputs)
+        self._validate_extractor_inputs(the_extractor_inputs)
         return the_extractor_inputs
 
     @classmethod
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import os
 from typing import Any
 
 import numpy as np
@@ -30,8 +29,10 @@ class RailCatTruthAndMagnitudesDataset(RailCatTruthDataset, RailCatMagnitudesDat
     and true (or spec) redshifts
     """
 
-    data_types = RailCatMagnitudesDataset.data_types.copy()
-    data_types.update(**RailCatTruthDataset.data_types)
+    data_types = {
+        **RailCatMagnitudesDataset.data_types,
+        **RailCatTruthDataset.data_types,
+    }
 
 
 class CatPlotterTruth(RailPlotter):
@@ -61,26 +62,14 @@ class CatPlotterTruth(RailPlotter):
         )
 
     def _make_plots(self, prefix: str, **kwargs: Any) -> dict[str, RailPlotHolder]:
-        find_only = kwargs.get("find_only", False)
-        figtype = kwargs.get("figtype", "png")
         dataset_holder = kwargs.get("dataset_holder")
         out_dict: dict[str, RailPlotHolder] = {}
         truth: np.ndarray = kwargs["truth"]
-        if find_only:
-            plot_name = self._make_full_plot_name(prefix, "")
-            assert dataset_holder
-            plot = RailPlotHolder(
-                name=plot_name,
-                path=os.path.join(dataset_holder.config.name, f"{plot_name}.{figtype}"),
-                plotter=self,
-                dataset_holder=dataset_holder,
-            )
-        else:
-            plot = self._make_hist_plot(
-                prefix=prefix,
-                truth=truth,
-                dataset_holder=dataset_holder,
-            )
+        plot = self._make_hist_plot(
+            prefix=prefix,
+            truth=truth,
+            dataset_holder=dataset_holder,
+        )
         out_dict[plot.name] = plot
         return out_dict
 
@@ -118,28 +107,16 @@ class CatPlotterMagntidues(RailPlotter):
         )
 
     def _make_plots(self, prefix: str, **kwargs: Any) -> dict[str, RailPlotHolder]:
-        find_only = kwargs.get("find_only", False)
-        figtype = kwargs.get("figtype", "png")
         dataset_holder = kwargs.get("dataset_holder")
         out_dict: dict[str, RailPlotHolder] = {}
         magnitudes: np.ndarray = kwargs["magnitudes"]
         bands: list[str] = kwargs["bands"]
-        if find_only:
-            plot_name = self._make_full_plot_name(prefix, "")
-            assert dataset_holder
-            plot = RailPlotHolder(
-                name=plot_name,
-                path=os.path.join(dataset_holder.config.name, f"{plot_name}.{figtype}"),
-                plotter=self,
-                dataset_holder=dataset_holder,
-            )
-        else:
-            plot = self._make_hist_plots(
-                prefix=prefix,
-                magnitudes=magnitudes,
-                bands=bands,
-                dataset_holder=dataset_holder,
-            )
+        plot = self._make_hist_plots(
+            prefix=prefix,
+            magnitudes=magnitudes,
+            bands=bands,
+            dataset_holder=dataset_holder,
+        )
         out_dict[plot.name] = plot
         return out_dict
 
@@ -185,30 +162,18 @@ class CatPlotterMagntiduesVsTruth(RailPlotter):
         )
 
     def _make_plots(self, prefix: str, **kwargs: Any) -> dict[str, RailPlotHolder]:
-        find_only = kwargs.get("find_only", False)
-        figtype = kwargs.get("figtype", "png")
         dataset_holder = kwargs.get("dataset_holder")
         out_dict: dict[str, RailPlotHolder] = {}
         truth: np.ndarray = kwargs["truth"]
         magnitudes: np.ndarray = kwargs["magnitudes"]
         bands: list[str] = kwargs["bands"]
-        if find_only:
-            plot_name = self._make_full_plot_name(prefix, "")
-            assert dataset_holder
-            plot = RailPlotHolder(
-                name=plot_name,
-                path=os.path.join(dataset_holder.config.name, f"{plot_name}.{figtype}"),
-                plotter=self,
-                dataset_holder=dataset_holder,
-            )
-        else:
-            plot = self._make_2d_hist_plots(
-                prefix=prefix,
-                truth=truth,
-                magnitudes=magnitudes,
-                bands=bands,
-                dataset_holder=dataset_holder,
-            )
+        plot = self._make_2d_hist_plots(
+            prefix=prefix,
+            truth=truth,
+            magnitudes=magnitudes,
+            bands=bands,
+            dataset_holder=dataset_holder,
+        )
         out_dict[plot.name] = plot
         return out_dict
 
@@ -240,9 +205,9 @@ class CatPlotterColorsVsTruth(RailPlotter):
     ) -> RailPlotHolder:
 
         colors = utility_functions.adjacent_band_colors(magnitudes)
-        color_names = []
-        for i in range(len(bands) - 1):
-            color_names.append(f"{bands[i+1]} - {bands[i]}")
+        color_names = [
+            f"{next_band_} - {band_}" for band_, next_band_ in zip(bands, bands[1:])
+        ]
         xbins = np.linspace(self.config.z_min, self.config.z_min, self.config.n_zbins)
         ybins = np.linspace(
             self.config.color_min, self.config.color_max, self.config.n_colorbins
@@ -257,29 +222,17 @@ class CatPlotterColorsVsTruth(RailPlotter):
         )
 
     def _make_plots(self, prefix: str, **kwargs: Any) -> dict[str, RailPlotHolder]:
-        find_only = kwargs.get("find_only", False)
-        figtype = kwargs.get("figtype", "png")
         dataset_holder = kwargs.get("dataset_holder")
         out_dict: dict[str, RailPlotHolder] = {}
         truth: np.ndarray = kwargs["truth"]
         magnitudes: np.ndarray = kwargs["magnitudes"]
         bands: list[str] = kwargs["bands"]
-        if find_only:
-            plot_name = self._make_full_plot_name(prefix, "")
-            assert dataset_holder
-            plot = RailPlotHolder(
-                name=plot_name,
-                path=os.path.join(dataset_holder.config.name, f"{plot_name}.{figtype}"),
-                plotter=self,
-                dataset_holder=dataset_holder,
-            )
-        else:
-            plot = self._make_2d_hist_plots(
-                prefix=prefix,
-                truth=truth,
-                magnitudes=magnitudes,
-                bands=bands,
-                dataset_holder=dataset_holder,
-            )
+        plot = self._make_2d_hist_plots(
+            prefix=prefix,
+            truth=truth,
+            magnitudes=magnitudes,
+            bands=bands,
+            dataset_holder=dataset_holder,
+        )
         out_dict[plot.name] = plot
         return out_dict
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
-import yaml
 from rail.core.factory_mixin import RailFactoryMixin
+from rail.projects import yaml_utils
 
 from .dataset_factory import RailDatasetFactory
 from .dataset_holder import RailDatasetHolder
@@ -127,11 +128,123 @@ write_plots = RailPlotter.write_plots
 make_plots = RailPlotGroup.make_plots
 
 
+# The yaml file that run() last loaded into the factories, and the files that
+# the factories then held, so that running the same, unchanged, file again can
+# re-use the datasets that were already read
+_RUN_STATE: dict[str, Any] = dict(yaml_file=None, loaded_files=None)
+
+
+def _file_key(path: str) -> tuple[str, int | None]:
+    realpath = os.path.realpath(os.path.expandvars(path))
+    try:
+        return (realpath, os.stat(realpath).st_mtime_ns)
+    except FileNotFoundError:  # pragma: no cover
+        return (realpath, None)
+
+
+def _loaded_files_key() -> tuple[tuple[tuple[str, int | None], ...], ...]:
+    # Clearing a factory, or loading another file into it, changes this, as
+    # does editing any of the loaded files, including the included ones
+    return tuple(
+        tuple(_file_key(path_) for path_ in factory_.instance().loaded_files)
+        for factory_ in THE_FACTORIES
+    )
+
+
+def _reset_run_state() -> None:
+    _RUN_STATE["yaml_file"] = None
+    _RUN_STATE["loaded_files"] = None
+
+
+def _load_run_yaml(yaml_file: str, force_reload: bool = False) -> None:
+    yaml_key = _file_key(yaml_file)
+    if (
+        not force_reload
+        and _RUN_STATE["yaml_file"] == yaml_key
+        and _RUN_STATE["loaded_files"] == _loaded_files_key()
+    ):
+        return
+    clear()
+    load_yaml(yaml_file)
+    _RUN_STATE["yaml_file"] = yaml_key
+    _RUN_STATE["loaded_files"] = _loaded_files_key()
+
+
 # Define a few additional functions
 def clear() -> None:
     """Clean all the factories"""
     for factory_ in THE_FACTORIES:
         factory_.clear()
+    _reset_run_state()
+
+
+# The plots already made by a worker process, see _run_groups_in_workers
+_WORKER_PLOT_CACHE: dict[tuple[str, str], dict] = {}
+
+
+def _init_worker(yaml_file: str) -> None:  # pragma: no cover
+    _load_run_yaml(yaml_file, force_reload=True)
+    _WORKER_PLOT_CACHE.clear()
+
+
+def _run_worker_group(
+    group_name: str,
+    outdir: str,
+    kwargs: dict[str, Any],
+) -> dict[str, dict[str, tuple[str | None, str | None]]]:  # pragma: no cover
+    plot_group = get_plot_group_dict()[group_name]
+    plot_group.run(outdir=outdir, plot_cache=_WORKER_PLOT_CACHE, **kwargs)
+    return plot_group.get_plot_paths()
+
+
+def _run_groups_in_workers(
+    yaml_file: str,
+    group_names: list[str],
+    outdir: str,
+    jobs: int,
+    **kwargs: Any,
+) -> dict[str, dict[str, dict[str, tuple[str | None, str | None]]]]:
+    """Make and save the plots for several PlotGroups in worker processes
+
+    Parameters
+    ----------
+    yaml_file: str
+        Top level yaml file with definitions, each worker loads its own copy
+
+    group_names: list[str]
+        PlotGroups to make
+
+    outdir: str
+        Prepend this to the groups output dir
+
+    jobs: int
+        Number of worker processes
+
+    **kwargs:
+        Passed to RailPlotGroup.run
+
+    Returns
+    -------
+    dict[str, dict[str, dict[str, tuple[str | None, str | None]]]]
+        The paths to the saved plots, keyed by PlotGroup name,
+        see RailPlotGroup.get_plot_paths
+
+    Notes
+    -----
+    Figures can not be sent between processes, so the workers always save
+    and purge the plots, and send back the paths to them
+    """
+    worker_kwargs = dict(kwargs, save_plots=True, purge_plots=True, make_html=False)
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(group_names)),
+        initializer=_init_worker,
+        initargs=(yaml_file,),
+    ) as executor:
+        futures = {
+            group_: executor.submit(_run_worker_group, group_, outdir, worker_kwargs)
+            for group_ in group_names
+        }
+        return {group_: future_.result() for group_, future_ in futures.items()}
 
 
 def print_contents() -> None:
@@ -189,41 +302,78 @@ def run(
     make_html: bool
         If set, make an html page to browse plots
 
+    force_reload: bool=False
+        Reload the yaml file, and so re-read all the datasets, even if
+        this is the same, unchanged, yaml file that was used in the previous call
+
+    jobs: int=1
+        Number of worker processes used to make and save the plots,
+        each one makes all the plots for a PlotGroup at a time.
+        Only used if the plots are saved and purged
+
     Returns
     -------
     dict[str, RailPlotDict]:
         Newly created plots.   If purge=True this will be empty
     """
-    clear()
-    out_dict: dict[str, RailPlotDict] = {}
-    load_yaml(yaml_file)
+    # If the factories already hold this file, keep them, and the data that
+    # the dataset holders have already read, rather than reading it again
+    _load_run_yaml(yaml_file, force_reload=kwargs.pop("force_reload", False))
     yaml_file_dir = os.path.dirname(yaml_file)
     group_dict = get_plot_group_dict()
 
-    include_groups = kwargs.pop("include_groups", None)
-    exclude_groups = kwargs.pop("exclude_groups", None)
     make_html = kwargs.get("make_html", False)
+    jobs = kwargs.pop("jobs", 1)
     output_dir = kwargs.pop("outdir", None)
     if not output_dir:  # pragma: no cover
         output_dir = yaml_file_dir
-    if include_groups is None or not include_groups:
+    if not include_groups:
         include_groups = list(group_dict.keys())
-    if exclude_groups is None or not exclude_groups:
-        exclude_groups = []
-    for exclude_group_ in exclude_groups:  # pragma: no cover
-        include_groups.remove(exclude_group_)
+    if exclude_groups:  # pragma: no cover
+        excluded = set(exclude_groups)
+        include_groups = [
+            group_ for group_ in include_groups if group_ not in excluded
+        ]
+
+    # The workers save and purge the plots, so they are only useful if we are
+    # doing both, otherwise the caller would lose the figures they asked to keep
+    plot_paths: dict[str, dict[str, dict[str, tuple[str | None, str | None]]]] = {}
+    if (
+        jobs > 1
+        and len(include_groups) > 1
+        and kwargs.get("save_plots", True)
+        and kwargs.get("purge_plots", True)
+        and not kwargs.get("find_only", False)
+    ):
+        plot_paths = _run_groups_in_workers(
+            yaml_file, include_groups, output_dir, jobs, **kwargs
+        )
 
+    # Groups can share plotters and datasets, only make each of those plots once
+    plot_cache: dict[tuple[str, str], dict] = {}
     output_pages: list[str] = []
+    group_results: list[dict[str, RailPlotDict]] = []
     for group_ in include_groups:
         plot_group = group_dict[group_]
-        out_dict.update(plot_group.run(outdir=output_dir, **kwargs))
+        group_results.append(
+            plot_group.run(
+                outdir=output_dir,
+                plot_cache=plot_cache,
+                plot_paths=plot_paths.get(group_),
+                **kwargs,
+            )
+        )
         if make_html:
             output_pages.append(f"plots_{plot_group.config.name}.html")
     if make_html:
         RailPlotGroup.make_html_index(
             os.path.join(output_dir, "plot_index.html"), output_pages
         )
-    return out_dict
+    # Merge the groups' results at the end, rather than growing the output
+    # dict one group at a time
+    return {
+        key_: val_ for result_ in group_results for key_, val_ in result_.items()
+    }
 
 
 def extract_datasets(
@@ -274,7 +424,7 @@ def extract_datasets(
 
     output_data = dict(Data=output_list)
     with open(output_yaml, "w", encoding="utf-8") as fout:
-        yaml.dump(output_data, fout)
+        yaml_utils.safe_dump(output_data, fout)
 
 
 def load_yaml(yaml_file: str) -> None:
@@ -289,8 +439,9 @@ def load_yaml(yaml_file: str) -> None:
     -----
     See class description for yaml file syntax
     """
-    with open(os.path.expandvars(yaml_file), encoding="utf-8") as fin:
-        yaml_data = yaml.safe_load(fin)
+    # The factories no longer hold just what run() loaded
+    _reset_run_state()
+    yaml_data = yaml_utils.load_yaml_file(yaml_file)
 
     includes = yaml_data.pop("Includes", [])
     for include_ in includes:
@@ -328,4 +479,4 @@ def write_yaml(yaml_file: str) -> None:
     for a_factory in THE_FACTORIES:
         yaml_dict.update(**a_factory.to_yaml_dict())
     with open(os.path.expandvars(yaml_file), mode="w", encoding="utf-8") as fout:
-        yaml.dump(yaml_dict, fout)
+        yaml_utils.safe_dump(yaml_dict, fout)
@@ -2,21 +2,216 @@
 
 from __future__ import annotations
 
-from typing import Any
+import contextlib
+import functools
+import os
+import time
+from typing import TYPE_CHECKING, Any
 
-import numpy as np
-import qp
-import tables_io
-from rail.utils.catalog_utils import CatalogConfigBase
-
-from rail.projects import RailProject, path_funcs
+from rail.projects import path_funcs
 
 from . import utility_functions
 
+if TYPE_CHECKING:
+    # numpy, qp and tables_io (and rail.core, which the catalog utils pull in)
+    # are slow to import, so they are only imported when data are extracted
+    import numpy as np
+    import qp
+    from numpy.typing import DTypeLike
+
+    from rail.projects import RailProject
+
+
+# Set this environmental variable to re-read the files for every extraction
+NOCACHE_ENV_VAR = "RAIL_EXTRACT_NOCACHE"
+
+
+def _file_cache_key(filepath: str) -> tuple[str, int, int] | None:
+    # The modification time and size are part of the cache keys, so that
+    # re-written files are re-read.  None means that the file should be read
+    # without caching, either because the caches are turned off, or because
+    # the file changed so recently that, on file systems with coarse
+    # modification times, another write could keep the same time and size
+    if os.environ.get(NOCACHE_ENV_VAR):  # pragma: no cover
+        return None
+    realpath = os.path.realpath(filepath)
+    stat_result = os.stat(realpath)
+    if time.time_ns() - stat_result.st_mtime_ns < path_funcs.RECENT_CHANGE_NS:
+        return None
+    return realpath, stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _read_only(data: np.ndarray) -> np.ndarray:
+    import numpy as np
+
+    # The cached arrays are shared by all the callers, so make sure that
+    # changing them in place raises an error
+    if isinstance(data, np.ndarray):
+        data.flags.writeable = False
+    return data
+
+
+@functools.lru_cache(maxsize=32)
+def _read_qp_cached(
+    realpath: str,
+    mtime_ns: int,  # pylint: disable=unused-argument
+    size: int,  # pylint: disable=unused-argument
+) -> qp.Ensemble:
+    import qp
+
+    return qp.read(realpath)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_column_cached(
+    realpath: str,
+    mtime_ns: int,  # pylint: disable=unused-argument
+    size: int,  # pylint: disable=unused-argument
+    colname: str,
+) -> np.ndarray:
+    return _read_only(_read_table_column(realpath, colname))
+
+
+def _read_table_column(filepath: str, colname: str) -> np.ndarray:
+    # Read just the one column where the format lets us, rather than having
+    # tables_io read every column of the table
+    ext = os.path.splitext(filepath)[1]
+    if ext in (".hdf5", ".h5"):
+        import h5py
+        import numpy as np
+
+        with h5py.File(filepath, "r") as hfile:
+            dset = hfile.get(colname)
+            if isinstance(dset, h5py.Dataset):
+                # read_direct fills the array in place, skipping the extra
+                # selection machinery of dset[()]
+                out = np.empty(dset.shape, dtype=dset.dtype)
+                if dset.size:
+                    dset.read_direct(out)
+                return out
+    elif ext in (".parquet", ".pq"):
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(filepath, columns=[colname])
+        return table.column(0).to_numpy()
+
+    # Other formats, or hdf5 files without the column as a top-level dataset
+    import tables_io
+
+    return tables_io.read(filepath)[colname]
+
+
+def _read_stacked_qp_hdf5(filepaths: tuple[str, ...]) -> qp.Ensemble:
+    # Read the per-object arrays of all the files straight into one set of
+    # arrays, rather than making an ensemble for each file and concatenating
+    import h5py
+    import numpy as np
+    import qp
+
+    with contextlib.ExitStack() as stack:
+        hfiles = [stack.enter_context(h5py.File(path_, "r")) for path_ in filepaths]
+        meta = {key_: dset_[()] for key_, dset_ in hfiles[0]["meta"].items()}
+        for path_, hfile_ in zip(filepaths[1:], hfiles[1:]):
+            other_meta = {key_: dset_[()] for key_, dset_ in hfile_["meta"].items()}
+            if other_meta.keys() != meta.keys() or not all(
+                np.array_equal(val_, other_meta[key_]) for key_, val_ in meta.items()
+            ):  # pragma: no cover
+                raise ValueError(
+                    f"Metadata in {path_} does not match that in {filepaths[0]}"
+                )
+        tables: dict[str, dict[str, np.ndarray]] = dict(meta=meta)
+        # As in qp.concatenate, ancillary data are only kept if all files have them
+        for group_ in ["data", "ancil"]:
+            if not all(group_ in hfile_ for hfile_ in hfiles):
+                continue
+            tables[group_] = {}
+            for key_, first_dset in hfiles[0][group_].items():
+                dsets = [hfile_[group_][key_] for hfile_ in hfiles]
+                out = np.empty(
+                    (sum(dset_.shape[0] for dset_ in dsets), *first_dset.shape[1:]),
+                    dtype=first_dset.dtype,
+                )
+                offset = 0
+                for dset_ in dsets:
+                    n_rows = dset_.shape[0]
+                    if n_rows:
+                        dset_.read_direct(out, dest_sel=np.s_[offset : offset + n_rows])
+                    offset += n_rows
+                tables[group_][key_] = out
+    return qp.from_tables(tables, decode=True, ext="hdf5")
+
+
+@functools.lru_cache(maxsize=32)
+def _read_stacked_qp_cached(
+    cache_keys: tuple[tuple[str, int, int], ...],
+) -> qp.Ensemble:
+    return _read_stacked_qp_hdf5(tuple(key_[0] for key_ in cache_keys))
+
+
+def _read_hdf5_ancil_column(filepath: str, colname: str) -> np.ndarray:
+    # Read just the one column, rather than building the qp ensemble, which
+    # reads and normalizes all the pdfs
+    import h5py
+
+    with h5py.File(filepath, "r") as hfile:
+        return hfile["ancil"][colname][()]
+
+
+@functools.lru_cache(maxsize=32)
+def _read_qp_ancil_column_cached(
+    realpath: str,
+    mtime_ns: int,  # pylint: disable=unused-argument
+    size: int,  # pylint: disable=unused-argument
+    colname: str,
+) -> np.ndarray:
+    return _read_only(_read_hdf5_ancil_column(realpath, colname))
+
+
+def _read_qp(filepath: str) -> qp.Ensemble:
+    cache_key = _file_cache_key(filepath)
+    if cache_key is None:
+        import qp
+
+        return qp.read(filepath)
+    return _read_qp_cached(*cache_key)
+
+
+def _read_column(filepath: str, colname: str) -> np.ndarray:
+    cache_key = _file_cache_key(filepath)
+    if cache_key is None:
+        return _read_table_column(filepath, colname)
+    return _read_column_cached(*cache_key, colname)
+
+
+def _read_qp_ancil_column(filepath: str, colname: str) -> np.ndarray:
+    cache_key = _file_cache_key(filepath)
+    if cache_key is None:
+        return _read_hdf5_ancil_column(filepath, colname)
+    return _read_qp_ancil_column_cached(*cache_key, colname)
+
+
+def clear_extraction_caches() -> None:
+    """Drop all the cached data read from files"""
+    _read_qp_cached.cache_clear()
+    _read_column_cached.cache_clear()
+    _read_stacked_qp_cached.cache_clear()
+    _read_qp_ancil_column_cached.cache_clear()
+
+
+def _as_contiguous(data: np.ndarray, dtype: DTypeLike | None) -> np.ndarray:
+    if dtype is None:
+        return data
+    import numpy as np
+
+    # This is a no-op if the data already are contiguous, native-endian and
+    # of the requested type
+    return np.ascontiguousarray(data, dtype=dtype)
+
 
 def extract_z_true(
     filepath: str,
     colname: str = "redshift",
+    dtype: DTypeLike | None = None,
 ) -> np.ndarray:
     """Extract the true redshifts from a file
 
@@ -28,6 +223,10 @@ def extract_z_true(
     colname: str
         Name of the column with redshfits ['redshift']
 
+    dtype: DTypeLike | None
+        If set, convert the redshifts to a contiguous, native-endian array
+        of this type, e.g., np.float32
+
     Returns
     -------
     redshifts: np.ndarray
@@ -36,14 +235,16 @@ def extract_z_true(
     Notes
     -----
     This assumes the redshifts are in a file that can be read by tables_io
+
+    The redshifts are cached, so callers should not modify them
     """
-    truth_table = tables_io.read(filepath)
-    return truth_table[colname]
+    return _as_contiguous(_read_column(filepath, colname), dtype)
 
 
 def extract_z_point(
     filepath: str,
     colname: str = "zmode",
+    dtype: DTypeLike | None = None,
 ) -> np.ndarray:
     """Extract the point estimates of redshifts from a file
 
@@ -55,6 +256,10 @@ def extract_z_point(
     colname: str
         Name of the column with point estimates ['zmode']
 
+    dtype: DTypeLike | None
+        If set, convert the estimates to a contiguous, native-endian array
+        of this type, e.g., np.float32
+
     Returns
     -------
     z_estimates: np.ndarray
@@ -63,10 +268,22 @@ def extract_z_point(
     Notes
     -----
     This assumes the point estimates are in a qp file
+
+    The estimates are cached, so callers should not modify them
     """
-    qp_ens = qp.read(filepath)
-    z_estimates = np.squeeze(qp_ens.ancil[colname])
-    return z_estimates
+    import numpy as np
+
+    if filepath.endswith((".hdf5", ".h5")):
+        z_estimates = _read_qp_ancil_column(filepath, colname)
+    else:  # pragma: no cover
+        z_estimates = _read_qp(filepath).ancil[colname]
+    # Point estimates are usually stored with shape (N, 1), or (N,), take a
+    # view of the single column without the generic axis search of np.squeeze
+    if z_estimates.ndim == 2 and z_estimates.shape[1] == 1:
+        z_estimates = z_estimates[:, 0]
+    elif z_estimates.ndim != 1:  # pragma: no cover
+        z_estimates = np.squeeze(z_estimates)
+    return _as_contiguous(z_estimates, dtype)
 
 
 def extract_mag(
@@ -91,9 +308,10 @@ def extract_mag(
     Notes
     -----
     This assumes the magnitude are in a file that can be read by tables_io
+
+    The magnitudes are cached, so callers should not modify them
     """
-    magnitude_table = tables_io.read(filepath)
-    return magnitude_table[colname]
+    return _read_column(filepath, colname)
 
 
 def extract_magnitudes(
@@ -123,6 +341,8 @@ def extract_magnitudes(
     -----
     This assumes the magnitude are in a file that can be read by tables_io
     """
+    import tables_io
+
     magnitude_table = tables_io.read(filepath)
     magnitudes = utility_functions.get_band_values(magnitude_table, template, bands)
     return magnitudes
@@ -146,15 +366,51 @@ def extract_z_pdf(
     Notes
     -----
     This assumes the point estimates are in a qp file
+
+    The ensemble is cached, so callers should not modify it
     """
-    z_pdf = qp.read(filepath)
-    return z_pdf
+    return _read_qp(filepath)
+
+
+def extract_stacked_z_pdf(
+    filepaths: list[str],
+) -> qp.Ensemble:
+    """Extract the pdf estimates of redshifts from several files into one ensemble
+
+    Parameters
+    ----------
+    filepaths: list[str]
+        Paths to the files, in the order the pdfs should be stacked
+
+    Returns
+    -------
+    z_pdf: qp.Ensemble
+        Redshift pdfs from all the files, the same as concatenating the
+        ensembles from each file
+
+    Notes
+    -----
+    This assumes the point estimates are in qp files, which all use the same
+    parameterization and metadata
+
+    The ensemble is cached, so callers should not modify it
+    """
+    import qp
+
+    if not all(
+        path_.endswith((".hdf5", ".h5")) for path_ in filepaths
+    ):  # pragma: no cover
+        return qp.concatenate([extract_z_pdf(path_) for path_ in filepaths])
+    cache_keys = [_file_cache_key(path_) for path_ in filepaths]
+    if None in cache_keys:
+        return _read_stacked_qp_hdf5(tuple(filepaths))
+    return _read_stacked_qp_cached(tuple(cache_keys))
 
 
 def extract_multiple_z_point(
     filepaths: dict[str, str],
     colname: str = "zmode",
-) -> dict[str, np.ndarray]:  # pragma: no cover
+) -> dict[str, np.ndarray]:
     """Extract the point estimates of redshifts from several files
 
     Parameters
@@ -175,7 +431,15 @@ def extract_multiple_z_point(
     -----
     This assumes the point estimates are in a qp file
     """
-    ret_dict = {key: extract_z_point(val, colname) for key, val in filepaths.items()}
+    # Several keys can point to the same file, only read each file once,
+    # even if the extraction caches are turned off
+    z_estimates_by_path: dict[str, np.ndarray] = {}
+    ret_dict: dict[str, np.ndarray] = {}
+    for key, val in filepaths.items():
+        realpath = os.path.realpath(val)
+        if realpath not in z_estimates_by_path:
+            z_estimates_by_path[realpath] = extract_z_point(val, colname)
+        ret_dict[key] = z_estimates_by_path[realpath]
     return ret_dict
 
 
@@ -312,12 +576,38 @@ def get_pz_point_estimate_data(
     pz_data: dict[str, np.ndarray] | None
         Data in question or None if a file is missing
     """
+    z_true_path, z_estimate_path = _get_pz_point_estimate_paths(
+        project, selection, flavor, tag, algo
+    )
+    if z_estimate_path is None:  # pragma: no cover
+        return None
+    return _load_pz_point_estimate_data(project, flavor, z_true_path, z_estimate_path)
+
+
+def _get_pz_point_estimate_paths(
+    project: RailProject,
+    selection: str,
+    flavor: str,
+    tag: str,
+    algo: str,
+) -> tuple[str, str | None]:
+    # The paths to the true redshifts and to the point estimates,
+    # None for the point estimates if that file is missing
     z_true_path = path_funcs.get_z_true_path(project, selection, flavor, tag)
     z_estimate_path = path_funcs.get_ceci_pz_output_path(
         project, selection, flavor, algo
     )
-    if z_estimate_path is None:  # pragma: no cover
-        return None
+    return z_true_path, z_estimate_path
+
+
+def _load_pz_point_estimate_data(
+    project: RailProject,
+    flavor: str,
+    z_true_path: str,
+    z_estimate_path: str,
+) -> dict[str, np.ndarray]:
+    from rail.utils.catalog_utils import CatalogConfigBase
+
     z_true_data = extract_z_true(z_true_path)
     z_estimate_data = extract_z_point(z_estimate_path)
     flavor_info = project.get_flavor(flavor)
@@ -358,6 +648,8 @@ def get_ztrue_and_magntidues(
     out_data: dict[str, np.ndarray] | None
         Data in question or None if a file is missing
     """
+    from rail.utils.catalog_utils import CatalogConfigBase
+
     flavor_info = project.get_flavor(flavor)
     catalog_tag = flavor_info["catalog_tag"]
     CatalogConfigBase.apply(catalog_tag)
@@ -376,6 +668,45 @@ def get_ztrue_and_magntidues(
     return out_data
 
 
+def _same_z_true(ztrue_data: np.ndarray, other_data: np.ndarray) -> bool:
+    import numpy as np
+
+    # The cached reads hand back the same array for the same file, and exact
+    # copies are caught by array_equal, so allclose is only the last resort
+    if other_data is ztrue_data:
+        return True
+    if np.array_equal(ztrue_data, other_data):
+        return True
+    return bool(np.allclose(ztrue_data, other_data))
+
+
+def _load_multi_pz_point_estimate_data(
+    z_true_paths: dict[str, str],
+    z_estimate_paths: dict[str, str],
+) -> dict[str, Any] | None:
+    ztrue_data: np.ndarray | None = None
+    ztrue_key: str | None = None
+    # Each truth file is read and compared once, however many variants use it
+    checked_ztrue_paths: set[str] = set()
+    for key, ztrue_path in z_true_paths.items():
+        realpath = os.path.realpath(ztrue_path)
+        if realpath in checked_ztrue_paths:
+            continue
+        checked_ztrue_paths.add(realpath)
+        the_truth = extract_z_true(ztrue_path)
+        if ztrue_data is None:
+            ztrue_data = the_truth
+            ztrue_key = key
+        elif not _same_z_true(ztrue_data, the_truth):
+            raise ValueError(
+                f"Mismatch in truth data. data({key}) != data({ztrue_key})"
+            )
+    if ztrue_data is None:  # pragma: no cover
+        return None
+    point_estimates = extract_multiple_z_point(z_estimate_paths)
+    return make_z_true_multi_z_point_dict(ztrue_data, point_estimates)
+
+
 def get_multi_pz_point_estimate_data(
     point_estimate_infos: dict[str, dict[str, Any]],
 ) -> dict[str, Any] | None:
@@ -393,27 +724,45 @@ def get_multi_pz_point_estimate_data(
     -------
     pz_data: dict[str, Any] | None
         Data in question or None
+
+    Notes
+    -----
+    The variants can mix projects, selections and flavors, all the paths are
+    resolved first, and then each truth file and each point estimate file is
+    read once
     """
-    point_estimates: dict[str, np.ndarray] = {}
-    ztrue_data: np.ndarray | None = None
-    ztrue_key: str | None = None
+    # Variants that differ only by algorithm share the same output directory,
+    # so find the estimates for all of their algorithms at once
+    algo_map: dict[tuple[int, str, str], list[str]] = {}
+    for val in point_estimate_infos.values():
+        dir_key = (id(val["project"]), val["selection"], val["flavor"])
+        algo_map.setdefault(dir_key, []).append(val["algo"])
+    z_estimate_path_map: dict[tuple[int, str, str], dict[str, str]] = {}
+    for val in point_estimate_infos.values():
+        dir_key = (id(val["project"]), val["selection"], val["flavor"])
+        if dir_key not in z_estimate_path_map:
+            z_estimate_path_map[dir_key] = path_funcs.get_ceci_pz_output_paths(
+                val["project"], val["selection"], val["flavor"], algo_map[dir_key]
+            )
+
+    z_true_paths: dict[str, str] = {}
+    z_estimate_paths: dict[str, str] = {}
+    # They also share the same truth file
+    z_true_path_map: dict[tuple[int, str, str, str], str] = {}
     for key, val in point_estimate_infos.items():
-        the_data = get_pz_point_estimate_data(**val)
-        if the_data is None:  # pragma: no cover
+        project = val["project"]
+        dir_key = (id(project), val["selection"], val["flavor"])
+        z_estimate_path = z_estimate_path_map[dir_key].get(val["algo"])
+        if z_estimate_path is None:
             continue
-        if ztrue_data is None:
-            ztrue_data = the_data["truth"]
-            ztrue_key = key
-        else:
-            if not np.allclose(ztrue_data, the_data["truth"]):  # pragma: no cover
-                raise ValueError(
-                    f"Mismatch in truth data. data({key}) != data({ztrue_key})"
-                )
-        point_estimates[key] = the_data["pointEstimate"]
-    if ztrue_data is None:  # pragma: no cover
-        return None
-    pz_data = make_z_true_multi_z_point_dict(ztrue_data, point_estimates)
-    return pz_data
+        truth_key = (id(project), val["selection"], val["flavor"], val["tag"])
+        if truth_key not in z_true_path_map:
+            z_true_path_map[truth_key] = path_funcs.get_z_true_path(
+                project, val["selection"], val["flavor"], val["tag"]
+            )
+        z_true_paths[key] = z_true_path_map[truth_key]
+        z_estimate_paths[key] = z_estimate_path
+    return _load_multi_pz_point_estimate_data(z_true_paths, z_estimate_paths)
 
 
 def get_tomo_bins_nz_estimate_data(
@@ -460,8 +809,7 @@ def get_tomo_bins_nz_estimate_data(
         summarizer,
     )
 
-    data = qp.concatenate([extract_z_pdf(path_) for path_ in paths])
-    return data
+    return extract_stacked_z_pdf(paths)
 
 
 def get_tomo_bins_true_nz_data(
@@ -503,5 +851,4 @@ def get_tomo_bins_true_nz_data(
         classifier,
     )
 
-    data = qp.concatenate([extract_z_pdf(path_) for path_ in paths])
-    return data
+    return extract_stacked_z_pdf(paths)
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable, Mapping
 
 from rail.projects.dynamic_class import DynamicClass
 
-from .validation import validate_inputs
+from .validation import make_validator
 
 
 class RailDataset(DynamicClass):
@@ -29,6 +29,13 @@ class RailDataset(DynamicClass):
 
     sub_classes: dict[str, type[DynamicClass]] = {}
 
+    # Checks the data against data_types, built once for each sub-class
+    _validator: Callable[[Mapping[str, Any]], None] | None = None
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        cls._validator = make_validator(cls, cls.data_types)
+
     @classmethod
     def full_class_name(cls) -> str:
         """Return the full name of the class, including the parent module"""
@@ -36,11 +43,22 @@ class RailDataset(DynamicClass):
 
     @classmethod
     def validate_inputs(cls, **kwargs: Any) -> None:
+        cls.validate_data(kwargs)
+
+    @classmethod
+    def validate_data(cls, data: Mapping[str, Any]) -> None:
+        """Validate the data against data_types
+
+        This is the same as validate_inputs(**data), but without unpacking
+        the data into kwargs
+        """
         if not cls.data_types:
             raise NotImplementedError(
                 f"RailDataset class {cls.__name__} has not defined data_types"
             )
-        validate_inputs(cls, cls.data_types, **kwargs)
+        validator = cls._validator
+        assert validator is not None
+        validator(data)  # pylint: disable=not-callable
 
     def __repr__(self) -> str:
         the_class = self.__class__
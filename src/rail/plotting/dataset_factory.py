@@ -4,13 +4,16 @@ from typing import TYPE_CHECKING, Any, TypeVar
 
 from rail.core.factory_mixin import RailFactoryMixin
 
-from rail.projects import RailProject
+from rail.projects import path_funcs
 
+from . import data_extraction_funcs
 from .dataset_holder import RailDatasetHolder, RailDatasetListHolder, RailProjectHolder
 
 if TYPE_CHECKING:
     from rail.core.configurable import Configurable
 
+    from rail.projects import RailProject
+
     C = TypeVar("C", bound="Configurable")
 
 
@@ -73,6 +76,13 @@ class RailDatasetFactory(RailFactoryMixin):
         self._datasets = self.add_dict(RailDatasetHolder)
         self._dataset_lists = self.add_dict(RailDatasetListHolder)
 
+    def clear_instance(self) -> None:
+        """Clear out the contents of the factory, and the cached file data"""
+        RailFactoryMixin.clear_instance(self)
+        # Release the data that the dataset holders read from files
+        data_extraction_funcs.clear_extraction_caches()
+        path_funcs.clear_cache()
+
     @classmethod
     def get_projects(cls) -> dict[str, RailProject]:
         """Return the dict of all the projects"""
@@ -186,8 +196,9 @@ class RailDatasetFactory(RailFactoryMixin):
         self, configurable_class: type[C], yaml_tag: dict[str, Any]
     ) -> None:
         if configurable_class == RailDatasetHolder:
+            # Note that we do not resolve the dataset here, the data are
+            # only extracted when a plotter actually asks for them
             the_object = RailDatasetHolder.create_from_dict(yaml_tag)
             self.add_to_dict(the_object)
-            the_object.resolve()
             return
         RailFactoryMixin.load_object_from_yaml_tag(self, configurable_class, yaml_tag)
@@ -1,18 +1,19 @@
 from __future__ import annotations
 
 import enum
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Mapping
 
 from ceci.config import StageParameter
 from rail.core.configurable import Configurable
 
-from rail.projects import RailProject
 from rail.projects.dynamic_class import DynamicClass
 
 from .dataset import RailDataset
-from .validation import validate_inputs
+from .validation import make_validator
 
 if TYPE_CHECKING:
+    from rail.projects import RailProject
+
     from .dataset_factory import RailDatasetFactory
 
 
@@ -69,13 +70,22 @@ class RailDatasetHolder(Configurable, DynamicClass):
 
     yaml_tag = "Dataset"
 
+    # Checks the inputs against extractor_inputs, built once for each sub-class
+    _extractor_validator: Callable[[Mapping[str, Any]], None] | None = None
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        cls._extractor_validator = make_validator(cls, cls.extractor_inputs)
+
     @classmethod
-    def _validate_extractor_inputs(cls, **kwargs: Any) -> None:
-        validate_inputs(cls, cls.extractor_inputs, **kwargs)
+    def _validate_extractor_inputs(cls, inputs: Mapping[str, Any]) -> None:
+        validator = cls._extractor_validator
+        assert validator is not None
+        validator(inputs)  # pylint: disable=not-callable
 
     @classmethod
-    def _validate_outputs(cls, **kwargs: Any) -> None:
-        cls.output_type.validate_inputs(**kwargs)
+    def _validate_outputs(cls, data: Mapping[str, Any]) -> None:
+        cls.output_type.validate_data(data)
 
     @classmethod
     def generate_dataset_dict(
@@ -137,10 +147,10 @@ class RailDatasetHolder(Configurable, DynamicClass):
         dict[str, Any] | None
             Dictionary of the newly extracted data
         """
-        self._validate_extractor_inputs(**kwargs)
+        self._validate_extractor_inputs(kwargs)
         the_data = self._get_data(**kwargs)
         if the_data is not None:
-            self._validate_outputs(**the_data)
+            self._validate_outputs(the_data)
         return the_data
 
     def resolve(self) -> dict[str, Any]:
@@ -287,5 +297,9 @@ class RailProjectHolder(Configurable):
     def resolve(self) -> RailProject:
         """Read the associated yaml file and create a RailProject"""
         if self._project is None:
+            # Importing the project machinery is slow, so only do it when a
+            # project is actually needed
+            from rail.projects import RailProject
+
             self._project = RailProject.load_config(self.config.yaml_file)
         return self._project
@@ -94,7 +94,7 @@ class RailNZTomoBinsDataHolder(RailDatasetHolder):
             classifier=self.config.classifier,
             summarizer=self.config.summarizer,
         )
-        self._validate_extractor_inputs(**the_extractor_inputs)
+        self._validate_extractor_inputs(the_extractor_inputs)
         return the_extractor_inputs
 
     @classmethod
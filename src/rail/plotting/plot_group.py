@@ -121,9 +121,15 @@ class RailPlotGroup(Configurable):
 
     def make_plots(
         self,
+        plot_cache: dict[tuple[str, str, str], dict[str, RailPlotHolder]] | None = None,
     ) -> dict[str, RailPlotDict]:
         """Make a set of plots
 
+        Parameters
+        ----------
+        plot_cache: dict[tuple[str, str, str], dict[str, RailPlotHolder]] | None
+            If set, re-use the plots in this cache, and add the new plots to it
+
         Returns
         -------
         out_dict: dict[str, RailPlotDict]
@@ -131,7 +137,9 @@ class RailPlotGroup(Configurable):
         """
         self.resolve()
         self._plots.update(
-            **RailPlotter.iterate(self._plotter_list, self._dataset_list)
+            **RailPlotter.iterate(
+                self._plotter_list, self._dataset_list, plot_cache=plot_cache
+            )
         )
         return self._plots
 
@@ -163,6 +171,64 @@ class RailPlotGroup(Configurable):
         )
         return self._plots
 
+    def get_plot_paths(self) -> dict[str, dict[str, tuple[str | None, str | None]]]:
+        """Get the paths to the saved plots, without the figures or the data
+
+        Returns
+        -------
+        dict[str, dict[str, tuple[str | None, str | None]]]
+            Dataset name: plot name: (plotter name, path to the plot)
+
+        Notes
+        -----
+        This is small, and can be sent back from worker processes
+        """
+        return {
+            dict_name: {
+                plot_name: (
+                    None if plot_.plotter is None else plot_.plotter.config.name,
+                    plot_.path,
+                )
+                for plot_name, plot_ in (plot_dict.plots or {}).items()
+            }
+            for dict_name, plot_dict in self._plots.items()
+        }
+
+    def set_plot_paths(
+        self,
+        plot_paths: dict[str, dict[str, tuple[str | None, str | None]]],
+    ) -> dict[str, RailPlotDict]:
+        """Set the plots from the paths to plots that were already saved
+
+        Parameters
+        ----------
+        plot_paths: dict[str, dict[str, tuple[str | None, str | None]]]
+            Dataset name: plot name: (plotter name, path to the plot),
+            as returned by `get_plot_paths`
+
+        Returns
+        -------
+        out_dict: dict[str, RailPlotDict]
+            Dictionary of the plots
+        """
+        self.resolve()
+        plotters = {plotter_.config.name: plotter_ for plotter_ in self._plotter_list}
+        datasets = {dataset_.config.name: dataset_ for dataset_ in self._dataset_list}
+        for dict_name, paths in plot_paths.items():
+            self._plots[dict_name] = RailPlotDict(
+                name=dict_name,
+                plots={
+                    plot_name: RailPlotHolder(
+                        name=plot_name,
+                        path=path,
+                        plotter=plotters.get(plotter_name or ""),
+                        dataset_holder=datasets.get(dict_name),
+                    )
+                    for plot_name, (plotter_name, path) in paths.items()
+                },
+            )
+        return self._plots
+
     @classmethod
     def make_html_index(
         cls,
@@ -207,7 +273,7 @@ class RailPlotGroup(Configurable):
         with open(outfile, "w", encoding="utf-8") as file:
             file.write(output)
 
-    def run(
+    def run(  # pylint: disable=too-many-arguments
         self,
         save_plots: bool = True,
         purge_plots: bool = True,
@@ -215,6 +281,8 @@ class RailPlotGroup(Configurable):
         outdir: str | None = None,
         make_html: bool = False,
         output_html: str | None = None,
+        plot_cache: dict[tuple[str, str], dict] | None = None,
+        plot_paths: dict[str, dict[str, tuple[str | None, str | None]]] | None = None,
     ) -> dict[str, RailPlotDict]:
         """Make all the plots given the data
 
@@ -238,6 +306,14 @@ class RailPlotGroup(Configurable):
         output_html: str | None
             Path for output html file
 
+        plot_cache: dict[tuple[str, str], dict] | None
+            If set, plots made by other groups, written to the same directory,
+            are taken from here rather than being made again
+
+        plot_paths: dict[str, dict[str, tuple[str | None, str | None]]] | None
+            If set, the plots were already made and saved, e.g., by a worker
+            process, and these are the paths to them, see `get_plot_paths`
+
         Returns
         -------
         out_dict: dict[str, Figure]
@@ -248,12 +324,19 @@ class RailPlotGroup(Configurable):
         else:  # pragma: no cover
             output_dir = self.config.outdir
 
-        if find_only:
+        if plot_paths is not None:
+            self.set_plot_paths(plot_paths)
+        elif find_only:
             self.find_plots(
                 outdir=output_dir,
             )
         else:
-            self.make_plots()
+            group_plot_cache = (
+                None
+                if plot_cache is None
+                else plot_cache.setdefault((output_dir, self.config.figtype), {})
+            )
+            self.make_plots(plot_cache=group_plot_cache)
             if save_plots:
                 RailPlotter.write_plots(
                     self._plots, output_dir, self.config.figtype, purge=purge_plots
@@ -3,9 +3,9 @@ from __future__ import annotations
 import re
 from typing import Any
 
-import yaml
 from rail.core.configurable import Configurable
 from rail.core.factory_mixin import RailFactoryMixin
+from rail.projects import yaml_utils
 
 from .dataset_factory import RailDatasetFactory
 from .dataset_holder import RailDatasetHolder, RailDatasetListHolder, RailProjectHolder
@@ -240,7 +240,7 @@ class RailPlotGroupFactory(RailFactoryMixin):
             PlotGroups=[plot_group_.to_yaml_dict() for plot_group_ in plot_groups],
         )
         with open(output_yaml, "w", encoding="utf-8") as fout:
-            yaml.dump(output, fout)
+            yaml_utils.safe_dump(output, fout)
 
     def make_yaml_for_project_instance(
         self,
@@ -327,7 +327,7 @@ class RailPlotGroupFactory(RailFactoryMixin):
         )
 
         with open(output_yaml, "w", encoding="utf-8") as fout:
-            yaml.dump(output_yaml_dict, fout)
+            yaml_utils.safe_dump(output_yaml_dict, fout)
 
     def make_plot_groups_instance(
         self,
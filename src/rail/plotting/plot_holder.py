@@ -4,10 +4,12 @@ import os
 from typing import TYPE_CHECKING, Any
 import yaml
 
-from matplotlib.figure import Figure
 import numpy as np
 
 if TYPE_CHECKING:
+    # matplotlib is slow to import, and is only needed once plots are made
+    from matplotlib.figure import Figure
+
     from .dataset_holder import RailDatasetHolder
     from .plotter import RailPlotter
 
@@ -147,6 +149,9 @@ class RailPlotDict:
         if not os.path.exists(outpath):  # pragma: no cover
             os.makedirs(outpath)
         for _key, val in self._plots.items():
+            if val.path and val.figure is None:  # pragma: no cover
+                # Already saved and purged, e.g., by another plot group
+                continue
             if val.path:  # pragma: no cover
                 val.savefig(val.path, os.path.dirname(outpath), **kwargs)
             else:
@@ -156,6 +161,10 @@ class RailPlotDict:
                     **kwargs,
                 )
             if purge:
+                import matplotlib.pyplot as plt
+
+                # pyplot also keeps a reference to the figure, so close it
+                plt.close(val.figure)
                 val.set_figure(None)
 
     def savedata(
@@ -10,10 +10,9 @@ from rail.projects.dynamic_class import DynamicClass
 
 from .dataset import RailDataset
 from .dataset_holder import RailDatasetHolder
-from .plot_holder import RailPlotDict
+from .plot_holder import RailPlotDict, RailPlotHolder
 
 if TYPE_CHECKING:
-    from .plot_holder import RailPlotHolder
     from .plotter_factory import RailPlotterFactory
 
 
@@ -98,13 +97,29 @@ class RailPlotter(Configurable, DynamicClass):
         -------
         out_dict: RailPlotDict
             Dictionary of the newly created figures
+
+        Notes
+        -----
+        If a dict is passed as the plot_cache keyword, plots already in it
+        are re-used, rather than being made again, and newly made plots
+        are added to it.
         """
+        plot_cache: dict[tuple[str, str, str], dict[str, RailPlotHolder]] | None = (
+            kwargs.pop("plot_cache", None)
+        )
         out_dict: dict[str, RailPlotHolder] = {}
         extra_args: dict[str, Any] = dict(dataset_holder=dataset)
         for plotter_ in plotters:
-            out_dict.update(
-                plotter_.run(prefix, **dataset.resolve(), **kwargs, **extra_args)
-            )
+            cache_key = (plotter_.config.name, dataset.config.name, prefix)
+            if plot_cache is not None and cache_key in plot_cache:
+                out_dict.update(plot_cache[cache_key])
+                continue
+            # Finding existing plots does not need the data, so do not read it
+            the_data = {} if kwargs.get("find_only", False) else dataset.resolve()
+            plots = plotter_.run(prefix, **the_data, **kwargs, **extra_args)
+            if plot_cache is not None:
+                plot_cache[cache_key] = plots
+            out_dict.update(plots)
         return RailPlotDict(name=name, plots=out_dict)
 
     @staticmethod
@@ -201,10 +216,48 @@ class RailPlotter(Configurable, DynamicClass):
         -------
         out_dict: dict[str, RailPlotHolder]
             Dictionary of the newly created figures
+
+        Notes
+        -----
+        If find_only=True is passed, no data are needed, and this just
+        returns the plots pointing to where they would have been saved
         """
+        if kwargs.get("find_only", False):
+            return self._find_plots(prefix, **kwargs)
         self._validate_inputs(**kwargs)
         return self._make_plots(prefix, **kwargs)
 
+    def _find_plots(self, prefix: str, **kwargs: Any) -> dict[str, RailPlotHolder]:
+        """Make the holders for plots that have already been saved
+
+        Parameters
+        ----------
+        prefix: str
+            Prefix to append to plot names, e.g., the p(z) algorithm or
+            analysis 'flavor'
+
+        kwargs: dict[str, Any]
+            Should include `dataset_holder` and can include `figtype`
+
+        Returns
+        -------
+        out_dict: dict[str, RailPlotHolder]
+            Dictionary of the plots, with their paths, but no figures
+        """
+        figtype = kwargs.get("figtype", "png")
+        dataset_holder = kwargs.get("dataset_holder")
+        assert dataset_holder
+        plot_name = self._make_full_plot_name(prefix, "")
+        # Dataset and plot names are never empty or absolute, so this is the
+        # same as os.path.join, but much quicker when finding many plots
+        plot = RailPlotHolder(
+            name=plot_name,
+            path=f"{dataset_holder.config.name}{os.sep}{plot_name}.{figtype}",
+            plotter=self,
+            dataset_holder=dataset_holder,
+        )
+        return {plot.name: plot}
+
     def _make_full_plot_name(self, prefix: str, plot_name: str) -> str:
         """Create the make for a specific plot
 
@@ -232,7 +285,7 @@ class RailPlotter(Configurable, DynamicClass):
 
     @classmethod
     def _validate_inputs(cls, **kwargs: Any) -> None:
-        cls.input_type.validate_inputs(**kwargs)
+        cls.input_type.validate_data(kwargs)
 
     def _make_plots(
         self,
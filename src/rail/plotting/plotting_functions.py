@@ -1,5 +1,9 @@
+from typing import Any
+
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.collections import QuadMesh
 from matplotlib.figure import Figure
 
 
@@ -42,6 +46,133 @@ def get_subplot_nrow_ncol(nfig: int) -> tuple[int, int]:
         ) from None
 
 
+# Number of objects histogrammed at a time, small enough that the temporary
+# arrays fit in the L2 cache
+_HIST_CHUNK_SIZE = 262144
+
+
+def _is_uniform(edges: np.ndarray) -> bool:
+    """Check if bin edges are increasing and uniformly spaced"""
+    step = (edges[-1] - edges[0]) / (edges.size - 1)
+    return bool(step > 0 and np.allclose(np.diff(edges), step))
+
+
+def _uniform_bin_indices(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Find the bin each of the values falls into, for uniformly spaced bins
+
+    All the values must be inside the bins.  As with np.histogram, the last
+    bin includes its upper edge.
+    """
+    nbins = edges.size - 1
+    indices = ((values - edges[0]) * (nbins / (edges[-1] - edges[0]))).astype(np.intp)
+    np.minimum(indices, nbins - 1, out=indices)
+    # Fix up values right at a bin edge where the rescaling rounded the wrong
+    # way, this is what np.histogram does for its own uniform bins
+    indices[values < edges[indices]] -= 1
+    indices[(values >= edges[indices + 1]) & (indices != nbins - 1)] += 1
+    return indices
+
+
+def histogram2d(
+    x: np.ndarray,
+    y: np.ndarray,
+    bins: tuple[int | np.ndarray, int | np.ndarray] = (100, 100),
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """2D histogram of data, same as np.histogram2d, but faster for uniform bins
+
+    For uniform bins the bin can be computed directly from each value, so
+    this is a rescale and a single np.bincount of the flattened bin index,
+    rather than the binary search that np.histogram2d does on the bin edges.
+
+    Parameters
+    ----------
+    x:
+        Input data for the first axis
+
+    y:
+        Input data for the second axis
+
+    bins:
+        Number of bins, or bin edges, for each axis
+
+    Returns
+    -------
+    Histogram counts and bin edges, as (counts, xedges, yedges)
+    """
+    return feature_target_histograms2d(y[:, np.newaxis], x, bins=bins)[0]
+
+
+def feature_target_histograms2d(
+    data: np.ndarray,
+    targets: np.ndarray,
+    bins: tuple[int | np.ndarray, int | np.ndarray] = (100, 100),
+) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """2D histograms of each of the features against the targets
+
+    This is the same as calling histogram2d(targets, data[:, i], bins) for
+    each feature, but the targets are only binned once.
+
+    Parameters
+    ----------
+    data:
+        Input data [N_objects, N_features]
+
+    targets:
+        Target redshifts [N_objects]
+
+    bins:
+        Number of bins, or bin edges, for the targets and the features
+
+    Returns
+    -------
+    Histogram counts and bin edges, as (counts, xedges, yedges), for each feature
+    """
+    xedges = np.histogram_bin_edges(targets, bins=bins[0])
+    if not _is_uniform(xedges):
+        return [
+            np.histogram2d(targets, data[:, ifeature], bins=(xedges, bins[1]))
+            for ifeature in range(data.shape[-1])
+        ]
+
+    nx = xedges.size - 1
+    all_yedges = [
+        np.histogram_bin_edges(data[:, ifeature], bins=bins[1])
+        for ifeature in range(data.shape[-1])
+    ]
+    uniform = [_is_uniform(yedges) for yedges in all_yedges]
+    all_counts = [
+        np.zeros(nx * (yedges.size - 1), dtype=np.intp) for yedges in all_yedges
+    ]
+
+    # Work through the objects in chunks, so that the temporary index
+    # arrays stay in cache, rather than streaming them through memory
+    for start in range(0, targets.size, _HIST_CHUNK_SIZE):
+        stop = start + _HIST_CHUNK_SIZE
+        x = targets[start:stop]
+        x_in_range = (x >= xedges[0]) & (x <= xedges[-1])
+        ix = np.full(x.shape, -1, dtype=np.intp)
+        ix[x_in_range] = _uniform_bin_indices(x[x_in_range], xedges)
+        for ifeature, yedges in enumerate(all_yedges):
+            if not uniform[ifeature]:
+                continue
+            y = data[start:stop, ifeature]
+            mask = x_in_range & (y >= yedges[0]) & (y <= yedges[-1])
+            ny = yedges.size - 1
+            iy = _uniform_bin_indices(y[mask], yedges)
+            all_counts[ifeature] += np.bincount(ix[mask] * ny + iy, minlength=nx * ny)
+
+    out_list: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+    for ifeature, yedges in enumerate(all_yedges):
+        if not uniform[ifeature]:
+            out_list.append(
+                np.histogram2d(targets, data[:, ifeature], bins=(xedges, yedges))
+            )
+            continue
+        counts = all_counts[ifeature].reshape(nx, yedges.size - 1).astype(float)
+        out_list.append((counts, xedges, yedges))
+    return out_list
+
+
 def plot_feature_histograms(
     data: np.ndarray,
     labels: list[str] | None = None,
@@ -74,7 +205,9 @@ def plot_feature_histograms(
         icol = int(ifeature / ncol)
         irow = ifeature % ncol
 
-        axs[icol][irow].hist(data[:, ifeature], bins=bins)
+        # A single filled polygon looks the same as one bar per bin,
+        # but is much quicker to build and to render when saving
+        axs[icol][irow].hist(data[:, ifeature], bins=bins, histtype="stepfilled")
         if labels is not None:
             axs[icol][irow].set_xlabel(labels[ifeature])
 
@@ -95,10 +228,63 @@ def plot_true_nz(targets: np.ndarray) -> Figure:
     """
     fig = plt.figure(figsize=(8, 8))
     ax = fig.subplots(1, 1)
-    ax.hist(targets, bins=100)
+    ax.hist(targets, bins=100, histtype="stepfilled")
     return fig
 
 
+def _draw_hist2d(
+    ax: Axes,
+    counts: np.ndarray,
+    xedges: np.ndarray,
+    yedges: np.ndarray,
+    **kwargs: Any,
+) -> QuadMesh:
+    """Draw a 2D histogram the same way as Axes.hist2d() does
+
+    The mesh is rasterized so that vector formats do not draw each quad
+    separately, kwargs are passed to Axes.pcolormesh()
+    """
+    mesh = ax.pcolormesh(xedges, yedges, counts.T, rasterized=True, **kwargs)
+    ax.set_xlim(xedges[0], xedges[-1])
+    ax.set_ylim(yedges[0], yedges[-1])
+    return mesh
+
+
+def plot_hist2d(
+    ax: Axes,
+    x: np.ndarray,
+    y: np.ndarray,
+    bins: tuple[int | np.ndarray, int | np.ndarray] = (100, 100),
+    **kwargs: Any,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, QuadMesh]:
+    """Same as ax.hist2d(x, y, bins=bins, **kwargs), but with the faster histogram2d
+
+    Parameters
+    ----------
+    ax:
+        Axes to draw the histogram on
+
+    x:
+        Input data for the first axis
+
+    y:
+        Input data for the second axis
+
+    bins:
+        Number of bins, or bin edges, for each axis
+
+    **kwargs:
+        Passed to Axes.pcolormesh(), e.g., norm or cmap
+
+    Returns
+    -------
+    Histogram counts, bin edges and the mesh, as (counts, xedges, yedges, mesh)
+    """
+    counts, xedges, yedges = histogram2d(x, y, bins=bins)
+    mesh = _draw_hist2d(ax, counts, xedges, yedges, **kwargs)
+    return counts, xedges, yedges, mesh
+
+
 def plot_feature_target_hist2d(
     data: np.ndarray,
     targets: np.ndarray,
@@ -135,11 +321,12 @@ def plot_feature_target_hist2d(
     nrow, ncol = get_subplot_nrow_ncol(n_features)
     axs = fig.subplots(nrow, ncol)
 
-    for ifeature in range(n_features):
+    hists = feature_target_histograms2d(data, targets, bins=bins)
+    for ifeature, (counts, xedges, yedges) in enumerate(hists):
         icol = int(ifeature / ncol)
         irow = ifeature % ncol
 
-        axs[icol][irow].hist2d(targets, data[:, ifeature], bins=bins)
+        _draw_hist2d(axs[icol][irow], counts, xedges, yedges)
         if labels is not None:
             axs[icol][irow].set_xlabel(labels[ifeature])
 
@@ -164,7 +351,9 @@ def plot_colors_v_redshifts_with_templates(
     for icolor in range(n_colors):
         icol = int(icolor / ncol)
         irow = icolor % ncol
-        axs[icol][irow].scatter(redshifts, color_data[:, icolor], color="black", s=1)
+        axs[icol][irow].scatter(
+            redshifts, color_data[:, icolor], color="black", s=1, rasterized=True
+        )
         axs[icol][irow].set_xlim(0, zmax)
         axs[icol][irow].set_ylim(-3.0, 3.0)
         if templates is not None:
@@ -208,7 +397,11 @@ def plot_colors_v_colors_with_templates(
             if irow < icol:
                 continue
             axs[icol][irow].scatter(
-                color_data[:, icol], color_data[:, irow + 1], color="black", s=1
+                color_data[:, icol],
+                color_data[:, irow + 1],
+                color="black",
+                s=1,
+                rasterized=True,
             )
 
             if templates is not None:
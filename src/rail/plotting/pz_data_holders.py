@@ -94,7 +94,7 @@ class RailPZPointEstimateDataHolder(RailDatasetHolder):
             tag=self.config.tag,
             algo=self.config.algo,
         )
-        self._validate_extractor_inputs(**the_extractor_inputs)
+        self._validate_extractor_inputs(the_extractor_inputs)
         return the_extractor_inputs
 
     @classmethod
@@ -265,7 +265,7 @@ class RailPZMultiPointEstimateDataHolder(RailDatasetHolder):
         the_extractor_inputs = dict(
             datasets=self._datasets,
         )
-        self._validate_extractor_inputs(**the_extractor_inputs)
+        self._validate_extractor_inputs(the_extractor_inputs)
         return the_extractor_inputs
 
 
@@ -340,7 +340,7 @@ class RailPZPdfDataHolder(RailDatasetHolder):
             tag=self.config.tag,
             algo=self.config.algo,
         )
-        self._validate_extractor_inputs(**the_extractor_inputs)
+        self._validate_extractor_inputs(the_extractor_inputs)
         return the_extractor_inputs
 
     @classmethod
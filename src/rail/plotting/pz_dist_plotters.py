@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import os
 from typing import Any
 
 import numpy as np
@@ -68,28 +67,16 @@ class PZPlotterPITProb(RailPlotter):
         )
 
     def _make_plots(self, prefix: str, **kwargs: Any) -> dict[str, RailPlotHolder]:
-        find_only = kwargs.get("find_only", False)
-        figtype = kwargs.get("figtype", "png")
         dataset_holder = kwargs.get("dataset_holder")
         out_dict: dict[str, RailPlotHolder] = {}
         truth: np.ndarray = kwargs["truth"]
         pz: np.ndarray = kwargs["pz"]
-        if find_only:
-            plot_name = self._make_full_plot_name(prefix, "")
-            assert dataset_holder
-            plot = RailPlotHolder(
-                name=plot_name,
-                path=os.path.join(dataset_holder.config.name, f"{plot_name}.{figtype}"),
-                plotter=self,
-                dataset_holder=dataset_holder,
-            )
-        else:
-            plot = self._make_prob_plot(
-                prefix=prefix,
-                truth=truth,
-                pz=pz,
-                dataset_holder=dataset_holder,
-            )
+        plot = self._make_prob_plot(
+            prefix=prefix,
+            truth=truth,
+            pz=pz,
+            dataset_holder=dataset_holder,
+        )
         out_dict[plot.name] = plot
         return out_dict
 
@@ -159,27 +146,15 @@ class PZPlotterPITQQ(RailPlotter):
         )
 
     def _make_plots(self, prefix: str, **kwargs: Any) -> dict[str, RailPlotHolder]:
-        find_only = kwargs.get("find_only", False)
-        figtype = kwargs.get("figtype", "png")
         dataset_holder = kwargs.get("dataset_holder")
         out_dict: dict[str, RailPlotHolder] = {}
         truth: np.ndarray = kwargs["truth"]
         pz: np.ndarray = kwargs["pz"]
-        if find_only:
-            plot_name = self._make_full_plot_name(prefix, "")
-            assert dataset_holder
-            plot = RailPlotHolder(
-                name=plot_name,
-                path=os.path.join(dataset_holder.config.name, f"{plot_name}.{figtype}"),
-                plotter=self,
-                dataset_holder=dataset_holder,
-            )
-        else:
-            plot = self._make_pit_qq_plot(
-                prefix=prefix,
-                truth=truth,
-                pz=pz,
-                dataset_holder=dataset_holder,
-            )
+        plot = self._make_pit_qq_plot(
+            prefix=prefix,
+            truth=truth,
+            pz=pz,
+            dataset_holder=dataset_holder,
+        )
         out_dict[plot.name] = plot
         return out_dict
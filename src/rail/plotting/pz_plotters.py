@@ -1,21 +1,56 @@
 from __future__ import annotations
 
-import os
 from typing import Any
 
 import numpy as np
-from astropy.stats import biweight_location, biweight_scale
 from ceci.config import StageParameter
 from matplotlib import colors
 from matplotlib import pyplot as plt
 from scipy.stats import sigmaclip
 
+from . import plotting_functions
 from .dataset import RailDataset
 from .dataset_holder import RailDatasetHolder
 from .plot_holder import RailPlotHolder
 from .plotter import RailPlotter
 
 
+# The percentiles of dz reported by the biweight statistics plotters
+_DZ_PERCENTILES = [2.5, 16.0, 50.0, 84.0, 97.5]
+
+
+def _split_by_bin(
+    values: np.ndarray,
+    bin_indices: np.ndarray,
+    n_bins: int,
+) -> list[np.ndarray]:
+    """Split values by bin index
+
+    This sorts the values by bin once, rather than masking the
+    full array for each bin
+
+    Parameters
+    ----------
+    values:
+        Values to split
+
+    bin_indices:
+        Bin index of each value, values outside [0, n_bins) are dropped
+
+    n_bins:
+        Number of bins
+
+    Returns
+    -------
+    list[np.ndarray]:
+        The values in each bin, in their original order
+    """
+    order = np.argsort(bin_indices, kind="stable")
+    bounds = np.searchsorted(bin_indices[order], np.arange(n_bins + 1))
+    sorted_values = values[order]
+    return [sorted_values[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+
 class RailPZPointEstimateDataset(RailDataset):
     """Dataet to hold a vector p(z) point estimates and corresponding
     true redshifts
@@ -76,7 +111,8 @@ class PZPlotterPointEstimateVsTrueHist2D(RailPlotter):
             round(outlier_rate, 4),
             round(abs_outlier_rate, 4),
         )
-        h = axes.hist2d(
+        h = plotting_functions.plot_hist2d(
+            axes,
             truth,
             pointEstimate,
             bins=(bin_edges, bin_edges),
@@ -139,43 +175,32 @@ class PZPlotterPointEstimateVsTrueHist2D(RailPlotter):
         )
 
     def _make_plots(self, prefix: str, **kwargs: Any) -> dict[str, RailPlotHolder]:
-        find_only = kwargs.get("find_only", False)
-        figtype = kwargs.get("figtype", "png")
         dataset_holder = kwargs.get("dataset_holder")
         out_dict: dict[str, RailPlotHolder] = {}
         truth: np.ndarray = kwargs["truth"]
         pointEstimate: np.ndarray = kwargs["pointEstimate"]
-        if find_only:
-            plot_name = self._make_full_plot_name(prefix, "")
-            assert dataset_holder
-            plot = RailPlotHolder(
-                name=plot_name,
-                path=os.path.join(dataset_holder.config.name, f"{plot_name}.{figtype}"),
-                plotter=self,
-                dataset_holder=dataset_holder,
-            )
-        else:
-            plot = self._make_2d_hist_plot(
-                prefix=prefix,
-                truth=truth,
-                pointEstimate=pointEstimate,
-                dataset_holder=dataset_holder,
-            )
+        plot = self._make_2d_hist_plot(
+            prefix=prefix,
+            truth=truth,
+            pointEstimate=pointEstimate,
+            dataset_holder=dataset_holder,
+        )
         out_dict[plot.name] = plot
         return out_dict
 
     def get_biweight_mean_sigma_outlier(
         self, subset: np.ndarray, nclip: int = 3
     ) -> tuple[float, float, float, float, float]:
+        # astropy is slow to import, so only do it when making these plots
+        from astropy.stats import biweight_location, biweight_scale
+
         subset_clip, _, _ = sigmaclip(subset, low=3, high=3)
         for _j in range(nclip):
             subset_clip, _, _ = sigmaclip(subset_clip, low=3, high=3)
 
         mean = biweight_location(subset_clip)
         std = biweight_scale(subset_clip)
-        outlier_rate = np.sum(np.abs(subset) > 3 * biweight_scale(subset_clip)) / len(
-            subset
-        )
+        outlier_rate = np.sum(np.abs(subset) > 3 * std) / len(subset)
         abs_outlier_rate = np.sum(np.abs(subset) > self.config.abs_out_thresh) / len(
             subset
         )
@@ -239,28 +264,16 @@ class PZPlotterPointEstimateVsTrueProfile(RailPlotter):
         )
 
     def _make_plots(self, prefix: str, **kwargs: Any) -> dict[str, RailPlotHolder]:
-        find_only = kwargs.get("find_only", False)
-        figtype = kwargs.get("figtype", "png")
         dataset_holder = kwargs.get("dataset_holder")
         out_dict: dict[str, RailPlotHolder] = {}
         truth: np.ndarray = kwargs["truth"]
         pointEstimate: np.ndarray = kwargs["pointEstimate"]
-        if find_only:
-            assert dataset_holder
-            plot_name = self._make_full_plot_name(prefix, "")
-            plot = RailPlotHolder(
-                name=plot_name,
-                path=os.path.join(dataset_holder.config.name, f"{plot_name}.{figtype}"),
-                plotter=self,
-                dataset_holder=dataset_holder,
-            )
-        else:
-            plot = self._make_2d_profile_plot(
-                prefix=prefix,
-                truth=truth,
-                pointEstimate=pointEstimate,
-                dataset_holder=dataset_holder,
-            )
+        plot = self._make_2d_profile_plot(
+            prefix=prefix,
+            truth=truth,
+            pointEstimate=pointEstimate,
+            dataset_holder=dataset_holder,
+        )
         out_dict[plot.name] = plot
         return out_dict
 
@@ -319,21 +332,8 @@ class PZPlotterAccuraciesVsTrue(RailPlotter):
         )
 
     def _make_plots(self, prefix: str, **kwargs: Any) -> dict[str, RailPlotHolder]:
-        find_only = kwargs.get("find_only", False)
-        figtype = kwargs.get("figtype", "png")
-        dataset_holder = kwargs.get("dataset_holder")
         out_dict: dict[str, RailPlotHolder] = {}
-        if find_only:
-            plot_name = self._make_full_plot_name(prefix, "")
-            assert dataset_holder
-            plot = RailPlotHolder(
-                name=plot_name,
-                path=os.path.join(dataset_holder.config.name, f"{plot_name}.{figtype}"),
-                plotter=self,
-                dataset_holder=dataset_holder,
-            )
-        else:
-            plot = self._make_accuracy_plot(prefix=prefix, **kwargs)
+        plot = self._make_accuracy_plot(prefix=prefix, **kwargs)
         out_dict[plot.name] = plot
         return out_dict
 
@@ -413,7 +413,8 @@ class PZPlotterBiweightStatsVsRedshift(RailPlotter):
         bin_edges_z = np.linspace(self.config.z_min, self.config.z_max, 100 + 1)
         bin_edges_dz = np.linspace(np.min(dz), np.max(dz), 100 + 1)
 
-        axes[1].hist2d(
+        plotting_functions.plot_hist2d(
+            axes[1],
             z_x,
             dz,
             bins=(bin_edges_z, bin_edges_dz),
@@ -439,28 +440,16 @@ class PZPlotterBiweightStatsVsRedshift(RailPlotter):
         )
 
     def _make_plots(self, prefix: str, **kwargs: Any) -> dict[str, RailPlotHolder]:
-        find_only = kwargs.get("find_only", False)
-        figtype = kwargs.get("figtype", "png")
         dataset_holder = kwargs.get("dataset_holder")
         out_dict: dict[str, RailPlotHolder] = {}
         truth: np.ndarray = kwargs["truth"]
         pointEstimate: np.ndarray = kwargs["pointEstimate"]
-        if find_only:
-            plot_name = self._make_full_plot_name(prefix, "")
-            assert dataset_holder
-            plot = RailPlotHolder(
-                name=plot_name,
-                path=os.path.join(dataset_holder.config.name, f"{plot_name}.{figtype}"),
-                plotter=self,
-                dataset_holder=dataset_holder,
-            )
-        else:
-            plot = self._make_biweight_stats_plot(
-                prefix=prefix,
-                truth=truth,
-                pointEstimate=pointEstimate,
-                dataset_holder=dataset_holder,
-            )
+        plot = self._make_biweight_stats_plot(
+            prefix=prefix,
+            truth=truth,
+            pointEstimate=pointEstimate,
+            dataset_holder=dataset_holder,
+        )
         out_dict[plot.name] = plot
         return out_dict
 
@@ -473,6 +462,8 @@ class PZPlotterBiweightStatsVsRedshift(RailPlotter):
         nclip: int = 3,
         nbin: int = 101,
     ) -> dict[str, list[float]]:
+        from astropy.stats import biweight_location, biweight_scale
+
         dz = (zphot - specz) / (1 + specz)
 
         z_bins = np.linspace(low, high, nbin)
@@ -493,30 +484,31 @@ class PZPlotterBiweightStatsVsRedshift(RailPlotter):
         median: list[float] = []
         qt_68_high: list[float] = []
         qt_95_high: list[float] = []
-        for i in range(len(z_bins) - 1):
-            subset = dz[bin_indices == i]
+        dz_by_bin = _split_by_bin(dz, bin_indices, len(z_bins) - 1)
+        zx_by_bin = _split_by_bin(zx, bin_indices, len(z_bins) - 1)
+        for subset, zx_subset in zip(dz_by_bin, zx_by_bin):
             if len(subset) < 1:  # pragma: no cover
                 continue
             subset_clip, _, _ = sigmaclip(subset, low=3, high=3)
             for _j in range(nclip):
                 subset_clip, _, _ = sigmaclip(subset_clip, low=3, high=3)
 
+            scale = biweight_scale(subset_clip)
             biweight_mean.append(biweight_location(subset_clip))
-            biweight_std.append(biweight_scale(subset_clip) / np.sqrt(len(subset_clip)))
-            biweight_sigma.append(biweight_scale(subset_clip))
+            biweight_std.append(scale / np.sqrt(len(subset_clip)))
+            biweight_sigma.append(scale)
 
-            outlier_rate = np.sum(
-                np.abs(subset) > 3 * biweight_scale(subset_clip)
-            ) / len(subset)
+            outlier_rate = np.sum(np.abs(subset) > 3 * scale) / len(subset)
             biweight_outlier.append(outlier_rate)
 
-            qt_95_low.append(np.percentile(subset, 2.5))
-            qt_68_low.append(np.percentile(subset, 16))
-            median.append(np.percentile(subset, 50))
-            qt_68_high.append(np.percentile(subset, 84))
-            qt_95_high.append(np.percentile(subset, 97.5))
+            percentiles = np.percentile(subset, _DZ_PERCENTILES)
+            qt_95_low.append(percentiles[0])
+            qt_68_low.append(percentiles[1])
+            median.append(percentiles[2])
+            qt_68_high.append(percentiles[3])
+            qt_95_high.append(percentiles[4])
 
-            z_mean.append(np.mean(zx[bin_indices == i]))
+            z_mean.append(np.mean(zx_subset))
 
         return {
             "z_mean": np.array(z_mean),
@@ -598,7 +590,8 @@ class PZPlotterBiweightStatsVsMag(RailPlotter):
 
         bin_edges_mag = np.linspace(self.config.mag_min, self.config.mag_max, 100 + 1)
         bin_edges_dz = np.linspace(np.min(dz), np.max(dz), 100 + 1)
-        axes[1].hist2d(
+        plotting_functions.plot_hist2d(
+            axes[1],
             magnitude,
             dz,
             bins=(bin_edges_mag, bin_edges_dz),
@@ -626,30 +619,18 @@ class PZPlotterBiweightStatsVsMag(RailPlotter):
         )
 
     def _make_plots(self, prefix: str, **kwargs: Any) -> dict[str, RailPlotHolder]:
-        find_only = kwargs.get("find_only", False)
-        figtype = kwargs.get("figtype", "png")
         dataset_holder = kwargs.get("dataset_holder")
         out_dict: dict[str, RailPlotHolder] = {}
         truth: np.ndarray = kwargs["truth"]
         pointEstimate: np.ndarray = kwargs["pointEstimate"]
         magnitude: np.ndarray = kwargs["magnitude"]
-        if find_only:
-            plot_name = self._make_full_plot_name(prefix, "")
-            assert dataset_holder
-            plot = RailPlotHolder(
-                name=plot_name,
-                path=os.path.join(dataset_holder.config.name, f"{plot_name}.{figtype}"),
-                plotter=self,
-                dataset_holder=dataset_holder,
-            )
-        else:
-            plot = self._make_biweight_stats_plot(
-                prefix=prefix,
-                truth=truth,
-                pointEstimate=pointEstimate,
-                magnitude=magnitude,
-                dataset_holder=dataset_holder,
-            )
+        plot = self._make_biweight_stats_plot(
+            prefix=prefix,
+            truth=truth,
+            pointEstimate=pointEstimate,
+            magnitude=magnitude,
+            dataset_holder=dataset_holder,
+        )
         out_dict[plot.name] = plot
         return out_dict
 
@@ -663,6 +644,8 @@ class PZPlotterBiweightStatsVsMag(RailPlotter):
         nclip: int = 3,
         nbin: int = 101,
     ) -> dict[str, list[float] | np.ndarray]:
+        from astropy.stats import biweight_location, biweight_scale
+
         dz = (zphot - specz) / (1 + specz)
 
         mag_bins = np.linspace(low, high, nbin)
@@ -679,8 +662,7 @@ class PZPlotterBiweightStatsVsMag(RailPlotter):
         median: list[float] = []
         qt_68_high: list[float] = []
         qt_95_high: list[float] = []
-        for i in range(len(mag_bins) - 1):
-            subset = dz[bin_indices == i]
+        for subset in _split_by_bin(dz, bin_indices, len(mag_bins) - 1):
             subset_clip, _, _ = sigmaclip(subset, low=3, high=3)
             for _j in range(nclip):
                 subset_clip, _, _ = sigmaclip(subset_clip, low=3, high=3)
@@ -697,20 +679,20 @@ class PZPlotterBiweightStatsVsMag(RailPlotter):
                 qt_95_high.append(np.nan)
                 continue
 
+            scale = biweight_scale(subset_clip)
             biweight_mean.append(biweight_location(subset_clip))
-            biweight_std.append(biweight_scale(subset_clip) / np.sqrt(len(subset_clip)))
-            biweight_sigma.append(biweight_scale(subset_clip))
+            biweight_std.append(scale / np.sqrt(len(subset_clip)))
+            biweight_sigma.append(scale)
 
-            outlier_rate = np.sum(
-                np.abs(subset) > 3 * biweight_scale(subset_clip)
-            ) / len(subset)
+            outlier_rate = np.sum(np.abs(subset) > 3 * scale) / len(subset)
             biweight_outlier.append(outlier_rate)
 
-            qt_95_low.append(np.percentile(subset, 2.5))
-            qt_68_low.append(np.percentile(subset, 16))
-            median.append(np.percentile(subset, 50))
-            qt_68_high.append(np.percentile(subset, 84))
-            qt_95_high.append(np.percentile(subset, 97.5))
+            percentiles = np.percentile(subset, _DZ_PERCENTILES)
+            qt_95_low.append(percentiles[0])
+            qt_68_low.append(percentiles[1])
+            median.append(percentiles[2])
+            qt_68_high.append(percentiles[3])
+            qt_95_high.append(percentiles[4])
 
         mag_mean = (mag_bins[:-1] + mag_bins[1:]) / 2
 
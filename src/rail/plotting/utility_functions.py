@@ -3,8 +3,6 @@ from typing import Any
 import numpy as np
 from pathlib import Path
 
-from rail.utils.path_utils import find_rail_file
-
 
 def make_band_names(template: str, bands: list[str]) -> list[str]:
     """Make a set of band names from template and a list of bands
@@ -117,9 +115,9 @@ def adjacent_band_colors(mags: np.ndarray) -> np.ndarray:
     -------
     Output colors
     """
-    n_bands = mags.shape[-1]
-    colors = [mags[:, i] - mags[:, i + 1] for i in range(n_bands - 1)]
-    return np.vstack(colors).T
+    # One vectorized subtraction, in Fortran order so that each color is
+    # contiguous in memory, as the plotting functions use one color at a time
+    return np.subtract(mags[:, :-1], mags[:, 1:], order="F")
 
 
 def build_template_dict(
@@ -140,6 +138,9 @@ def build_template_dict(
     Dict mapping sed name to a tuple with
     redshifts (N), mags (N, N_filter), colors (N, N_filter-1), sed_index
     """
+    # rail.utils.path_utils imports all of rail.core
+    from rail.utils.path_utils import find_rail_file
+
     template_dict = {}
     for ised, sed in enumerate(seds):
         mag_data_list = []
@@ -1,7 +1,61 @@
 from __future__ import annotations
 
 from types import GenericAlias
-from typing import Any, get_origin
+from typing import Any, Callable, Mapping, get_origin
+
+
+def make_validator(
+    a_class: type, expected_inputs: dict
+) -> Callable[[Mapping[str, Any]], None]:
+    """Make a function that validates that the kwargs given to a class
+    contructor match the expected inputs
+
+    The expected types, including the origins of generic aliases such as
+    `dict[str, np.ndarray]`, are resolved once, here, rather than each time
+    inputs are validated
+
+    Parameters
+    ----------
+    a_class: type
+        Class that the inputs are given to, used in the error messages
+
+    expected_inputs: dict
+        Mapping of input name to expected type
+
+    Returns
+    -------
+    Callable[[Mapping[str, Any]], None]
+        Function that takes the inputs as a mapping, so that they do not have
+        to be unpacked into kwargs, and raises TypeError if an input is not
+        of the expected type, or KeyError if an expected input is missing
+    """
+    # (key, type to check against or None to skip the check, expected type),
+    # a tuple, as the checks are fixed once they are made
+    checks: tuple[tuple[str, type | None, Any], ...] = tuple(
+        (
+            (key, get_origin(expected_type), expected_type.__origin__)
+            if isinstance(expected_type, GenericAlias)
+            else (key, expected_type, expected_type)
+        )
+        for key, expected_type in expected_inputs.items()
+    )
+    class_name = a_class.__name__
+
+    def validator(inputs: Mapping[str, Any]) -> None:
+        for key, check_type, expected_type in checks:
+            try:
+                data = inputs[key]
+            except KeyError as missing_key:
+                raise KeyError(
+                    f"{key} not provided to {class_name} in {list(inputs.keys())}"
+                ) from missing_key
+            if check_type is not None and not isinstance(data, check_type):
+                raise TypeError(
+                    f"{key} provided to {class_name} was {type(data)}, "
+                    f"expected {expected_type}"
+                )  # pragma: no cover
+
+    return validator
 
 
 def validate_inputs(a_class: type, expected_inputs: dict, **kwargs: Any) -> None:
@@ -14,22 +68,4 @@ def validate_inputs(a_class: type, expected_inputs: dict, **kwargs: Any) -> None
 
     KeyError is a kwaags is not in the set of expected inptus
     """
-    for key, expected_type in expected_inputs.items():
-        try:
-            data = kwargs[key]
-        except KeyError as missing_key:
-            raise KeyError(
-                f"{key} not provided to {a_class.__name__} in {list(kwargs.keys())}"
-            ) from missing_key
-        if isinstance(expected_type, GenericAlias):
-            origin = get_origin(expected_type)
-            if origin is not None and not isinstance(data, origin):
-                raise TypeError(
-                    f"{key} provided to {a_class.__name__} was "
-                    f"{type(data)}, not {expected_type.__origin__}"
-                )  # pragma: no cover
-            continue  # pragma: no cover
-        if not isinstance(data, expected_type):  # pragma: no cover
-            raise TypeError(
-                f"{key} provided to {a_class.__name__} was {type(data)}, expected {expected_type}"
-            )
+    make_validator(a_class, expected_inputs)(kwargs)
@@ -5,8 +5,35 @@ while also quickly testing many analysis variants with slight configuration
 modifications.
 """
 
-from . import library, name_utils
-from .project import RailFlavor, RailProject
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import library, name_utils
+    from .project import RailFlavor, RailProject
 
 
 __all__ = ["library", "name_utils", "RailFlavor", "RailProject"]
+
+# Where to find each of the names in __all__, these are only imported on first
+# access, so that the light-weight sub-modules (e.g., execution) can be used
+# without paying for importing the full project machinery
+_LAZY_IMPORTS: dict[str, tuple[str, str | None]] = {
+    "library": (".library", None),
+    "name_utils": (".name_utils", None),
+    "RailFlavor": (".project", "RailFlavor"),
+    "RailProject": (".project", "RailProject"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr_name = _LAZY_IMPORTS[name]
+    except KeyError as missing_key:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from missing_key
+    mod = importlib.import_module(module_name, __name__)
+    value = mod if attr_name is None else getattr(mod, attr_name)
+    globals()[name] = value
+    return value
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import os
 
-import yaml
 from rail.core.factory_mixin import RailFactoryMixin
 
+from . import yaml_utils
 from .algorithm_holder import (
     RailAlgorithmHolder,
     RailClassificationAlgorithmHolder,
@@ -131,7 +131,7 @@ class RailAlgorithmFactory(RailFactoryMixin):
 
     def load_instance_yaml(self, yaml_file: str) -> None:
         with open(os.path.expandvars(yaml_file), encoding="utf-8") as fin:
-            yaml_data = yaml.safe_load(fin)
+            yaml_data = yaml_utils.safe_load(fin)
 
         for yaml_item_key, yaml_item_value in yaml_data.items():
             if yaml_item_key in ALGORITHM_TYPES:
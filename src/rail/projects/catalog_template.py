@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import itertools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from ceci.config import StageParameter
 from rail.core.configurable import Configurable
 
+# Maximum number of threads used to check if the files in a catalog exist
+_MAX_STAT_WORKERS = 32
+
 
 class RailProjectCatalogInstance(Configurable):
     """Simple class for holding information need to make a coherent catalog
@@ -108,10 +112,16 @@ class RailProjectCatalogInstance(Configurable):
         if self._file_exists is not None:
             if not update:
                 return self._file_exists
-        self._file_exists = []
-        the_files = self.resolve(**kwargs)
-        for file_ in the_files:
-            self._file_exists.append(os.path.exists(os.path.expandvars(file_)))
+        the_files = [os.path.expandvars(file_) for file_ in self.resolve(**kwargs)]
+        if len(the_files) <= 1:
+            self._file_exists = [os.path.exists(file_) for file_ in the_files]
+            return self._file_exists
+        # Catalogs can have many files, often on network file systems, where
+        # each stat call is slow, but doesn't hold the GIL, so overlap them
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_STAT_WORKERS, len(the_files))
+        ) as executor:
+            self._file_exists = list(executor.map(os.path.exists, the_files))
         return self._file_exists
 
 
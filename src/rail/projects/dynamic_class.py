@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import Any, TypeVar
 
 T = TypeVar("T", bound="DynamicClass")
@@ -72,10 +73,11 @@ class DynamicClass:
         type:
             Subclass in question
         """
-        tokens = class_name.split(".")
-        module = ".".join(tokens[:-1])
-        key = tokens[-1]
-        __import__(module)
+        module, _, key = class_name.rpartition(".")
+        # Importing the module registers the class, so if the module is
+        # already loaded there is nothing to import
+        if module not in sys.modules:
+            __import__(module)
         sub_class = cls.get_sub_class(key)
         assert issubclass(sub_class, cls)
         return sub_class
@@ -104,8 +106,7 @@ class DynamicClass:
         """
         copy_config = config_dict.copy()
         class_name = copy_config.pop("class_name")
-        tokens = class_name.split(".")
-        key = tokens[-1]
+        key = class_name.rpartition(".")[2]
         sub_class = cls.get_sub_class(key, class_name)
         assert issubclass(sub_class, cls)
         return sub_class(**copy_config)
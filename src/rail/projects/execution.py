@@ -1,11 +1,16 @@
 """Functions to execute pipeline and other shell commands"""
 
 import enum
+import functools
 import os
+import shutil
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import time
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping, Sequence
 
 
 class RunMode(enum.Enum):
@@ -18,44 +23,78 @@ class RunMode(enum.Enum):
 
 S3DF_SITE_CONFIG: dict[str, Any] = dict(
     slurm_batch_size=8,
-    slurm_options=[
+    slurm_options=(
         "-p=milano",
         "--account=rubin:commissioning@milano",
         "--mem=16G",
         "--parsable",
-    ],
+    ),
     srun_command="srun",
-    sbatch_commands=["sbatch"],
+    sbatch_commands=("sbatch",),
 )
 PERLMUTTER_SITE_CONFIG: dict[str, Any] = dict(
     slurm_batch_size=32,
-    slurm_options=[
+    slurm_options=(
         "--account=m1727",
         "--constraint=cpu",
         "--qos=regular",
         "--parsable",
-    ],
+    ),
     srun_command="srun",
-    sbatch_commands=["sbatch"],
+    sbatch_commands=("sbatch",),
 )
 TEST_SITE_CONFIG: dict[str, Any] = dict(
     slurm_batch_size=4,
-    slurm_options=[
-        "--dummy=test",
-    ],
+    slurm_options=("--dummy=test",),
     srun_command="echo 0 srun",
-    sbatch_commands=["echo", "0", "sbatch"],
+    sbatch_commands=("echo", "0", "sbatch"),
 )
 
-DEFAULT_SITE_CONFIGS: dict[str, dict[str, Any]] = dict(
-    test=TEST_SITE_CONFIG,
-    perlmutter=PERLMUTTER_SITE_CONFIG,
-    s3df=S3DF_SITE_CONFIG,
+# Read-only, so that one project can't change the defaults for everyone else
+DEFAULT_SITE_CONFIGS: Mapping[str, dict[str, Any]] = MappingProxyType(
+    dict(
+        test=TEST_SITE_CONFIG,
+        perlmutter=PERLMUTTER_SITE_CONFIG,
+        s3df=S3DF_SITE_CONFIG,
+    )
 )
 
 BASH_LINE = "#!/usr/bin/bash"
 
 
+@functools.lru_cache
+def _which(command: str, path: str | None) -> str | None:
+    return shutil.which(command, path=path)
+
+
+def _run_subprocess(command_line: list[str]) -> int:
+    """Run a command and wait for it to finish
+
+    This sets things up so that subprocess can start the command with
+    posix_spawn, rather than fork + exec, which copies the page tables of
+    this, potentially large, python process.  That needs the full path to
+    the executable and close_fds=False.  The latter is safe since python
+    opens files as non-inheritable.
+
+    Parameters
+    ----------
+    command_line:
+        Tokens in the command line
+
+    Returns
+    -------
+    int:
+        Status returned by the command.  0 for success, exit code otherwise
+    """
+    executable = command_line[0]
+    if not os.path.dirname(executable):
+        executable = _which(executable, os.environ.get("PATH")) or executable
+    finished = subprocess.run(
+        command_line, executable=executable, close_fds=False, check=False
+    )
+    return finished.returncode
+
+
 def handle_command(
     run_mode: RunMode,
     command_line: list[str],
@@ -75,16 +114,20 @@ def handle_command(
     int:
         Status returned by the command.  0 for success, exit code otherwise
     """
-    print("subprocess:", *command_line)
-    _start_time = time.time()
-    print(">>>>>>>>")
+    # Each block of output goes out in a single write, so that the output of
+    # commands run from different threads doesn't get interleaved
+    header = f"subprocess: {' '.join(command_line)}\n>>>>>>>>\n"
+    _start_time = time.perf_counter()
     if run_mode == RunMode.dry_run:
-        # print(command_line)
-        command_line.insert(0, "echo")
-        finished = subprocess.run(command_line, check=False)
+        # Same output as running echo, without starting a process to do it
+        header += f"{' '.join(command_line)}\n"
+        returncode = 0
     elif run_mode == RunMode.bash:  # pragma: no cover
-        # return os.system(command_line)
-        finished = subprocess.run(command_line, check=False)
+        # The command writes to the same stdout, so the header has to go first
+        sys.stdout.write(header)
+        sys.stdout.flush()
+        header = ""
+        returncode = _run_subprocess(command_line)
     elif run_mode == RunMode.slurm:  # pragma: no cover
         raise RuntimeError(
             "handle_command should not be called with run_mode == RunMode.slurm"
@@ -92,11 +135,12 @@ def handle_command(
     else:  # pragma: no cover
         raise AssertionError(f"Unknown run mode {run_mode}")
 
-    returncode = finished.returncode
-    _end_time = time.time()
-    _elapsed_time = _end_time - _start_time
-    print("<<<<<<<<")
-    print(f"subprocess completed with status {returncode} in {_elapsed_time} seconds\n")
+    _elapsed_time = time.perf_counter() - _start_time
+    sys.stdout.write(
+        f"{header}<<<<<<<<\n"
+        f"subprocess completed with status {returncode} "
+        f"in {_elapsed_time:.3f} seconds\n\n"
+    )
     return returncode
 
 
@@ -131,6 +175,17 @@ def handle_commands(
     )
 
 
+def _handle_commands_or_report(
+    run_mode: RunMode,
+    command_lines: list[list[str]],
+) -> int:  # pragma: no cover
+    try:
+        return handle_commands(run_mode, command_lines)
+    except Exception as msg:
+        print(msg)
+        return 1
+
+
 def write_run_script(
     command_lines: list[list[str]],
     script_path: Path,
@@ -145,24 +200,19 @@ def write_run_script(
     script_path:
         Path to write the script to
     """
-    try:
-        os.makedirs(os.path.dirname(script_path))
-    except FileExistsError:
-        pass
-
-    contents = f"{BASH_LINE}\n\n"
-    for command_ in command_lines:
-        com_line = " ".join(command_)
-        contents += f"{com_line}\n"
-    contents += "echo Done!\n"
-    script_path.write_text(contents)
+    script_path.parent.mkdir(parents=True, exist_ok=True)
+
+    lines = [BASH_LINE, ""]
+    lines += [" ".join(command_) for command_ in command_lines]
+    lines.append("echo Done!\n")
+    script_path.write_text("\n".join(lines))
     script_path.chmod(0o755)
 
 
 def write_submit_script(
     scripts_in_batch: list[str],
     batch_submit_script: Path,
-    slurm_options: list[str],
+    slurm_options: Sequence[str],
     exec_command: str = "srun",
 ) -> None:  # pragma: no cover
     """Write a script to run multiple commands
@@ -181,47 +231,48 @@ def write_submit_script(
     exec_commands:
         Command used to execute commands
     """
-    try:
-        os.makedirs(os.path.dirname(batch_submit_script))
-    except FileExistsError:
-        pass
-
-    contents = f"{BASH_LINE}\n\n"
-    for opt_ in slurm_options:
-        contents += f"#SBATCH {opt_}\n"
-
-    for script_ in scripts_in_batch:
-        contents += f"{exec_command} {script_}\n"
+    batch_submit_script.parent.mkdir(parents=True, exist_ok=True)
 
-    contents += "echo Done!\n"
-    batch_submit_script.write_text(contents)
+    lines = [BASH_LINE, ""]
+    lines += [f"#SBATCH {opt_}" for opt_ in slurm_options]
+    lines += [f"{exec_command} {script_}" for script_ in scripts_in_batch]
+    lines.append("echo Done!\n")
+    batch_submit_script.write_text("\n".join(lines))
     batch_submit_script.chmod(0o755)
 
 
 def submit_slurm_job(
     script_path: Path | str,
-    sbatch_commands: list[str],
+    sbatch_commands: Sequence[str],
 ) -> str:
     """Submit a SLURM job and return the job ID."""
     result = subprocess.run(
-        sbatch_commands + [str(script_path)],
+        [*sbatch_commands, str(script_path)],
         capture_output=True,
         text=True,
         check=False,
     )
 
     if result.returncode == 0:
-        # Parse job ID from output like "Submitted batch job 12345"
-        job_id = result.stdout.strip().split()[-1]
-        return job_id
+        return _parse_job_id(result.stdout)
     raise RuntimeError(f"SLURM submission failed: {result.stderr}")
 
 
+def _parse_job_id(sbatch_output: str) -> str:
+    # The job ID is on the first line, either as "Submitted batch job 12345",
+    # or, with --parsable, as "12345" or "12345;cluster"
+    first_line = sbatch_output.lstrip().partition("\n")[0]
+    if first_line.startswith("Submitted batch job"):
+        return first_line.split()[-1]
+    return first_line.split(";", 1)[0].split()[0]
+
+
 def handle_all_commands(
     run_mode: RunMode,
     all_commands: list[tuple[list[list[str]], str]],
     script_path: str | None = None,
     site_config: dict[str, Any] | None = None,
+    max_workers: int = 1,
 ) -> int:  # pragma: no cover
     """Run all the commands in the mode requested
 
@@ -239,23 +290,32 @@ def handle_all_commands(
     site_config:
         Config for site we are running at
 
+    max_workers:
+        In bash mode, how many of the sets of commands to run at once.
+        Each set of commands is still run in order.
+
     Returns
     -------
     int:
         Status returned by the commands.  0 for success, exit code otherwise
     """
     if run_mode in [RunMode.dry_run, RunMode.bash]:
-        ok = 0
-        for commands_, _script_path in all_commands:
-            try:
-                handle_commands(
-                    run_mode,
-                    commands_,
-                )
-            except Exception as msg:  # pragma: no cover
-                print(msg)
-                ok |= 1
-
+        if run_mode == RunMode.dry_run or max_workers <= 1 or len(all_commands) <= 1:
+            ok = 0
+            for commands_, _script_path in all_commands:
+                ok |= _handle_commands_or_report(run_mode, commands_)
+            return ok
+
+        # The sets of commands write to separate directories, and the work is
+        # done in subprocesses, so threads are enough to run them side by side
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            statuses = executor.map(
+                lambda commands_: _handle_commands_or_report(run_mode, commands_),
+                [commands_ for commands_, _script_path in all_commands],
+            )
+            ok = 0
+            for status_ in statuses:
+                ok |= status_
         return ok
 
     # At this point we are using slurm and need a script to send to batch
@@ -265,6 +325,8 @@ def handle_all_commands(
         )
 
     assert site_config is not None
+    if site_config.get("slurm_array", False):
+        return run_array_job(all_commands, Path(script_path), site_config)
     return run_batches(all_commands, Path(script_path), site_config)
 
 
@@ -291,10 +353,15 @@ def run_batches(
     int:
         Status returned by the commands.  0 for success, exit code otherwise
     """
-    slurm_options = site_config.get("slurm_options", []).copy()
     batch_size = site_config.get("slurm_batch_size", 4)
     srun_command = site_config.get("srun_command", "srun")
-    sbatch_commands = site_config.get("sbatch_commands", ["sbatch"])
+    sbatch_commands = site_config.get("sbatch_commands", ("sbatch",))
+    # The options that are the same for every batch, only the logs differ
+    shared_slurm_options = (
+        *site_config.get("slurm_options", ()),
+        f"--ntasks={batch_size}",
+    )
+    script_template = str(script_path)
 
     job_idx = 0
     start = 0
@@ -304,9 +371,9 @@ def run_batches(
     while start < stop:
         command_batch = all_commands[start : start + batch_size]
 
-        batch_submit_script = Path(str(script_path).replace(".sh", f"_{job_idx}.sh"))
-        batch_log = Path(str(script_path).replace(".sh", f"_{job_idx}.log"))
-        batch_err_log = Path(str(script_path).replace(".sh", f"_{job_idx}.err"))
+        batch_submit_script = Path(script_template.replace(".sh", f"_{job_idx}.sh"))
+        batch_log = script_template.replace(".sh", f"_{job_idx}.log")
+        batch_err_log = script_template.replace(".sh", f"_{job_idx}.err")
         scripts_in_batch: list[str] = []
 
         for commands_, script_path_ in command_batch:
@@ -321,16 +388,18 @@ def run_batches(
                 status |= 1
 
         try:
-            slurm_options += [
+            # Each batch gets its own log files, so don't add these to the
+            # options shared by all the batches
+            batch_slurm_options = [
+                *shared_slurm_options,
                 f"--output={batch_log}",
                 f"--error={batch_err_log}",
-                f"--ntasks={batch_size}",
             ]
 
             write_submit_script(
                 scripts_in_batch,
                 batch_submit_script,
-                slurm_options,
+                batch_slurm_options,
                 srun_command,
             )
             submit_slurm_job(batch_submit_script, sbatch_commands)
@@ -342,3 +411,104 @@ def run_batches(
         job_idx += 1
 
     return status
+
+
+def write_array_submit_script(
+    scripts_in_array: list[str],
+    array_submit_script: Path,
+    slurm_options: Sequence[str],
+    exec_command: str = "srun",
+) -> None:
+    """Write a script to run multiple scripts as the tasks of a slurm job array
+
+    Parameters
+    ----------
+    scripts_in_array:
+        List of scripts we are going to run, one per array task
+
+    array_submit_script:
+        Path to write the script to
+
+    slurm_options:
+        List of options for slurm, including the --array option
+
+    exec_command:
+        Command used to execute the scripts
+    """
+    array_submit_script.parent.mkdir(parents=True, exist_ok=True)
+
+    lines = [BASH_LINE, ""]
+    lines += [f"#SBATCH {opt_}" for opt_ in slurm_options]
+    lines += ["", "SCRIPTS=("]
+    lines += [f"    {script_}" for script_ in scripts_in_array]
+    lines += [")", ""]
+    lines.append(f"{exec_command} ${{SCRIPTS[$SLURM_ARRAY_TASK_ID]}}")
+    lines.append("echo Done!\n")
+    array_submit_script.write_text("\n".join(lines))
+    array_submit_script.chmod(0o755)
+
+
+def run_array_job(
+    all_commands: list[tuple[list[list[str]], str]],
+    script_path: Path,
+    site_config: dict[str, Any],
+) -> int:
+    """Run all the commands as a single slurm job array
+
+    This submits one job, with one array task per set of commands, rather
+    than one job per slurm_batch_size sets of commands, as run_batches does.
+    slurm_batch_size limits how many of the array tasks run at once.
+
+    Parameters
+    ----------
+    all_commands:
+        List of commands lists and associated locations for scripts
+
+    script_path:
+        Path to write the slurm submit script to
+
+    site_config:
+        Which site we are running at
+
+    Returns
+    -------
+    int:
+        Status returned by the commands.  0 for success, exit code otherwise
+    """
+    batch_size = site_config.get("slurm_batch_size", 4)
+    srun_command = site_config.get("srun_command", "srun")
+    sbatch_commands = site_config.get("sbatch_commands", ("sbatch",))
+
+    status = 0
+    scripts_in_array: list[str] = []
+    for commands_, script_path_ in all_commands:
+        try:
+            write_run_script(commands_, Path(script_path_))
+            scripts_in_array.append(script_path_)
+        except Exception as msg:  # pragma: no cover
+            print(msg)
+            status |= 1
+
+    if not scripts_in_array:  # pragma: no cover
+        return status
+
+    array_log = str(script_path).replace(".sh", "_%a.log")
+    array_err_log = str(script_path).replace(".sh", "_%a.err")
+    slurm_options = [
+        *site_config.get("slurm_options", ()),
+        f"--array=0-{len(scripts_in_array) - 1}%{batch_size}",
+        f"--output={array_log}",
+        f"--error={array_err_log}",
+    ]
+    try:
+        write_array_submit_script(
+            scripts_in_array,
+            script_path,
+            slurm_options,
+            srun_command,
+        )
+        submit_slurm_job(script_path, sbatch_commands)
+    except Exception as msg:  # pragma: no cover
+        print(msg)
+        status |= 1
+    return status
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import contextlib
 import os
 import subprocess
+import sys
 import urllib.request
+from typing import IO
 
-import yaml
 from rail.core.factory_mixin import RailFactoryMixin
 
+from . import yaml_utils
 from .algorithm_factory import ALGORITHM_TYPES, RailAlgorithmFactory
 from .catalog_factory import RailCatalogFactory
 from .pipeline_factory import RailPipelineFactory
@@ -151,12 +154,19 @@ def clear() -> None:
         factory_.clear()
 
 
-def print_contents() -> None:
-    """Print the contents of the factories"""
-    for factory_ in THE_FACTORIES:
-        factory_.print_contents()
-        print("----------------")
-        print("")
+def print_contents(file: IO[str] | None = None) -> None:
+    """Print the contents of the factories
+
+    Parameters
+    ----------
+    file: IO[str] | None
+        Where to print the contents, defaults to sys.stdout
+    """
+    with contextlib.redirect_stdout(file or sys.stdout):
+        for factory_ in THE_FACTORIES:
+            factory_.print_contents()
+            print("----------------")
+            print("")
 
 
 def load_yaml(yaml_file: str) -> None:
@@ -172,8 +182,7 @@ def load_yaml(yaml_file: str) -> None:
     See class description for yaml file syntax
     """
     clear()
-    with open(os.path.expandvars(yaml_file), encoding="utf-8") as fin:
-        yaml_data = yaml.safe_load(fin)
+    yaml_data = yaml_utils.load_yaml_file(yaml_file)
 
     for yaml_key, yaml_item in yaml_data.items():
         if yaml_key == RailSelectionFactory.yaml_tag:
@@ -215,7 +224,7 @@ def write_yaml(yaml_file: str) -> None:
     for a_factory in THE_FACTORIES:
         yaml_dict.update(**a_factory.to_yaml_dict())
     with open(os.path.expandvars(yaml_file), mode="w", encoding="utf-8") as fout:
-        yaml.dump(yaml_dict, fout)
+        yaml_utils.safe_dump(yaml_dict, fout)
 
 
 def setup_project_area() -> int:  # pragma: no cover
@@ -72,17 +72,14 @@ def format_template(template: str, **kwargs: Any) -> str:
     required_interpolants = re.findall("{.*?}", template)
     interpolants = kwargs.copy()
 
-    env_interpolants = {
-        key: val
-        for key, val in os.environ.items()
-        if (key.find("PZ") == 0 or key.find("RAIL") == 0)
-    }
-    interpolants.update(**env_interpolants)
-
     for interpolant_ in required_interpolants:
-        interpolants.setdefault(
-            interpolant_.replace("}", "").replace("{", ""), interpolant_
-        )
+        key = interpolant_.replace("}", "").replace("{", "")
+        # PZ* and RAIL* environment variables take precedence, only the ones
+        # used by the template are looked up, rather than scanning os.environ
+        if key.startswith(("PZ", "RAIL")) and key in os.environ:
+            interpolants[key] = os.environ[key]
+        else:
+            interpolants.setdefault(key, interpolant_)
     return template.format(**interpolants)
 
 
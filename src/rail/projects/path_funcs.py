@@ -2,10 +2,82 @@
 
 from __future__ import annotations
 
-import glob
+import fnmatch
+import functools
 import os
+import re
+import time
+from typing import TYPE_CHECKING
 
-from rail.projects import RailProject
+if TYPE_CHECKING:
+    from rail.projects import RailProject
+
+
+@functools.lru_cache(maxsize=256)
+def _list_dir_cached(
+    dirpath: str,
+    mtime_ns: int,  # pylint: disable=unused-argument
+) -> frozenset[str]:
+    # mtime_ns is only part of the cache key, adding or removing files
+    # changes the modification time of the directory
+    return frozenset(entry_.name for entry_ in os.scandir(dirpath))
+
+
+# Directories and files that changed this recently are not cached.  On file
+# systems with coarse modification times, e.g., NFS, a change in the same tick
+# as the read would not change the modification time
+RECENT_CHANGE_NS = 2_000_000_000
+
+
+def _list_dir(dirpath: str) -> frozenset[str]:
+    """Get the names of the files in a directory
+
+    This reads each directory once, rather than globbing or checking for
+    each file, which is slow on network file systems
+    """
+    try:
+        mtime_ns = os.stat(dirpath).st_mtime_ns
+    except FileNotFoundError:
+        return frozenset()
+    if time.time_ns() - mtime_ns < RECENT_CHANGE_NS:
+        return _read_dir(dirpath)
+    return _list_dir_cached(dirpath, mtime_ns)
+
+
+def _read_dir(dirpath: str) -> frozenset[str]:
+    # Read the directory, by-passing the cached listings
+    try:
+        return frozenset(entry_.name for entry_ in os.scandir(dirpath))
+    except FileNotFoundError:
+        return frozenset()
+
+
+def _file_in_dir(dirpath: str, basename: str) -> bool:
+    """Check if a file is in a directory, using the directory listing
+
+    A file missing from the listing is checked for directly, in case the
+    cached listing is out of date, e.g., if the clocks of the file server and
+    this machine disagree
+    """
+    if basename in _list_dir(dirpath):
+        return True
+    return os.path.exists(os.path.join(dirpath, basename))
+
+
+_DIGITS_RE = re.compile(r"(\d+)")
+
+
+def _natural_sort_key(name: str) -> list[int | str]:
+    # Compare runs of digits as numbers, so that 'bin10' sorts after 'bin2'
+    return [
+        int(token_) if token_.isdigit() else token_
+        for token_ in _DIGITS_RE.split(name)
+    ]
+
+
+def clear_cache() -> None:
+    """Drop all the cached directory listings"""
+    _list_dir_cached.cache_clear()
 
 
 def get_z_true_path(
@@ -69,8 +141,51 @@ def get_ceci_pz_output_path(
     """
     outdir = project.get_path("ceci_output_dir", selection=selection, flavor=flavor)
     basename = f"output_estimate_{algo}.hdf5"
-    outpath = os.path.join(outdir, basename)
-    return outpath if os.path.exists(outpath) else None
+    if not _file_in_dir(outdir, basename):
+        return None
+    return os.path.join(outdir, basename)
+
+
+def get_ceci_pz_output_paths(
+    project: RailProject,
+    selection: str,
+    flavor: str,
+    algos: list[str],
+) -> dict[str, str]:
+    """Get the paths to the files with redshfit estimates
+    for several algorithms for a particualar analysis selection and flavor
+
+    Parameters
+    ----------
+    project: RailProject
+        Object with information about the structure of the current project
+
+    selection: str
+        Data selection in question, e.g., 'gold', or 'blended'
+
+    flavor: str
+        Analysis flavor in question, e.g., 'baseline' or 'zCosmos'
+
+    algos: list[str]
+        Algorithms we want the estimates for, e.g., ['knn', 'bpz']
+
+    Returns
+    -------
+    paths: dict[str, str]
+        Paths to the files that exist, keyed by algorithm
+    """
+    outdir = project.get_path("ceci_output_dir", selection=selection, flavor=flavor)
+    basenames = {algo_: f"output_estimate_{algo_}.hdf5" for algo_ in algos}
+    present = _list_dir(outdir)
+    if not present.issuperset(basenames.values()):
+        # Re-read the directory once, in case the cached listing is out of
+        # date, rather than checking for each missing file
+        present = _read_dir(outdir)
+    return {
+        algo_: os.path.join(outdir, basename_)
+        for algo_, basename_ in basenames.items()
+        if basename_ in present
+    }
 
 
 def get_ceci_pz_model_paths(
@@ -104,12 +219,12 @@ def get_ceci_pz_model_paths(
     """
     outdir = project.get_path("ceci_output_dir", selection=selection, flavor=flavor)
     if algo is None:
-        basepath = os.path.join(outdir, "model_inform_*.pkl")
-        paths = sorted(glob.glob(basepath))
-        return [output for output in paths if os.path.exists(output)]
+        basenames = sorted(fnmatch.filter(_list_dir(outdir), "model_inform_*.pkl"))
+        return [os.path.join(outdir, basename_) for basename_ in basenames]
     basename = f"model_inform_{algo}.pkl"
-    outpath = os.path.join(outdir, basename)
-    return [outpath] if os.path.exists(outpath) else []
+    if not _file_in_dir(outdir, basename):
+        return []
+    return [os.path.join(outdir, basename)]
 
 
 def get_ceci_nz_output_paths(
@@ -146,13 +261,14 @@ def get_ceci_nz_output_paths(
     Returns
     -------
     paths: list[str]
-        Paths to data
+        Paths to data, in order of tomographic bin
     """
     outdir = project.get_path("ceci_output_dir", selection=selection, flavor=flavor)
-    basename = f"single_NZ_summarize_{algo}_{classifier}_bin*_{summarizer}.hdf5"
-    outpath = os.path.join(outdir, basename)
-    paths = sorted(glob.glob(outpath))
-    return paths
+    pattern = f"single_NZ_summarize_{algo}_{classifier}_bin*_{summarizer}.hdf5"
+    basenames = sorted(
+        fnmatch.filter(_list_dir(outdir), pattern), key=_natural_sort_key
+    )
+    return [os.path.join(outdir, basename_) for basename_ in basenames]
 
 
 def get_ceci_true_nz_output_paths(
@@ -185,10 +301,11 @@ def get_ceci_true_nz_output_paths(
     Returns
     -------
     paths: list[str]
-        Paths to data
+        Paths to data, in order of tomographic bin
     """
     outdir = project.get_path("ceci_output_dir", selection=selection, flavor=flavor)
-    basename = f"true_NZ_true_nz_{algo}_{classifier}_bin*.hdf5"
-    outpath = os.path.join(outdir, basename)
-    paths = sorted(glob.glob(outpath))
-    return paths
+    pattern = f"true_NZ_true_nz_{algo}_{classifier}_bin*.hdf5"
+    basenames = sorted(
+        fnmatch.filter(_list_dir(outdir), pattern), key=_natural_sort_key
+    )
+    return [os.path.join(outdir, basename_) for basename_ in basenames]
@@ -1,19 +1,57 @@
 from __future__ import annotations
 
+import functools
 import os
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
-import yaml
 from ceci.config import StageParameter
 from rail.core.configurable import Configurable
 from rail.core.stage import RailPipeline
 from rail.utils import catalog_utils
 from rail.utils.catalog_tag import CatalogTag
 
+from . import yaml_utils
+
 if TYPE_CHECKING:
     from .project import RailProject
 
 
+def _get_flavor_input_files(
+    project: RailProject,
+    input_file_tags: dict[str, dict[str, str]],
+    flavor: str,
+    **kwargs: Any,
+) -> dict[str, str]:
+    """Resolve the input file templates of a pipeline for a particular flavor
+
+    Parameters
+    ----------
+    project: RailProject
+        Object with project configuration
+
+    input_file_tags: dict[str, dict[str, str]]
+        The input_file_templates of the pipeline, each template has a 'tag'
+        and optionally a 'flavor', which overrides the flavor argument
+
+    flavor: str
+        Flavor to use for the templates that do not specify one
+
+    kwargs: Any
+        Additional parameters used to resolve the file paths, e.g., selection
+
+    Returns
+    -------
+    dict[str, str]:
+        Dictionary of input file tags and paths
+    """
+    return {
+        key: project.get_file_for_flavor(
+            val.get("flavor", flavor), val["tag"], **kwargs
+        )
+        for key, val in input_file_tags.items()
+    }
+
+
 def inform_input_callback(
     project: RailProject,
     pipeline_name: str,
@@ -42,14 +80,10 @@ def inform_input_callback(
         Dictionary of input file tags and paths
     """
     pipeline_info = project.get_pipeline(pipeline_name)
-    input_files = {}
-    input_file_tags = pipeline_info["input_file_templates"]
     flavor = kwargs.pop("flavor", "baseline")
-    for key, val in input_file_tags.items():
-        input_file_flavor = val.get("flavor", flavor)
-        input_files[key] = project.get_file_for_flavor(
-            input_file_flavor, val["tag"], **kwargs
-        )
+    input_files = _get_flavor_input_files(
+        project, pipeline_info["input_file_templates"], flavor, **kwargs
+    )
     return input_files
 
 
@@ -81,14 +115,10 @@ def inform_sompz_input_callback(
         Dictionary of input file tags and paths
     """
     pipeline_info = project.get_pipeline(pipeline_name)
-    input_files = {}
-    input_file_tags = pipeline_info["input_file_templates"]
     flavor = kwargs.pop("flavor", "baseline")
-    for key, val in input_file_tags.items():
-        input_file_flavor = val.get("flavor", flavor)
-        input_files[key] = project.get_file_for_flavor(
-            input_file_flavor, val["tag"], **kwargs
-        )
+    input_files = _get_flavor_input_files(
+        project, pipeline_info["input_file_templates"], flavor, **kwargs
+    )
     return input_files
 
 
@@ -120,20 +150,13 @@ def inform_recalib_input_callback(
         Dictionary of input file tags and paths
     """
     pipeline_info = project.get_pipeline(pipeline_name)
-    input_files = {}
-    input_file_tags = pipeline_info["input_file_templates"]
     flavor = kwargs.pop("flavor", "baseline")
-    for key, val in input_file_tags.items():
-        input_file_flavor = val.get("flavor", flavor)
-        input_files[key] = project.get_file_for_flavor(
-            input_file_flavor, val["tag"], **kwargs
-        )
+    input_files = _get_flavor_input_files(
+        project, pipeline_info["input_file_templates"], flavor, **kwargs
+    )
     pdfs_dir = sink_dir
-    pz_algorithms = project.get_pzalgorithms()
-    for pz_algo_ in pz_algorithms.keys():
-        input_files[f"input_{pz_algo_}"] = os.path.join(
-            pdfs_dir, f"output_estimate_{pz_algo_}.hdf5"
-        )
+    for pz_algo_ in project.get_pzalgorithms():
+        input_files[f"input_{pz_algo_}"] = f"{pdfs_dir}/output_estimate_{pz_algo_}.hdf5"
     return input_files
 
 
@@ -165,14 +188,10 @@ def inform_somlike_input_callback(
         Dictionary of input file tags and paths
     """
     pipeline_info = project.get_pipeline(pipeline_name)
-    input_files = {}
-    input_file_tags = pipeline_info["input_file_templates"]
     flavor = kwargs.pop("flavor", "baseline")
-    for key, val in input_file_tags.items():
-        input_file_flavor = val.get("flavor", flavor)
-        input_files[key] = project.get_file_for_flavor(
-            input_file_flavor, val["tag"], **kwargs
-        )
+    input_files = _get_flavor_input_files(
+        project, pipeline_info["input_file_templates"], flavor, **kwargs
+    )
     return input_files
 
 
@@ -222,12 +241,10 @@ def estimate_input_callback(
             **kwcopy,
         )
 
-    pz_algorithms = project.get_pzalgorithms()
-    for pz_algo_ in pz_algorithms.keys():
-        input_files[f"model_{pz_algo_}"] = os.path.join(
-            project.get_path("ceci_output_dir", flavor=input_file_flavor, **kwcopy),
-            f"model_inform_{pz_algo_}.pkl",
-        )
+    # The models all come from the same inform run, only look up its directory once
+    ceci_dir = project.get_path("ceci_output_dir", flavor=input_file_flavor, **kwcopy)
+    for pz_algo_ in project.get_pzalgorithms():
+        input_files[f"model_{pz_algo_}"] = f"{ceci_dir}/model_inform_{pz_algo_}.pkl"
     return input_files
 
 
@@ -277,11 +294,9 @@ def estimate_sompz_input_callback(
             **kwcopy,
         )
 
+    ceci_dir = project.get_path("ceci_output_dir", flavor=input_file_flavor, **kwcopy)
     for field_ in ["wide", "deep"]:
-        input_files[f"{field_}_model"] = os.path.join(
-            project.get_path("ceci_output_dir", flavor=input_file_flavor, **kwcopy),
-            f"model_som_informer_{field_}.pkl",
-        )
+        input_files[f"{field_}_model"] = f"{ceci_dir}/model_som_informer_{field_}.pkl"
     return input_files
 
 
@@ -331,16 +346,12 @@ def estimate_recalib_input_callback(
             **kwcopy,
         )
 
-    pz_algorithms = project.get_pzalgorithms()
     ceci_dir = project.get_path("ceci_output_dir", flavor=input_file_flavor, **kwcopy)
-    for pz_algo_ in pz_algorithms.keys():
-        input_files[f"input_{pz_algo_}"] = os.path.join(
-            ceci_dir, f"output_estimate_{pz_algo_}.hdf5"
-        )
+    for pz_algo_ in project.get_pzalgorithms():
+        input_files[f"input_{pz_algo_}"] = f"{ceci_dir}/output_estimate_{pz_algo_}.hdf5"
         for recalib_algo_ in ["pz_max_cell_p", "pz_mode"]:
-            input_files[f"model_{pz_algo_}_{recalib_algo_}"] = os.path.join(
-                ceci_dir,
-                f"model_inform_{pz_algo_}_{recalib_algo_}.pkl",
+            input_files[f"model_{pz_algo_}_{recalib_algo_}"] = (
+                f"{ceci_dir}/model_inform_{pz_algo_}_{recalib_algo_}.pkl"
             )
 
     return input_files
@@ -380,13 +391,10 @@ def somlike_recalib_input_callback(
     flavor = kwcopy.pop("flavor", "baseline")
 
     models_dir = sink_dir
-    pz_algorithms = project.get_pzalgorithms()
-    for pz_algo_ in pz_algorithms.keys():
+    for pz_algo_ in project.get_pzalgorithms():
         for field_ in ["deep", "wide"]:
             model_file = f"model_pz_informer_{pz_algo_}_{field_}.pkl"
-            input_files[f"model_{pz_algo_}_{field_}"] = os.path.join(
-                models_dir, model_file
-            )
+            input_files[f"model_{pz_algo_}_{field_}"] = f"{models_dir}/{model_file}"
 
     local_input_tag = kwcopy.pop("input_tag", None)
     if local_input_tag:  # pragma: no cover
@@ -433,20 +441,15 @@ def evaluate_input_callback(
         Dictionary of input file tags and paths
     """
     pipeline_info = project.get_pipeline(pipeline_name)
-    input_files = {}
-    input_file_tags = pipeline_info["input_file_templates"]
     flavor = kwargs.pop("flavor", "baseline")
-    for key, val in input_file_tags.items():
-        input_file_flavor = val.get("flavor", flavor)
-        input_files[key] = project.get_file_for_flavor(
-            input_file_flavor, val["tag"], **kwargs
-        )
+    input_files = _get_flavor_input_files(
+        project, pipeline_info["input_file_templates"], flavor, **kwargs
+    )
 
     pdfs_dir = sink_dir
-    pz_algorithms = project.get_pzalgorithms()
-    for pz_algo_ in pz_algorithms.keys():
-        input_files[f"input_evaluate_{pz_algo_}"] = os.path.join(
-            pdfs_dir, f"estimate_output_{pz_algo_}.hdf5"
+    for pz_algo_ in project.get_pzalgorithms():
+        input_files[f"input_evaluate_{pz_algo_}"] = (
+            f"{pdfs_dir}/estimate_output_{pz_algo_}.hdf5"
         )
     return input_files
 
@@ -520,26 +523,32 @@ def tomography_input_callback(
         Dictionary of input file tags and paths
     """
     pipeline_info = project.get_pipeline(pipeline_name)
-    input_files = {}
-    input_file_tags = pipeline_info["input_file_templates"]
     flavor = kwargs.pop("flavor")
-    selection = kwargs.get("selection")
-    for key, val in input_file_tags.items():
-        input_file_flavor = val.get("flavor", flavor)
-        input_files[key] = project.get_file_for_flavor(
-            input_file_flavor, val["tag"], selection=selection
-        )
+    input_files = _get_flavor_input_files(
+        project,
+        pipeline_info["input_file_templates"],
+        flavor,
+        selection=kwargs.get("selection"),
+    )
 
     pdfs_dir = sink_dir
-    pz_algorithms = project.get_pzalgorithms()
-    for pz_algo_ in pz_algorithms.keys():
-        input_files[f"input_{pz_algo_}"] = os.path.join(
-            pdfs_dir, f"output_estimate_{pz_algo_}.hdf5"
-        )
+    for pz_algo_ in project.get_pzalgorithms():
+        input_files[f"input_{pz_algo_}"] = f"{pdfs_dir}/output_estimate_{pz_algo_}.hdf5"
 
     return input_files
 
 
+def _convert_command(sink_dir: str, input_name: str, output_name: str) -> list[str]:
+    return [
+        "tables-io",
+        "convert",
+        "--input",
+        f"{sink_dir}/{input_name}",
+        "--output",
+        f"{sink_dir}/{output_name}",
+    ]
+
+
 def truth_to_observed_convert_commands(
     sink_dir: str, **kwargs: Any
 ) -> list[list[str]]:
@@ -552,87 +561,109 @@ def truth_to_observed_convert_commands(
     convert_commands = []
 
     for phot_error_ in phot_errors:
-        convert_command = [
-            "tables-io",
-            "convert",
-            "--input",
-            f"{sink_dir}/output_error_model_{phot_error_}.pq",
-            "--output",
-            f"{sink_dir}/output_error_model_{phot_error_}.hdf5",
-        ]
-        convert_commands += [convert_command]
-        
+        convert_commands.append(
+            _convert_command(
+                sink_dir,
+                f"output_error_model_{phot_error_}.pq",
+                f"output_error_model_{phot_error_}.hdf5",
+            )
+        )
         for spec_selection_ in spec_selections:
-            convert_command = [
-                "tables-io",
-                "convert",
-                "--input",
-                f"{sink_dir}/output_select_{phot_error_}_{spec_selection_}.pq",
-                "--output",
-                f"{sink_dir}/output_select_{phot_error_}_{spec_selection_}.hdf5",
-            ]
-            convert_commands += [convert_command]
+            convert_commands.append(
+                _convert_command(
+                    sink_dir,
+                    f"output_select_{phot_error_}_{spec_selection_}.pq",
+                    f"output_select_{phot_error_}_{spec_selection_}.hdf5",
+                )
+            )
     return convert_commands
 
 
-def prepare_convert_commands(sink_dir: str, **_kwargs: Any) -> list[list[str]]:
-    convert_command = [
-        "tables-io",
-        "convert",
-        "--input",
-        f"{sink_dir}/output_deredden.pq",
-        "--output",
-        f"{sink_dir}/output.hdf5",
-    ]
-    convert_commands = [convert_command]
-    return convert_commands
+def single_file_convert_commands(
+    input_name: str,
+    output_name: str,
+    sink_dir: str,
+    **_kwargs: Any,
+) -> list[list[str]]:
+    """Make the command to convert the single output file of a pipeline
+
+    Bind input_name and output_name with functools.partial to get the convert
+    commands function for a particular pipeline
+    """
+    return [_convert_command(sink_dir, input_name, output_name)]
 
 
-def photometric_errors_convert_commands(
-    sink_dir: str, **_kwargs: Any
-) -> list[list[str]]:    
-    convert_command = [
-        "tables-io",
-        "convert",
-        "--input",
-        f"{sink_dir}/output_dereddener_errors.pq",
-        "--output",
-        f"{sink_dir}/output.hdf5",
-    ]
-    convert_commands = [convert_command]
-    return convert_commands
+prepare_convert_commands = functools.partial(
+    single_file_convert_commands, "output_deredden.pq", "output.hdf5"
+)
+
+
+photometric_errors_convert_commands = functools.partial(
+    single_file_convert_commands, "output_dereddener_errors.pq", "output.hdf5"
+)
 
 
 def spectroscopic_selection_convert_commands(
     sink_dir: str, **kwargs: Any
 ) -> list[list[str]]:
-    convert_commands = []
-    spec_selections = kwargs.get("spec_selections")
-    assert isinstance(spec_selections, list)
-    for spec_selection_ in spec_selections:
-        convert_command = [
-            "tables-io",
-            "convert",
-            "--input",
-            f"{sink_dir}/output_select_{spec_selection_}.pq",
-            "--output",
-            f"{sink_dir}/output_select_{spec_selection_}.hdf5",
-        ]
-        convert_commands.append(convert_command)
-    return convert_commands
+    # The selectors run by the pipeline, already expanded by
+    # RailProject.get_pipeline_kwargs, unless the caller gave them explicitly
+    spec_selections = kwargs.get("spec_selections", kwargs.get("selectors"))
+    if spec_selections is None:
+        raise ValueError(
+            "spectroscopic_selection_convert_commands needs either "
+            "'spec_selections' or 'selectors'"
+        )
+    return [
+        _convert_command(
+            sink_dir,
+            f"output_select_{spec_selection_}.pq",
+            f"output_select_{spec_selection_}.hdf5",
+        )
+        for spec_selection_ in spec_selections
+    ]
 
 
-def blending_convert_commands(sink_dir: str, **_kwargs: Any) -> list[list[str]]:
-    convert_command = [
-        "tables-io",
-        "convert",
-        "--input",
-        f"{sink_dir}/output_blended.pq",
-        "--output",
-        f"{sink_dir}/output_blended.hdf5",
-    ]
-    convert_commands = [convert_command]
-    return convert_commands
+blending_convert_commands = functools.partial(
+    single_file_convert_commands, "output_blended.pq", "output_blended.hdf5"
+)
+
+
+def expand_pipeline_kwargs(project: RailProject, **kwargs: Any) -> dict[str, Any]:
+    """Expand the pipeline kwargs that select algorithms, error models, etc.
+
+    Parameters
+    ----------
+    project: RailProject
+        Object with project configuration
+
+    kwargs: Any
+        Pipeline kwargs, 'all' selects every item the project defines
+
+    Returns
+    -------
+    dict[str, Any]:
+        The expanded kwargs, mapping each item name to its configuration
+    """
+    overrides: dict[str, Any] = {}
+    for key, val in kwargs.items():
+        if key == "selectors":
+            temp_dict = project.get_spec_selections()
+        elif key == "algorithms":
+            temp_dict = project.get_pzalgorithms()
+        elif key == "classifiers":
+            temp_dict = project.get_classifiers()
+        elif key == "summarizers":
+            temp_dict = project.get_summarizers()
+        elif key == "error_models":
+            temp_dict = project.get_error_models()
+        else:
+            continue
+        if "all" in val:
+            overrides[key] = temp_dict
+        else:
+            overrides[key] = {algo_name_: temp_dict[algo_name_] for algo_name_ in val}
+    return overrides
 
 
 INPUT_CALLBACK_DICT = dict(
@@ -650,7 +681,7 @@ INPUT_CALLBACK_DICT = dict(
 )
 
 
-CATALOG_CONVERT_COMMANDS_DICT = dict(
+CATALOG_CONVERT_COMMANDS_DICT: dict[str, Callable[..., list[list[str]]]] = dict(
     truth_to_observed=truth_to_observed_convert_commands,
     prepare=prepare_convert_commands,
     photometric_errors=photometric_errors_convert_commands,
@@ -787,30 +818,6 @@ class RailPipelineInstance(Configurable):
     def __repr__(self) -> str:
         return f"{self.config.pipeline_template} {self.config.path}"
 
-    def _parse_pipeline_kwargs(self, project: RailProject, **kwargs: Any) -> dict[str, Any]:
-        """Parse the set of kwargs to expand out 'all'"""
-        overrides: dict[str, Any] = {}
-        for key, val in kwargs.items():
-            if key == "selectors":
-                temp_dict = project.get_spec_selections()
-            elif key == "algorithms":
-                temp_dict = project.get_pzalgorithms()
-            elif key == "classifiers":
-                temp_dict = project.get_classifiers()
-            elif key == "summarizers":
-                temp_dict = project.get_summarizers()
-            elif key == "error_models":
-                temp_dict = project.get_error_models()
-            else:
-                continue
-            if "all" in val:
-                overrides[key] = temp_dict
-            else:
-                overrides[key] = {
-                    algo_name_: temp_dict[algo_name_] for algo_name_ in val
-                }
-        return overrides
-            
     def build(
         self,
         project: RailProject,
@@ -838,11 +845,11 @@ class RailPipelineInstance(Configurable):
             pipeline_kwargs.update(**kwarg_overrides)
 
             with open(stages_config, "w", encoding="utf-8") as fout:
-                yaml.dump(copy_overrides, fout)
+                yaml_utils.safe_dump(copy_overrides, fout)
         else:
             stages_config = None
 
-        parsed_overrides = self._parse_pipeline_kwargs(project, **pipeline_kwargs)
+        parsed_overrides = expand_pipeline_kwargs(project, **pipeline_kwargs)
         pipeline_kwargs.update(**parsed_overrides)            
 
         catalog_tag = project.get_flavor(self.config.flavor).get("catalog_tag", None)
@@ -970,8 +977,6 @@ class RailPipelineInstance(Configurable):
             "pipeline_path", pipeline=pipeline_name, flavor=flavor, **kwargs
         )
 
-        catalog_convert_commands_function = CATALOG_CONVERT_COMMANDS_DICT[pipeline_name]
-
         source_catalog_files = project.get_catalog_files(
             pipeline_info.config.input_catalog_template,
             basename=pipeline_info.config.input_catalog_basename,
@@ -987,32 +992,31 @@ class RailPipelineInstance(Configurable):
 
         all_commands: list[tuple[list[list[str]], str]] = []
 
-        pipeline_config_kwargs = pipeline_info.config.kwargs.copy()
-        parsed_overrides = self._parse_pipeline_kwargs(project, **pipeline_config_kwargs)
-        pipeline_config_kwargs.update(**parsed_overrides)            
-                
-        selection = kwargs["selection"]
+        # Everything but the source and sink files is the same for all the files
+        pipeline_config_path = pipeline_path.replace(".yaml", "_config.yml")
+        script_name = f"run_{pipeline_name}_{kwargs['selection']}_{flavor}.sh"
+        convert_kwargs = dict(**kwargs, **project.get_pipeline_kwargs(pipeline_name))
+        if pipeline_name == "spec_selection":
+            # Without its own selectors, use all the spec selections in the project
+            convert_kwargs.setdefault("selectors", project.get_spec_selections())
+        catalog_convert_commands_function = functools.partial(
+            CATALOG_CONVERT_COMMANDS_DICT[pipeline_name],
+            **convert_kwargs,
+        )
 
         for source_catalog, sink_catalog in zip(
             source_catalog_files, sink_catalog_files
         ):
             sink_dir = os.path.dirname(sink_catalog)
-            script_path = os.path.join(
-                sink_dir,
-                f"run_{pipeline_name}_{selection}_{flavor}.sh",
-            )
+            script_path = os.path.join(sink_dir, script_name)
             ceci_commands = project.generate_ceci_command(
                 pipeline_path=pipeline_path,
-                config=pipeline_path.replace(".yaml", "_config.yml"),
+                config=pipeline_config_path,
                 inputs=dict(input=source_catalog),
                 output_dir=sink_dir,
                 log_dir=sink_dir,
             )
-            convert_commands = catalog_convert_commands_function(
-                sink_dir,
-                **kwargs,
-                **pipeline_config_kwargs,
-            )
+            convert_commands = catalog_convert_commands_function(sink_dir)
             iter_commands = [
                 ["mkdir", "-p", f"{sink_dir}"],
                 ceci_commands,
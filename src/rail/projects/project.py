@@ -2,21 +2,25 @@ from __future__ import annotations
 
 import itertools
 import os
+import threading
 from typing import Any, Type, cast
 
-import yaml
 from ceci.config import StageParameter
 from rail.core.configurable import Configurable
 from rail.core.model import Model
 from rail.utils import catalog_utils
 
-from . import execution, library, name_utils
+from . import execution, library, name_utils, yaml_utils
 from .algorithm_factory import RailAlgorithmFactory
 from .catalog_factory import RailCatalogFactory
 from .catalog_template import RailProjectCatalogTemplate
 from .file_template import RailProjectFileTemplate
 from .pipeline_factory import RailPipelineFactory
-from .pipeline_holder import RailPipelineTemplate
+from .pipeline_holder import (
+    RailPipelineInstance,
+    RailPipelineTemplate,
+    expand_pipeline_kwargs,
+)
 from .project_file_factory import RailProjectFileFactory
 from .reducer import RailReducer
 from .selection_factory import RailSelection, RailSelectionFactory
@@ -314,6 +318,16 @@ class RailProject(Configurable):  # pylint: disable=too-many-public-methods
         self._selections: dict[str, RailSelection] | None = None
         self._subsamples: dict[str, RailSubsample] | None = None
         self._flavors: dict[str, RailFlavor] | None = None
+        self._pipeline_kwargs: dict[str, dict[str, Any]] = {}
+        self._pipeline_instances: dict[tuple[str, str], RailPipelineInstance] = {}
+        self._flavor_selection_kwargs: dict[
+            tuple[tuple[str, ...], tuple[str, ...]], list[dict]
+        ] = {}
+        # The pipelines for several flavors / selections can be run from
+        # worker threads that share this project, this serializes building
+        # the commands, which fills the caches above, while the commands
+        # themselves run side by side
+        self._commands_lock = threading.RLock()
 
     def __repr__(self) -> str:
         return f"{self.config.Name}"
@@ -327,21 +341,16 @@ class RailProject(Configurable):  # pylint: disable=too-many-public-methods
         self._selections = None
         self._subsamples = None
         self._flavors = None
+        self._pipeline_kwargs = {}
+        self._pipeline_instances = {}
+        self._flavor_selection_kwargs = {}
 
     @staticmethod
     def generate_kwargs_iterable(**iteration_dict: Any) -> list[dict]:
         """Generate a list of kwargs dicts from a dict of lists"""
         iteration_vars = list(iteration_dict.keys())
-        iterations = itertools.product(
-            *[iteration_dict.get(key, []) for key in iteration_vars]
-        )
-        iteration_kwarg_list = []
-        for iteration_args in iterations:
-            iteration_kwargs = {
-                iteration_vars[i]: iteration_args[i] for i in range(len(iteration_vars))
-            }
-            iteration_kwarg_list.append(iteration_kwargs)
-        return iteration_kwarg_list
+        iterations = itertools.product(*iteration_dict.values())
+        return [dict(zip(iteration_vars, iteration_args)) for iteration_args in iterations]
 
     @staticmethod
     def generate_ceci_command(
@@ -401,8 +410,7 @@ class RailProject(Configurable):  # pylint: disable=too-many-public-methods
     @staticmethod
     def load_config(config_file: str) -> RailProject:
         """Create and return a RailProject from a yaml config file"""
-        with open(os.path.expandvars(config_file), "r", encoding="utf-8") as fp:
-            config_orig = yaml.safe_load(fp)
+        config_orig = yaml_utils.load_yaml_file(config_file)
 
         project_config = config_orig.get("Project")
         project = RailProject(**project_config)
@@ -682,8 +690,7 @@ class RailProject(Configurable):  # pylint: disable=too-many-public-methods
         list[str]:
             Tokens in the command line, usable by subprocess.run()
         """
-        pipeline_template = self.get_pipeline(pipeline_name)
-        pipeline_instance = pipeline_template.make_instance(self, flavor, {})
+        pipeline_instance = self.get_pipeline_instance(pipeline_name, flavor)
         return pipeline_instance.make_pipeline_single_input_command(self, **kwargs)
 
     def make_pipeline_catalog_commands(
@@ -710,13 +717,13 @@ class RailProject(Configurable):  # pylint: disable=too-many-public-methods
         list[tuple[list[list[str]], str]:
             List of pairs of series of commands and potential location for slurm batch file
         """
-        pipeline_template = self.get_pipeline(pipeline_name)
-        pipeline_instance = pipeline_template.make_instance(self, flavor, {})
+        pipeline_instance = self.get_pipeline_instance(pipeline_name, flavor)
         return pipeline_instance.make_pipeline_catalog_commands(self, **kwargs)
 
     def run_pipeline_single(
         self,
         pipeline_name: str,
+        flavor: str,
         run_mode: execution.RunMode = execution.RunMode.bash,
         **kwargs: Any,
     ) -> int:
@@ -727,6 +734,9 @@ class RailProject(Configurable):  # pylint: disable=too-many-public-methods
         pipeline_name: str
             Pipeline in question
 
+        flavor: str
+            Flavor to run the pipeline for
+
         run_mode: execution.RunMode
             How to run the pipeline (e.g., in bash, or in slurm)
 
@@ -738,15 +748,14 @@ class RailProject(Configurable):  # pylint: disable=too-many-public-methods
         int:
             0 for success, error code otherwise
         """
-        kwcopy = kwargs.copy()
-        flavor = kwcopy.pop("flavor")
-        sink_dir = self.get_path("ceci_output_dir", flavor=flavor, **kwcopy)
-        script_path = os.path.join(sink_dir, f"run_{pipeline_name}.sh")
-        top_script_path = os.path.join(sink_dir, f"submit_{pipeline_name}.sh")
-        commands = self.make_pipeline_single_input_command(
-            pipeline_name, flavor, **kwcopy
-        )
-        site_config = self.get_site_config(kwcopy.get("site"))
+        with self._commands_lock:
+            sink_dir = self.get_path("ceci_output_dir", flavor=flavor, **kwargs)
+            script_path = os.path.join(sink_dir, f"run_{pipeline_name}.sh")
+            top_script_path = os.path.join(sink_dir, f"submit_{pipeline_name}.sh")
+            commands = self.make_pipeline_single_input_command(
+                pipeline_name, flavor, **kwargs
+            )
+            site_config = self.get_site_config(kwargs.get("site"))
         return execution.handle_all_commands(
             run_mode,
             [([commands], script_path)],
@@ -757,7 +766,9 @@ class RailProject(Configurable):  # pylint: disable=too-many-public-methods
     def run_pipeline_catalog(
         self,
         pipeline_name: str,
+        flavor: str,
         run_mode: execution.RunMode = execution.RunMode.bash,
+        max_workers: int = 1,
         **kwargs: Any,
     ) -> int:
         """Run pipeline on a catalog
@@ -767,9 +778,15 @@ class RailProject(Configurable):  # pylint: disable=too-many-public-methods
         pipeline_name: str
             Pipeline in question
 
+        flavor: str
+            Flavor to run the pipeline for
+
         run_mode: execution.RunMode
             How to run the pipeline (e.g., in bash, or in slurm)
 
+        max_workers: int
+            In bash mode, how many of the catalog files to run the pipeline on at once
+
         **kwargs: Any
             Other interpolants, such as selection
 
@@ -778,11 +795,7 @@ class RailProject(Configurable):  # pylint: disable=too-many-public-methods
         int:
             0 for success, error code otherwise
         """
-
-        kwcopy = kwargs.copy()
-        flavor = kwcopy.pop("flavor")
-
-        sink_dir = self.get_path("ceci_output_dir", flavor=flavor, **kwcopy)
+        sink_dir = self.get_path("ceci_output_dir", flavor=flavor, **kwargs)
         submit_script_path = os.path.join(sink_dir, f"submit_{pipeline_name}.sh")
 
         if run_mode in [execution.RunMode.slurm]:
@@ -792,16 +805,17 @@ class RailProject(Configurable):  # pylint: disable=too-many-public-methods
                     f"Possible values are {list(execution.DEFAULT_SITE_CONFIGS.keys())}"
                 )
 
-        site_config = self.get_site_config(kwcopy.get("site"))
-
-        all_commands = self.make_pipeline_catalog_commands(
-            pipeline_name, flavor, **kwcopy
-        )
+        with self._commands_lock:
+            site_config = self.get_site_config(kwargs.get("site"))
+            all_commands = self.make_pipeline_catalog_commands(
+                pipeline_name, flavor, **kwargs
+            )
         return execution.handle_all_commands(
             run_mode,
             all_commands,
             submit_script_path,
             site_config=site_config,
+            max_workers=max_workers,
         )
 
     def add_flavor(self, name: str, **kwargs: Any) -> RailFlavor:
@@ -822,17 +836,18 @@ class RailProject(Configurable):  # pylint: disable=too-many-public-methods
         """Get the site configuration for a particular site"""
         if site is None:
             return {}
-        if site in self.config.SiteConfig:
-            return self.config.SiteConfig[site]
-        if site in execution.DEFAULT_SITE_CONFIGS:
-            return execution.DEFAULT_SITE_CONFIGS[site]
-        raise KeyError(f"Could not get configuration for site: {site}")
+        site_config = self.config.SiteConfig.get(site)
+        if site_config is None:
+            site_config = execution.DEFAULT_SITE_CONFIGS.get(site)
+        if site_config is None:
+            raise KeyError(f"Could not get configuration for site: {site}")
+        return site_config
 
     def write_yaml(self, yaml_file: str) -> None:
         """Write this project to a yaml file"""
         the_dict = self.to_yaml_dict()
         with open(os.path.expandvars(yaml_file), "w", encoding="utf-8") as fout:
-            yaml.dump(the_dict, fout)
+            yaml_utils.safe_dump(the_dict, fout)
 
     def get_path_templates(self) -> dict:
         """Return the dictionary of templates used to construct paths"""
@@ -984,9 +999,10 @@ class RailProject(Configurable):  # pylint: disable=too-many-public-methods
 
     def get_algorithms(self, algorithm_type: str) -> dict[str, dict[str, str]]:
         """Get all the algorithms of a particular type"""
-        sub_algo_dict = self._algorithms.get(algorithm_type, {})
-        if sub_algo_dict:
+        sub_algo_dict = self._algorithms.get(algorithm_type)
+        if sub_algo_dict is not None:
             return sub_algo_dict
+        sub_algo_dict = {}
         algo_names = self.config[algorithm_type]
         # trim off the trailing 's'
         all_algos = RailAlgorithmFactory.get_algorithms(algorithm_type[0:-1])
@@ -1122,6 +1138,37 @@ class RailProject(Configurable):  # pylint: disable=too-many-public-methods
                 f"pipeline '{name}' not found in {list(pipelines.keys())}"
             ) from missing_key
 
+    def get_pipeline_instance(self, name: str, flavor: str) -> RailPipelineInstance:
+        """Get a ceci pipeline, as set up for a particular flavor
+
+        Notes
+        -----
+        This does not apply the flavor's pipeline_overrides, which are only
+        used when building the pipeline.  The instances are cached, since they
+        are the same for every selection a pipeline is run on
+        """
+        key = (name, flavor)
+        if key not in self._pipeline_instances:
+            self._pipeline_instances[key] = self.get_pipeline(name).make_instance(
+                self, flavor, {}
+            )
+        return self._pipeline_instances[key]
+
+    def get_pipeline_kwargs(self, name: str) -> dict[str, Any]:
+        """Get the kwargs of a ceci pipeline, with the algorithms, error models,
+        etc. it selects expanded out
+
+        Notes
+        -----
+        These do not depend on the flavor or selection, so they are only
+        expanded once per pipeline
+        """
+        if name not in self._pipeline_kwargs:
+            pipeline_kwargs = self.get_pipeline(name).config.kwargs.copy()
+            pipeline_kwargs.update(**expand_pipeline_kwargs(self, **pipeline_kwargs))
+            self._pipeline_kwargs[name] = pipeline_kwargs
+        return self._pipeline_kwargs[name].copy()
+
     def get_flavor_args(self, flavors: list[str]) -> list[str]:
         """Get the 'flavors' to iterate a particular command over
 
@@ -1130,9 +1177,8 @@ class RailProject(Configurable):  # pylint: disable=too-many-public-methods
         If the flavor 'all' is included in the list of flavors, this
         will replace the list with all the flavors defined in this project
         """
-        flavor_dict = self.get_flavors()
         if "all" in flavors:
-            return list(flavor_dict.keys())
+            return list(self.get_flavors().keys())
         return flavors
 
     def get_selection_args(self, selections: list[str]) -> list[str]:
@@ -1143,11 +1189,41 @@ class RailProject(Configurable):  # pylint: disable=too-many-public-methods
         If the selection 'all' is included in the list of selections, this
         will replace the list with all the selections defined in this project
         """
-        selection_dict = self.get_selections()
         if "all" in selections:
-            return list(selection_dict.keys())
+            return list(self.get_selections().keys())
         return selections
 
+    def get_flavor_selection_kwargs(
+        self, flavors: list[str], selections: list[str]
+    ) -> list[dict]:
+        """Get the kwargs to iterate a particular command over flavors and selections
+
+        Parameters
+        ----------
+        flavors: list[str]
+            Flavors to iterate over, 'all' is expanded as in get_flavor_args
+
+        selections: list[str]
+            Selections to iterate over, 'all' is expanded as in get_selection_args
+
+        Returns
+        -------
+        list[dict]:
+            One dict with 'flavor' and 'selection' keys per combination
+
+        Notes
+        -----
+        The combinations are cached, so that several commands iterating over the
+        same flavors and selections of a project only expand them once
+        """
+        key = (tuple(flavors), tuple(selections))
+        if key not in self._flavor_selection_kwargs:
+            self._flavor_selection_kwargs[key] = self.generate_kwargs_iterable(
+                flavor=self.get_flavor_args(flavors),
+                selection=self.get_selection_args(selections),
+            )
+        return [kw.copy() for kw in self._flavor_selection_kwargs[key]]
+
     def wrap_pz_model(self, path: str, outdir: str, **kwargs: Any) -> int:
         """Wrap a pz model file for use by Rubin DM software
 
@@ -9,11 +9,11 @@ import pyarrow as pa
 import pyarrow.compute as pc
 import pyarrow.dataset as ds
 import pyarrow.parquet as pq
-import yaml
 from ceci.config import StageParameter
 from pyarrow import acero
 from rail.core.configurable import Configurable
 
+from . import yaml_utils
 from .arrow_utils import parse_item
 from .dynamic_class import DynamicClass
 
@@ -803,8 +803,8 @@ class DP1Reducer(RailReducer):
 
         topdir = os.path.dirname(os.path.dirname(input_catalog))
         columns_file = os.path.join(topdir, "columns.yaml")
-        with open(columns_file, "r", encoding="utf-8") as fin:
-            columns = yaml.safe_load(fin)
+        # The same columns file is shared by all the input catalogs
+        columns = yaml_utils.load_yaml_file(columns_file)
 
         # Try to do this right
         try:
@@ -0,0 +1,113 @@
+"""Functions to read and write yaml files with the fastest available PyYAML backend"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import os
+import time
+import warnings
+from typing import IO, Any
+
+import yaml
+
+from . import path_funcs
+
+# PyYAML only provides the C loader / dumper if it was built against libyaml
+HAS_LIBYAML: bool = hasattr(yaml, "CSafeLoader")
+
+SafeLoader: type = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+SafeDumper: type = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def safe_load(stream: IO[str] | str) -> Any:
+    """Parse a yaml stream, using the libyaml backed loader if possible
+
+    Parameters
+    ----------
+    stream:
+        Open file or string to parse
+
+    Returns
+    -------
+    Any:
+        The parsed yaml data
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, stream: IO[str] | None = None, **kwargs: Any) -> str | None:
+    """Write data as yaml, using the libyaml backed dumper if possible
+
+    Parameters
+    ----------
+    data:
+        Data to write
+
+    stream:
+        Open file to write to, if None the yaml is returned as a string
+
+    **kwargs:
+        Passed to yaml.dump
+
+    Returns
+    -------
+    str | None:
+        The yaml string if stream is None, None otherwise
+    """
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_file_cached(
+    realpath: str,
+    mtime_ns: int,  # pylint: disable=unused-argument
+    size: int,  # pylint: disable=unused-argument
+) -> Any:
+    # mtime_ns and size are only part of the cache key, so that edited files
+    # are re-parsed
+    with open(realpath, encoding="utf-8") as fin:
+        return safe_load(fin)
+
+
+def load_yaml_file(yaml_file: str) -> Any:
+    """Read and parse a yaml file, re-using the parsed data if the file has not changed
+
+    Parameters
+    ----------
+    yaml_file:
+        File to read, environmental variables are expanded
+
+    Returns
+    -------
+    Any:
+        The parsed yaml data, this is a copy, so callers are free to modify it
+    """
+    realpath = os.path.realpath(os.path.expandvars(yaml_file))
+    stat_result = os.stat(realpath)
+    # Files that changed very recently are parsed, but not cached, another
+    # edit in the same tick could keep the same modification time and size
+    if time.time_ns() - stat_result.st_mtime_ns < path_funcs.RECENT_CHANGE_NS:
+        with open(realpath, encoding="utf-8") as fin:
+            return safe_load(fin)
+    yaml_data = _load_yaml_file_cached(
+        realpath, stat_result.st_mtime_ns, stat_result.st_size
+    )
+    return copy.deepcopy(yaml_data)
+
+
+def clear_cache() -> None:
+    """Drop all the cached parsed yaml files"""
+    _load_yaml_file_cached.cache_clear()
+
+
+def warn_if_no_libyaml() -> None:
+    """Warn that yaml parsing will use the slow, pure-python, PyYAML backend"""
+    if not HAS_LIBYAML:  # pragma: no cover
+        warnings.warn(
+            "PyYAML was built without libyaml, yaml files will be parsed "
+            "with the (much slower) pure-python loader",
+            RuntimeWarning,
+            stacklevel=2,
+        )
@@ -1,8 +1,11 @@
 import os
+import re
 
+import click
 import pytest
 from click.testing import CliRunner, Result
 
+from rail.cli.rail_project import command_utils
 from rail.cli.rail_project.project_commands import project_cli
 
 
@@ -20,6 +23,22 @@ def test_cli_help() -> None:
     check_result(result)
 
 
+def test_cli_command_names() -> None:
+    # Each command should be registered exactly once, under its own name
+    groups: list[click.Group] = [project_cli]
+    while groups:
+        group = groups.pop()
+        ctx = click.Context(group)
+        names = group.list_commands(ctx)
+        assert len(set(names)) == len(names)
+        for name in names:
+            command = group.get_command(ctx, name)
+            assert command is not None
+            assert command.name == name
+            if isinstance(command, click.Group):
+                groups.append(command)
+
+
 def test_cli_inspect() -> None:
     runner = CliRunner()
 
@@ -125,6 +144,46 @@ def test_cli_split() -> None:
     check_result(result)
 
 
+@pytest.mark.parametrize("output_format", ["both", "parquet", "hdf5"])
+def test_cli_subsample_output_format(output_format: str) -> None:
+    runner = CliRunner()
+
+    result = runner.invoke(
+        project_cli,
+        "subsample "
+        "--catalog-template degraded "
+        "--flavor baseline "
+        "--file-template multi_cat_1k "
+        "--subsampler-class-name multi_catalog_subsampler "
+        "--subsample-name multi_cat "
+        f"--output-format {output_format} "
+        "--run-mode dry_run "
+        "--selection gold "
+        "tests/ci_subsample.yaml",
+    )
+    check_result(result)
+
+
+@pytest.mark.parametrize("output_format", ["both", "parquet", "hdf5"])
+def test_cli_split_output_format(output_format: str) -> None:
+    runner = CliRunner()
+
+    result = runner.invoke(
+        project_cli,
+        "split "
+        "--flavor baseline "
+        "--file-template train_file_10 "
+        "--test-file-template test_split_file "
+        "--train-file-template train_split_file "
+        "--splitter-class-name random_splitter "
+        f"--output-format {output_format} "
+        "--run-mode dry_run "
+        "--selection gold "
+        "tests/ci_project.yaml",
+    )
+    check_result(result)
+
+
 @pytest.mark.parametrize(
     "pipeline",
     [
@@ -162,6 +221,177 @@ def test_cli_run(pipeline: str) -> None:
     check_result(result)
 
 
+def test_cli_run_no_cache() -> None:
+    from rail.projects import library
+
+    runner = CliRunner()
+
+    for extra_opt in ["", "--no-cache "]:
+        result = runner.invoke(
+            project_cli,
+            f"{extra_opt}run pz --selection gold --flavor baseline "
+            "--run-mode dry_run tests/ci_project.yaml",
+        )
+        check_result(result)
+
+    # Each command loads the project afresh, so it does not depend on what
+    # is left in the library factories
+    library.clear()
+    result = runner.invoke(
+        project_cli,
+        "run pz --selection gold --flavor baseline "
+        "--run-mode dry_run tests/ci_project.yaml",
+    )
+    check_result(result)
+
+
+def test_cli_run_fast_dry(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RAIL_FAST_DRY", "1")
+    runner = CliRunner()
+
+    result = runner.invoke(
+        project_cli,
+        "run pz --selection gold --flavor baseline "
+        "--run-mode dry_run tests/ci_project.yaml",
+    )
+    check_result(result)
+    assert result.output.startswith("DRY: would run pz")
+
+
+def _output_blocks(output: str) -> list[str]:
+    # The blocks of output from each command, without the timing
+    return sorted(re.sub(r" in [0-9.]+ seconds", "", output).split("\n\n"))
+
+
+def test_cli_run_jobs() -> None:
+    runner = CliRunner()
+
+    result = runner.invoke(
+        project_cli,
+        "run pz --selection all --flavor all --jobs 2 "
+        "--run-mode dry_run tests/ci_project.yaml",
+    )
+    check_result(result)
+
+    # The threads share the project, but should build the same commands,
+    # and write out whole blocks of output
+    serial_result = runner.invoke(
+        project_cli,
+        "run pz --selection all --flavor all --jobs 1 "
+        "--run-mode dry_run tests/ci_project.yaml",
+    )
+    check_result(serial_result)
+    assert _output_blocks(result.output) == _output_blocks(serial_result.output)
+
+    result = runner.invoke(
+        project_cli,
+        "run prepare --selection gold --flavor baseline --file-jobs 2 "
+        "--run-mode dry_run tests/ci_project.yaml",
+    )
+    check_result(result)
+
+
+class _StatusProject:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def run(self, flavor: str, return_flavor: bool = False) -> int | str:
+        self.calls.append(flavor)
+        if return_flavor:
+            return flavor
+        return int(flavor == "bad")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_run_project_method(jobs: int, capsys: pytest.CaptureFixture) -> None:
+    iter_kwargs = [dict(flavor=flavor) for flavor in ["good", "bad", "good"]]
+
+    project = _StatusProject()
+    status = command_utils.run_project_method(
+        project, "", "run", iter_kwargs, jobs=jobs, use_threads=True  # type: ignore
+    )
+    assert status == 1
+    assert len(project.calls) == 3
+    assert "'bad'} failed with 1" in capsys.readouterr().err
+
+    project = _StatusProject()
+    status = command_utils.run_project_method(
+        project, "", "run", iter_kwargs[:1], fail_fast=True  # type: ignore
+    )
+    assert status == 0
+
+    project = _StatusProject()
+    status = command_utils.run_project_method(
+        project, "", "run", iter_kwargs, fail_fast=True  # type: ignore
+    )
+    assert status == 1
+    assert project.calls == ["good", "bad"]
+
+
+def test_run_project_method_status() -> None:
+    # The exit codes of the failed calls are kept, rather than just 1
+    iter_kwargs = [dict(flavor=flavor) for flavor in ["bad", "worse", "good"]]
+    status = command_utils.run_project_method(
+        _StatusProject(),  # type: ignore
+        "",
+        "run",
+        iter_kwargs,
+        status_func=lambda flavor: dict(bad=2, worse=4).get(flavor, 0),
+        return_flavor=True,
+    )
+    assert status == 6
+
+
+def test_run_project_method_processes(capsys: pytest.CaptureFixture) -> None:
+    # Each worker process loads its own copy of the project from the config file
+    config_file = "tests/ci_project.yaml"
+    project = command_utils.load_project(config_file)
+    flavors = ["baseline", "blend", "baseline", "blend"]
+    iter_kwargs = [dict(flavor=flavor) for flavor in flavors]
+
+    def status_func(path: str) -> int:
+        return int("blend" in path)
+
+    status = command_utils.run_project_method(
+        project,
+        config_file,
+        "get_path",
+        iter_kwargs,
+        jobs=2,
+        status_func=status_func,
+        path_key="ceci_output_dir",
+        selection="gold",
+    )
+    assert status == 1
+    assert capsys.readouterr().err.count("failed with 1") == 2
+
+    status = command_utils.run_project_method(
+        project,
+        config_file,
+        "get_path",
+        iter_kwargs,
+        jobs=2,
+        fail_fast=True,
+        status_func=status_func,
+        path_key="ceci_output_dir",
+        selection="gold",
+    )
+    assert status == 1
+    assert capsys.readouterr().err.count("failed with 1") == 1
+
+    status = command_utils.run_project_method(
+        project,
+        config_file,
+        "get_path",
+        iter_kwargs[::2],
+        jobs=2,
+        status_func=status_func,
+        path_key="ceci_output_dir",
+        selection="gold",
+    )
+    assert status == 0
+
+
 def test_cli_wrap_model(setup_project_area: int) -> None:
     assert setup_project_area == 0
     runner = CliRunner()
@@ -1,4 +1,6 @@
 import os
+import shutil
+from pathlib import Path
 
 import pytest
 
@@ -6,6 +8,7 @@ from rail.plotting import control
 from rail.plotting.dataset_holder import RailDatasetHolder
 from rail.plotting.plot_group import RailPlotGroup
 from rail.plotting.plotter import RailPlotter
+from rail.plotting.plotter_factory import RailPlotterFactory
 
 
 def test_load_yaml(setup_project_area: int) -> None:
@@ -61,6 +64,34 @@ def test_run(setup_project_area: int) -> None:
 
     assert os.path.exists(check_path)
 
+    # running the same file again re-uses the data that was already read
+    the_data = control.get_dataset("blend_baseline_all").data
+    assert the_data is not None
+    control.run("tests/ci_plot_groups.yaml", outdir="tests/temp_data/plots")
+    assert control.get_dataset("blend_baseline_all").data is the_data
+
+    control.run(
+        "tests/ci_plot_groups.yaml", outdir="tests/temp_data/plots", force_reload=True
+    )
+    assert control.get_dataset("blend_baseline_all").data is not the_data
+
+    out_dict_jobs = control.run(
+        "tests/ci_plot_groups.yaml", outdir="tests/temp_data/plots", jobs=2
+    )
+    assert out_dict_jobs.keys() == _out_dict.keys()
+
+    # Keeping the figures means making them in this process
+    out_dict_kept = control.run(
+        "tests/ci_plot_groups.yaml",
+        outdir="tests/temp_data/plots",
+        jobs=2,
+        purge_plots=False,
+    )
+    for plot_dict_ in out_dict_kept.values():
+        assert plot_dict_.plots
+        for plot_ in plot_dict_.plots.values():
+            assert plot_.figure is not None
+
     control.clear()
     out_dict2 = control.run(
         "tests/ci_plot_groups.yaml",
@@ -83,6 +114,32 @@ def test_run(setup_project_area: int) -> None:
     assert isinstance(plot_holder.plotter, RailPlotter)
     assert isinstance(plot_holder.dataset_holder, RailDatasetHolder)
 
+
+def test_run_reuses_loaded_yaml(tmp_path: Path) -> None:
+    yaml_file = str(tmp_path / "plots.yaml")
+    shutil.copyfile("tests/ci_plots.yaml", yaml_file)
+    control.clear()
+    control.run(yaml_file, outdir=str(tmp_path))
+    plotter = control.get_plotter("zestimate_v_ztrue_hist2d")
+
+    # Same, unchanged, file: the factories are kept
+    control.run(yaml_file, outdir=str(tmp_path))
+    assert control.get_plotter("zestimate_v_ztrue_hist2d") is plotter
+
+    # Clearing a factory directly means the file is loaded again
+    RailPlotterFactory.clear()
+    control.run(yaml_file, outdir=str(tmp_path))
+    assert control.get_plotter("zestimate_v_ztrue_hist2d") is not plotter
+    plotter = control.get_plotter("zestimate_v_ztrue_hist2d")
+
+    # So does editing the file
+    stat_result = os.stat(yaml_file)
+    os.utime(yaml_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1000))
+    control.run(yaml_file, outdir=str(tmp_path))
+    assert control.get_plotter("zestimate_v_ztrue_hist2d") is not plotter
+    control.clear()
+
+
 @pytest.mark.parametrize(
     "dataset_holder_class, output_yaml",
     [
@@ -0,0 +1,155 @@
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+import qp
+import tables_io
+
+from rail.plotting import data_extraction_funcs
+
+
+def test_extraction_caches(tmp_path: Path) -> None:
+    data_extraction_funcs.clear_extraction_caches()
+
+    truth_file = os.path.join(tmp_path, "truth.hdf5")
+    tables_io.write(dict(redshift=np.linspace(0.0, 1.0, 11)), truth_file)
+    # Make the file old enough for the data to be cached
+    os.utime(truth_file, ns=(0, 0))
+    z_true = data_extraction_funcs.extract_z_true(truth_file)
+    assert np.array_equal(z_true, np.linspace(0.0, 1.0, 11))
+    assert data_extraction_funcs.extract_z_true(truth_file) is z_true
+    # The cached data are shared, so they can not be changed in place
+    with pytest.raises(ValueError, match="read-only"):
+        z_true[0] = 1.0
+
+    pdf_file = os.path.join(tmp_path, "pdf.hdf5")
+    ens = qp.hist.create_ensemble(
+        bins=np.linspace(0.0, 1.0, 6), pdfs=np.full((11, 5), 0.2)
+    )
+    ens.set_ancil(dict(zmode=np.linspace(0.0, 1.0, 11)))
+    ens.write_to(pdf_file)
+    os.utime(pdf_file, ns=(0, 0))
+    z_pdf = data_extraction_funcs.extract_z_pdf(pdf_file)
+    assert z_pdf.npdf == 11
+    assert data_extraction_funcs.extract_z_pdf(pdf_file) is z_pdf
+    z_point = data_extraction_funcs.extract_z_point(pdf_file)
+    assert np.allclose(z_point, np.linspace(0.0, 1.0, 11))
+    assert not z_point.flags.writeable
+    z_point_f32 = data_extraction_funcs.extract_z_point(pdf_file, dtype=np.float32)
+    assert z_point_f32.dtype == np.float32
+    assert z_point_f32.flags.c_contiguous
+    z_true_f32 = data_extraction_funcs.extract_z_true(truth_file, dtype=np.float32)
+    assert np.allclose(z_true_f32, z_true)
+
+    # Re-writing the file should invalidate the cache
+    tables_io.write(dict(redshift=np.linspace(0.0, 2.0, 21)), truth_file)
+    assert len(data_extraction_funcs.extract_z_true(truth_file)) == 21
+
+    # On file systems with coarse modification times a re-write in the same
+    # tick can keep the time and size, so recently changed files are not cached
+    mtime_ns = time.time_ns()
+    os.utime(truth_file, ns=(mtime_ns, mtime_ns))
+    assert data_extraction_funcs.extract_z_true(truth_file)[-1] == 2.0
+    tables_io.write(dict(redshift=np.linspace(0.0, 3.0, 21)), truth_file)
+    os.utime(truth_file, ns=(mtime_ns, mtime_ns))
+    assert data_extraction_funcs.extract_z_true(truth_file)[-1] == 3.0
+    data_extraction_funcs.clear_extraction_caches()
+
+
+def test_extract_stacked_z_pdf(tmp_path: Path) -> None:
+    data_extraction_funcs.clear_extraction_caches()
+    rng = np.random.default_rng(1357)
+    xvals = np.linspace(0.0, 3.0, 31)
+    paths = []
+    for i in range(3):
+        yvals = rng.uniform(size=(i + 1, 31))
+        ens = qp.interp.create_ensemble(xvals=xvals, yvals=yvals)
+        paths.append(os.path.join(tmp_path, f"nz_bin{i}.hdf5"))
+        ens.write_to(paths[-1])
+        os.utime(paths[-1], ns=(0, 0))
+
+    stacked = data_extraction_funcs.extract_stacked_z_pdf(paths)
+    check = qp.concatenate([qp.read(path_) for path_ in paths])
+    assert stacked.npdf == check.npdf == 6
+    assert np.allclose(stacked.objdata["yvals"], check.objdata["yvals"])
+    assert np.array_equal(stacked.metadata["xvals"], check.metadata["xvals"])
+    assert data_extraction_funcs.extract_stacked_z_pdf(paths) is stacked
+    data_extraction_funcs.clear_extraction_caches()
+
+
+class _Project:
+    """Stand-in for a RailProject with the truth and estimates for each
+    selection in tmp_path"""
+
+    def __init__(self, outdir: Path) -> None:
+        self.outdir = outdir
+
+    def get_path(self, _path_key: str, selection: str, **_kwargs: str) -> str:
+        return os.path.join(self.outdir, selection)
+
+    def get_file_for_flavor(self, _flavor: str, _label: str, selection: str) -> str:
+        return os.path.join(self.outdir, f"truth_{selection}.hdf5")
+
+
+def _write_pz_point_estimates(
+    project: _Project, selection: str, z_true: np.ndarray, algos: list[str]
+) -> dict[str, dict]:
+    truth_file = project.get_file_for_flavor("baseline", "test", selection)
+    tables_io.write(dict(redshift=z_true), truth_file)
+    outdir = project.get_path("ceci_output_dir", selection)
+    os.makedirs(outdir, exist_ok=True)
+    for algo_ in algos:
+        ens = qp.hist.create_ensemble(
+            bins=np.linspace(0.0, 1.0, 6), pdfs=np.full((11, 5), 0.2)
+        )
+        ens.set_ancil(dict(zmode=np.linspace(0.0, 1.0, 11)))
+        ens.write_to(os.path.join(outdir, f"output_estimate_{algo_}.hdf5"))
+    return {
+        f"{selection}_{algo_}": dict(
+            project=project,
+            selection=selection,
+            flavor="baseline",
+            tag="test",
+            algo=algo_,
+        )
+        for algo_ in algos
+    }
+
+
+def test_get_multi_pz_point_estimate_data(tmp_path: Path) -> None:
+    data_extraction_funcs.clear_extraction_caches()
+    project = _Project(tmp_path)
+    z_true = np.linspace(0.0, 1.0, 11)
+    infos = _write_pz_point_estimates(project, "gold", z_true, ["knn", "bpz"])
+    # Variants without an estimate file are skipped
+    infos["gold_fzboost"] = dict(infos["gold_knn"], algo="fzboost")
+    pz_data = data_extraction_funcs.get_multi_pz_point_estimate_data(infos)
+    assert pz_data is not None
+    assert np.array_equal(pz_data["truth"], z_true)
+    assert list(pz_data["pointEstimates"].keys()) == ["gold_knn", "gold_bpz"]
+
+    # Truth files with the same values, or values within tolerance, are accepted
+    infos.update(_write_pz_point_estimates(project, "copy", z_true, ["knn"]))
+    infos.update(_write_pz_point_estimates(project, "close", z_true + 1e-12, ["knn"]))
+    pz_data = data_extraction_funcs.get_multi_pz_point_estimate_data(infos)
+    assert pz_data is not None
+    assert len(pz_data["pointEstimates"]) == 4
+
+    infos.update(_write_pz_point_estimates(project, "off", z_true + 0.1, ["knn"]))
+    with pytest.raises(ValueError, match="Mismatch in truth data"):
+        data_extraction_funcs.get_multi_pz_point_estimate_data(infos)
+    data_extraction_funcs.clear_extraction_caches()
+
+
+def test_extract_z_true_formats(tmp_path: Path) -> None:
+    data_extraction_funcs.clear_extraction_caches()
+    table = dict(redshift=np.linspace(0.0, 1.0, 11), mag_i=np.linspace(20.0, 25.0, 11))
+    # hdf5 and parquet columns are read on their own, fits files with tables_io
+    for ext in ["hdf5", "pq", "fits"]:
+        filepath = os.path.join(tmp_path, f"truth.{ext}")
+        tables_io.write(table, filepath)
+        z_true = data_extraction_funcs.extract_z_true(filepath)
+        assert np.array_equal(z_true, table["redshift"])
+    data_extraction_funcs.clear_extraction_caches()
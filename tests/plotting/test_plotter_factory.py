@@ -1,12 +1,48 @@
 import os
+from typing import Any
 
+import numpy as np
 import pytest
 
 from rail.plotting import pz_plotters
+from rail.plotting.cat_plotters import CatPlotterTruth, RailCatTruthDataset
+from rail.plotting.dataset_holder import (
+    RailDatasetHolder,
+    RailDatasetListHolder,
+    RailProjectHolder,
+)
 from rail.plotting.plotter import RailPlotter, RailPlotterList
 from rail.plotting.plotter_factory import RailPlotterFactory
 
 
+class _TruthHolder(RailDatasetHolder):
+    """Dataset holder that makes up its truth data, rather than reading it"""
+
+    output_type = RailCatTruthDataset
+
+    @classmethod
+    def generate_dataset_dict(
+        cls,
+        **kwargs: dict[str, Any],
+    ) -> tuple[
+        list[RailProjectHolder], list[RailDatasetHolder], list[RailDatasetListHolder]
+    ]:
+        return ([], [], [])
+
+    def get_extractor_inputs(self) -> dict[str, Any]:
+        return {}
+
+    def _get_data(self, **kwargs: Any) -> dict[str, Any] | None:
+        return dict(truth=np.linspace(0.0, 3.0, 100))
+
+
+class _NoDataHolder(_TruthHolder):
+    """Dataset holder that should never be asked for its data"""
+
+    def _get_data(self, **kwargs: Any) -> dict[str, Any] | None:
+        raise AssertionError("find_only should not read the data")
+
+
 def test_load_yaml() -> None:
     # Load the testing yaml file
     RailPlotterFactory.clear()
@@ -83,3 +119,32 @@ def test_load_yaml() -> None:
 
     check_list = RailPlotterFactory.get_plotter_list("test_list")
     assert a_plotter.config.name in check_list.config.plotters
+
+
+def test_iterate_plot_cache() -> None:
+    plotter = CatPlotterTruth(name="truth_hist")
+    dataset = _TruthHolder(name="truth_data")
+
+    plot_cache: dict = {}
+    out_dict = RailPlotter.iterate([plotter], [dataset], plot_cache=plot_cache)
+    plot = out_dict["truth_data"].plots["truth_hist"]
+    assert plot.figure is not None
+    assert plot_cache[("truth_hist", "truth_data", "")]["truth_hist"] is plot
+
+    out_dict = RailPlotter.iterate([plotter], [dataset], plot_cache=plot_cache)
+    assert out_dict["truth_data"].plots["truth_hist"] is plot
+
+    out_dict = RailPlotter.iterate([plotter], [dataset])
+    assert out_dict["truth_data"].plots["truth_hist"] is not plot
+
+
+def test_iterate_find_only() -> None:
+    plotter = CatPlotterTruth(name="truth_hist")
+    dataset = _NoDataHolder(name="truth_data")
+
+    out_dict = RailPlotter.iterate(
+        [plotter], [dataset], find_only=True, figtype="pdf"
+    )
+    plot = out_dict["truth_data"].plots["truth_hist"]
+    assert plot.figure is None
+    assert plot.path == os.path.join("truth_data", "truth_hist.pdf")
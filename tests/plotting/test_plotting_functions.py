@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from rail.plotting import plotting_functions
+
+
+@pytest.mark.parametrize(
+    "bins",
+    [
+        (np.linspace(0.0, 3.0, 151), np.linspace(18.0, 25.0, 141)),
+        (50, 40),
+        (np.linspace(0.0, 3.0, 151), np.geomspace(18.0, 25.0, 141)),
+    ],
+)
+def test_histogram2d(bins: tuple) -> None:
+    rng = np.random.default_rng(1234)
+    x = rng.uniform(-0.5, 3.5, 10000)
+    y = rng.normal(22.0, 2.0, 10000)
+    # put some values right on the bin edges
+    x[:100] = np.linspace(0.0, 3.0, 151)[rng.integers(0, 151, 100)]
+    y[:100] = np.linspace(18.0, 25.0, 141)[rng.integers(0, 141, 100)]
+
+    counts, xedges, yedges = plotting_functions.histogram2d(x, y, bins=bins)
+    check_counts, check_xedges, check_yedges = np.histogram2d(x, y, bins=bins)
+    assert np.array_equal(counts, check_counts)
+    assert np.array_equal(xedges, check_xedges)
+    assert np.array_equal(yedges, check_yedges)
+
+
+@pytest.mark.parametrize("chunk_size", [262144, 1000])
+def test_feature_target_histograms2d(
+    monkeypatch: pytest.MonkeyPatch, chunk_size: int
+) -> None:
+    monkeypatch.setattr(plotting_functions, "_HIST_CHUNK_SIZE", chunk_size)
+    rng = np.random.default_rng(4321)
+    targets = rng.uniform(0.0, 3.0, 10000)
+    data = rng.normal(22.0, 2.0, (10000, 4))
+    bins = (np.linspace(0.0, 3.0, 151), np.linspace(18.0, 25.0, 141))
+
+    hists = plotting_functions.feature_target_histograms2d(data, targets, bins=bins)
+    assert len(hists) == 4
+    for ifeature, (counts, _xedges, _yedges) in enumerate(hists):
+        check_counts, _, _ = np.histogram2d(targets, data[:, ifeature], bins=bins)
+        assert np.array_equal(counts, check_counts)
+
+
+def test_plot_hist2d() -> None:
+    import matplotlib.pyplot as plt
+
+    rng = np.random.default_rng(2468)
+    x = rng.uniform(0.0, 3.0, 10000)
+    y = rng.uniform(0.0, 3.0, 10000)
+    bin_edges = np.linspace(0.0, 3.0, 151)
+
+    fig, ax = plt.subplots()
+    counts, xedges, yedges, mesh = plotting_functions.plot_hist2d(
+        ax, x, y, bins=(bin_edges, bin_edges), cmap="gray"
+    )
+    check_counts, _, _ = np.histogram2d(x, y, bins=(bin_edges, bin_edges))
+    assert np.array_equal(counts, check_counts)
+    assert np.array_equal(xedges, bin_edges)
+    assert np.array_equal(yedges, bin_edges)
+    assert mesh.get_rasterized()
+    assert ax.get_xlim() == (0.0, 3.0)
+    plt.close(fig)
@@ -0,0 +1,43 @@
+import numpy as np
+
+from rail.plotting import pz_plotters
+
+
+def test_biweight_stats_vs_redshift_by_bin() -> None:
+    # The values are split into redshift bins, check that against masking
+    rng = np.random.default_rng(42)
+    specz = rng.uniform(0.0, 2.2, size=1000)
+    zphot = specz + rng.normal(scale=0.05, size=1000)
+    plotter = pz_plotters.PZPlotterBiweightStatsVsRedshift(name="biweight")
+    stats = plotter.process_data(zphot, specz, nbin=11)
+
+    z_bins = np.linspace(0.01, 2.0, 11)
+    bin_indices = np.digitize(specz, bins=z_bins) - 1
+    dz = (zphot - specz) / (1 + specz)
+    assert len(stats["median"]) == 10
+    for i in range(10):
+        mask = bin_indices == i
+        assert stats["median"][i] == np.percentile(dz[mask], 50.0)
+        assert stats["z_mean"][i] == np.mean(specz[mask])
+
+
+def test_biweight_stats_vs_mag_by_bin() -> None:
+    # The values are split into magnitude bins, check that against masking
+    rng = np.random.default_rng(42)
+    specz = rng.uniform(0.0, 2.2, size=1000)
+    zphot = specz + rng.normal(scale=0.05, size=1000)
+    mag = rng.uniform(17.0, 26.0, size=1000)
+    plotter = pz_plotters.PZPlotterBiweightStatsVsMag(name="biweight_mag")
+    stats = plotter.process_data(zphot, specz, mag, low=18.0, high=25.0, nbin=8)
+
+    mag_bins = np.linspace(18.0, 25.0, 8)
+    bin_indices = np.digitize(mag, bins=mag_bins) - 1
+    dz = (zphot - specz) / (1 + specz)
+    assert len(stats["median"]) == 7
+    for i in range(7):
+        mask = bin_indices == i
+        assert stats["median"][i] == np.percentile(dz[mask], 50.0)
+        assert stats["qt_95_high"][i] == np.percentile(dz[mask], 97.5)
+        outlier_rate = np.sum(np.abs(dz[mask]) > 3 * stats["biweight_sigma"][i])
+        assert stats["biweight_outlier"][i] == outlier_rate / np.sum(mask)
+    assert np.allclose(stats["mag_mean"], (mag_bins[:-1] + mag_bins[1:]) / 2)
@@ -0,0 +1,17 @@
+import numpy as np
+import pytest
+
+from rail.plotting.validation import make_validator
+
+
+def test_make_validator() -> None:
+    validator = make_validator(
+        dict, dict(truth=np.ndarray, pointEstimates=dict[str, np.ndarray])
+    )
+    validator(dict(truth=np.zeros(3), pointEstimates=dict(knn=np.zeros(3))))
+    with pytest.raises(KeyError):
+        validator(dict(truth=np.zeros(3)))
+    with pytest.raises(TypeError):
+        validator(dict(truth=[0.0, 0.0], pointEstimates=dict(knn=np.zeros(3))))
+    with pytest.raises(TypeError):
+        validator(dict(truth=np.zeros(3), pointEstimates=[np.zeros(3)]))
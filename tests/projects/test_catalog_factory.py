@@ -1,4 +1,5 @@
 import os
+from pathlib import Path
 
 import pytest
 
@@ -97,3 +98,17 @@ def test_load_catalog_yaml(setup_project_area: int) -> None:
         "degraded_ci_test_1.1.3_gold_blend"
     )
     assert isinstance(check_catalog_instance, type(the_catalog_instance))
+
+
+def test_catalog_instance_check_files(tmp_path: Path) -> None:
+    catalog_instance = RailProjectCatalogInstance(
+        name="check",
+        path_template=f"{tmp_path}/{{healpix}}/data.parquet",
+        iteration_vars=["healpix"],
+    )
+    catalog_files = catalog_instance.resolve(healpix=list(range(5)))
+    for file_ in catalog_files[::2]:
+        os.makedirs(os.path.dirname(file_))
+        Path(file_).touch()
+
+    assert catalog_instance.check_files() == [True, False, True, False, True]
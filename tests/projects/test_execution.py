@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import pytest
+
+from rail.projects import execution
+
+
+def test_handle_command_dry_run(capsys: pytest.CaptureFixture) -> None:
+    command_line = ["ceci", "pipe.yaml", "config=pipe_config.yml"]
+    status = execution.handle_command(execution.RunMode.dry_run, command_line)
+    assert status == 0
+    assert "\nceci pipe.yaml config=pipe_config.yml\n" in capsys.readouterr().out
+    assert command_line == ["ceci", "pipe.yaml", "config=pipe_config.yml"]
+
+
+def test_default_site_configs() -> None:
+    assert execution.DEFAULT_SITE_CONFIGS["test"] is execution.TEST_SITE_CONFIG
+    with pytest.raises(TypeError):
+        execution.DEFAULT_SITE_CONFIGS["test"] = {}  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "sbatch_output",
+    [
+        "Submitted batch job 12345\n",
+        "12345\n",
+        "12345;perlmutter\nsome other output\n",
+        "12345 sbatch submit.sh\n",
+    ],
+)
+def test_submit_slurm_job(sbatch_output: str, tmp_path: Path) -> None:
+    # Stand in for sbatch with a shell that prints the output in question
+    sbatch_commands = ["sh", "-c", 'printf "%s" "$0"', sbatch_output]
+    job_id = execution.submit_slurm_job(tmp_path / "submit.sh", sbatch_commands)
+    assert job_id == "12345"
+
+    with pytest.raises(RuntimeError):
+        execution.submit_slurm_job(tmp_path / "submit.sh", ["false"])
+
+
+def test_run_array_job(tmp_path: Path) -> None:
+    all_commands = [
+        ([["echo", f"{i}"]], str(tmp_path / f"sink_{i}" / "run.sh")) for i in range(3)
+    ]
+    site_config = dict(execution.TEST_SITE_CONFIG, slurm_array=True)
+    submit_script = tmp_path / "submit.sh"
+
+    status = execution.handle_all_commands(
+        execution.RunMode.slurm,
+        all_commands,
+        str(submit_script),
+        site_config=site_config,
+    )
+    assert status == 0
+
+    for _commands, script_path in all_commands:
+        assert Path(script_path).exists()
+
+    contents = submit_script.read_text()
+    assert "#SBATCH --array=0-2%4\n" in contents
+    assert contents.count("/run.sh\n") == 3
+    assert "${SCRIPTS[$SLURM_ARRAY_TASK_ID]}" in contents
+
+
+def test_run_batches(tmp_path: Path) -> None:
+    all_commands = [
+        ([["echo", f"{i}"]], str(tmp_path / f"sink_{i}" / "run.sh")) for i in range(6)
+    ]
+    submit_script = tmp_path / "submit.sh"
+
+    status = execution.run_batches(
+        all_commands, submit_script, execution.TEST_SITE_CONFIG
+    )
+    assert status == 0
+    assert execution.TEST_SITE_CONFIG["slurm_options"] == ("--dummy=test",)
+
+    for job_idx in range(2):
+        contents = (tmp_path / f"submit_{job_idx}.sh").read_text()
+        assert contents.count("#SBATCH --output=") == 1
+        assert contents.count("#SBATCH --ntasks=4\n") == 1
+        assert f"#SBATCH --output={tmp_path}/submit_{job_idx}.log\n" in contents
+
+
+def test_handle_all_commands_workers() -> None:
+    all_commands = [
+        ([["true"], ["true"]], "run_0.sh"),
+        ([["true"], ["false"]], "run_1.sh"),
+        ([["true"]], "run_2.sh"),
+    ]
+    for max_workers in [1, 2]:
+        status = execution.handle_all_commands(
+            execution.RunMode.bash,
+            all_commands,
+            max_workers=max_workers,
+        )
+        assert status == 1
+
+    status = execution.handle_all_commands(
+        execution.RunMode.bash,
+        [all_commands[0], all_commands[2]],
+        max_workers=2,
+    )
+    assert status == 0
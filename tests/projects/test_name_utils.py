@@ -52,3 +52,13 @@ def test_name_factory() -> None:
     assert simple_factory.interpolants["root"] == "xx"
     del simple_factory.interpolants
     assert simple_factory.interpolants.get("root") is None
+
+
+def test_format_template_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RAIL_TEST_DIR", "/rail_dir")
+    monkeypatch.setenv("OTHER_TEST_DIR", "/other_dir")
+    template = "{RAIL_TEST_DIR}/{OTHER_TEST_DIR}/{PZ_MISSING}/{alice}"
+    assert (
+        name_utils.format_template(template, RAIL_TEST_DIR="x", alice="a")
+        == "/rail_dir/{OTHER_TEST_DIR}/{PZ_MISSING}/a"
+    )
@@ -0,0 +1,123 @@
+import os
+import time
+from pathlib import Path
+
+from rail.projects import path_funcs
+
+
+class _Project:
+    """Stand-in for a RailProject that puts all the ceci outputs in one place"""
+
+    def __init__(self, outdir: Path) -> None:
+        self.outdir = outdir
+
+    def get_path(self, _path_key: str, **_kwargs: str) -> str:
+        return str(self.outdir)
+
+
+def test_list_dir(tmp_path: Path) -> None:
+    path_funcs.clear_cache()
+    project = _Project(tmp_path / "does_not_exist")
+    assert not path_funcs.get_ceci_true_nz_output_paths(
+        project, "gold", "baseline", "knn", "equal_count"  # type: ignore
+    )
+
+    project = _Project(tmp_path)
+    for i in range(3):
+        (tmp_path / f"true_NZ_true_nz_knn_equal_count_bin{i}.hdf5").touch()
+    # Make the directory old enough for the listing to be cached
+    os.utime(tmp_path, ns=(0, 0))
+    nz_paths = path_funcs.get_ceci_true_nz_output_paths(
+        project, "gold", "baseline", "knn", "equal_count"  # type: ignore
+    )
+    assert len(nz_paths) == 3
+
+    # Adding a file should invalidate the cached listing
+    (tmp_path / "true_NZ_true_nz_knn_equal_count_bin3.hdf5").touch()
+    nz_paths = path_funcs.get_ceci_true_nz_output_paths(
+        project, "gold", "baseline", "knn", "equal_count"  # type: ignore
+    )
+    assert len(nz_paths) == 4
+    path_funcs.clear_cache()
+
+
+def test_nz_output_paths_order(tmp_path: Path) -> None:
+    # The bins are in numerical order, so that 'bin10' comes after 'bin2'
+    path_funcs.clear_cache()
+    template = "single_NZ_summarize_knn_equal_count_bin{}_naive_stack.hdf5"
+    for i in [10, 2, 0, 1]:
+        (tmp_path / template.format(i)).touch()
+    nz_paths = path_funcs.get_ceci_nz_output_paths(
+        _Project(tmp_path),  # type: ignore
+        "gold",
+        "baseline",
+        "knn",
+        "equal_count",
+        "naive_stack",
+    )
+    assert nz_paths == [str(tmp_path / template.format(i)) for i in [0, 1, 2, 10]]
+    path_funcs.clear_cache()
+
+
+def test_get_ceci_pz_output_paths(tmp_path: Path) -> None:
+    path_funcs.clear_cache()
+    for algo_ in ["knn", "bpz"]:
+        (tmp_path / f"output_estimate_{algo_}.hdf5").touch()
+
+    project = _Project(tmp_path)
+    paths = path_funcs.get_ceci_pz_output_paths(
+        project, "gold", "baseline", ["knn", "fzboost", "bpz"]  # type: ignore
+    )
+    assert paths == {
+        algo_: os.path.join(tmp_path, f"output_estimate_{algo_}.hdf5")
+        for algo_ in ["knn", "bpz"]
+    }
+
+    # A cached listing that is out of date is read again
+    os.utime(tmp_path, ns=(0, 0))
+    path_funcs.get_ceci_pz_output_paths(
+        project, "gold", "baseline", ["knn"]  # type: ignore
+    )
+    (tmp_path / "output_estimate_fzboost.hdf5").touch()
+    os.utime(tmp_path, ns=(0, 0))
+    paths = path_funcs.get_ceci_pz_output_paths(
+        project, "gold", "baseline", ["knn", "fzboost", "bpz"]  # type: ignore
+    )
+    assert list(paths.keys()) == ["knn", "fzboost", "bpz"]
+    path_funcs.clear_cache()
+
+
+def test_same_tick_changes(tmp_path: Path) -> None:
+    # On file systems with coarse modification times a file can be added
+    # without changing the modification time of the directory
+    path_funcs.clear_cache()
+    project = _Project(tmp_path)
+    nz_template = "single_NZ_summarize_knn_equal_count_bin{}_naive_stack.hdf5"
+
+    (tmp_path / nz_template.format(0)).touch()
+    mtime_ns = time.time_ns()
+    os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+    nz_paths = path_funcs.get_ceci_nz_output_paths(
+        project, "gold", "baseline", "knn", "equal_count", "naive_stack"  # type: ignore
+    )
+    assert len(nz_paths) == 1
+
+    # The directory changed too recently for the listing to be cached
+    (tmp_path / nz_template.format(1)).touch()
+    os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+    nz_paths = path_funcs.get_ceci_nz_output_paths(
+        project, "gold", "baseline", "knn", "equal_count", "naive_stack"  # type: ignore
+    )
+    assert len(nz_paths) == 2
+
+    # Files missing from a cached listing are checked for directly
+    os.utime(tmp_path, ns=(0, 0))
+    assert not path_funcs.get_ceci_pz_output_path(
+        project, "gold", "baseline", "knn"  # type: ignore
+    )
+    (tmp_path / "output_estimate_knn.hdf5").touch()
+    os.utime(tmp_path, ns=(0, 0))
+    assert path_funcs.get_ceci_pz_output_path(
+        project, "gold", "baseline", "knn"  # type: ignore
+    )
+    path_funcs.clear_cache()
@@ -3,6 +3,7 @@ from typing import Any, Callable
 
 import pytest
 
+from rail.projects.pipeline_holder import spectroscopic_selection_convert_commands
 from rail.projects.project import RailProject
 
 
@@ -21,6 +22,43 @@ def test_project_doc() -> None:
     RailProject.configuration_help()
 
 
+def test_generate_kwargs_iterable() -> None:
+    itr = RailProject.generate_kwargs_iterable(flavor=["a", "b"], selection=["x"])
+    assert itr == [dict(flavor="a", selection="x"), dict(flavor="b", selection="x")]
+    assert not RailProject.generate_kwargs_iterable(flavor=["a"], selection=[])
+
+
+def test_spec_selection_convert_commands() -> None:
+    project = RailProject.load_config("tests/ci_project.yaml")
+    pipeline = project.get_pipeline("spec_selection")
+    pipeline_kwargs = pipeline.config.kwargs
+    spec_selections = list(project.get_spec_selections().keys())
+    # Without its own selectors, all the project spec selections are converted
+    pipeline.config.kwargs = {}
+    project.clear_cache()
+    try:
+        ceci_catalog_commands = project.make_pipeline_catalog_commands(
+            pipeline_name="spec_selection",
+            flavor="baseline",
+            selection="gold",
+        )
+    finally:
+        pipeline.config.kwargs = pipeline_kwargs
+        project.clear_cache()
+    assert ceci_catalog_commands
+    for iter_commands_, _script_path in ceci_catalog_commands:
+        outputs = [
+            os.path.basename(command_[-1]) for command_ in iter_commands_[2:]
+        ]
+        assert outputs == [
+            f"output_select_{spec_selection_}.hdf5"
+            for spec_selection_ in spec_selections
+        ]
+
+    with pytest.raises(ValueError, match="spec_selections"):
+        spectroscopic_selection_convert_commands("sink_dir")
+
+
 def test_project_class(setup_project_area: int) -> None:
     assert setup_project_area == 0
 
@@ -69,6 +107,10 @@ def test_project_class(setup_project_area: int) -> None:
     for x_ in itr:
         assert isinstance(x_, dict)
 
+    flavor_selection_kwargs = project.get_flavor_selection_kwargs(["all"], ["all"])
+    assert len(flavor_selection_kwargs) == len(all_flavors) * len(all_selections)
+    assert project.get_flavor_selection_kwargs(["all"], ["all"]) == flavor_selection_kwargs
+
     error_models = project.get_error_models()
     check_get_func(project.get_error_model, error_models)
 
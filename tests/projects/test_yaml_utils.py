@@ -0,0 +1,37 @@
+import os
+import time
+from pathlib import Path
+
+from rail.projects import yaml_utils
+
+
+def test_load_yaml_file(tmp_path: Path) -> None:
+    yaml_file = os.path.join(tmp_path, "test.yaml")
+    with open(yaml_file, "w", encoding="utf-8") as fout:
+        yaml_utils.safe_dump(dict(a=[1, 2], b="b"), fout)
+
+    # Make the file old enough for the parsed data to be cached
+    os.utime(yaml_file, ns=(0, 0))
+    yaml_utils.clear_cache()
+    data = yaml_utils.load_yaml_file(yaml_file)
+    assert data == dict(a=[1, 2], b="b")
+
+    # The cached data should not be affected by changes to the returned copy
+    data["a"].append(3)
+    assert yaml_utils.load_yaml_file(yaml_file) == dict(a=[1, 2], b="b")
+
+    # Changing the file should invalidate the cache
+    with open(yaml_file, "w", encoding="utf-8") as fout:
+        yaml_utils.safe_dump(dict(a=[1, 2, 3, 4]), fout)
+    assert yaml_utils.load_yaml_file(yaml_file) == dict(a=[1, 2, 3, 4])
+
+    # On file systems with coarse modification times an edit in the same tick
+    # can keep the time and size, so recently changed files are not cached
+    mtime_ns = time.time_ns()
+    os.utime(yaml_file, ns=(mtime_ns, mtime_ns))
+    assert yaml_utils.load_yaml_file(yaml_file) == dict(a=[1, 2, 3, 4])
+    with open(yaml_file, "w", encoding="utf-8") as fout:
+        yaml_utils.safe_dump(dict(a=[5, 6, 7, 8]), fout)
+    os.utime(yaml_file, ns=(mtime_ns, mtime_ns))
+    assert yaml_utils.load_yaml_file(yaml_file) == dict(a=[5, 6, 7, 8])
+    yaml_utils.clear_cache()